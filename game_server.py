@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Serveur de parties hébergées (asyncio, TCP)
+Usage: python game_server.py [port]   puis   nc 127.0.0.1 8765
+"""
+
+import asyncio
+import sys
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.server.game_server import DEFAULT_HOST, DEFAULT_PORT, GameServer
+
+
+def main():
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PORT
+    # Le scénario modèle fournit le groupe de départ et les données partagées
+    server = GameServer(ChasseGobelinsScenario(pdf_path="", use_ncurses=False))
+    try:
+        asyncio.run(server.serve_forever(DEFAULT_HOST, port))
+    except KeyboardInterrupt:
+        print("\n👋 Serveur arrêté")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Simulation headless des combats de tous les scénarios JSON
+Vérifie l'équilibrage de chaque scène de combat de data/scenes/*.json
+"""
+
+import argparse
+import json
+import random
+import time
+from pathlib import Path
+from typing import List
+
+from dnd_5e_core import Character
+from src.core.rng import GameRNG
+from src.scenarios.base_scenario import BaseScenario
+from src.systems.combat_simulator import CombatSimulator
+from src.systems.parallel_simulator import ParallelCombatSimulator
+
+
+class EncounterBalanceScenario(BaseScenario):
+    """Scénario minimal servant uniquement à créer le groupe et la factory de monstres"""
+
+    def __init__(self, party_size: int = 4, level: int = 3):
+        super().__init__(pdf_path="", use_ncurses=False)
+        self.party_size = party_size
+        self.level = level
+
+    def get_scenario_name(self) -> str:
+        return "Simulation d'équilibrage"
+
+    def create_party(self) -> List[Character]:
+        """Alterner guerriers (ligne de front) et clercs"""
+        party = []
+        for i in range(self.party_size):
+            if i % 2 == 0:
+                party.append(self.create_basic_fighter(f"Guerrier {i // 2 + 1}", level=self.level))
+            else:
+                party.append(self.create_basic_cleric(f"Clerc {i // 2 + 1}", level=self.level))
+        return party
+
+    def build_custom_scenes(self):
+        pass
+
+
+def load_scenario(json_path: Path):
+    """Charger un scénario JSON et créer le groupe adapté (taille et niveau recommandés)"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        scenario_data = json.load(f)
+
+    scenario = EncounterBalanceScenario(
+        party_size=scenario_data.get('recommended_party_size', 4),
+        level=scenario_data.get('level', 3)
+    )
+    return scenario_data, scenario
+
+
+def print_scenario_header(scenario_data, json_path: Path):
+    print(f"\n{'=' * 70}")
+    print(f"📖 {scenario_data.get('name', json_path.stem)} ({json_path.name})")
+    print('=' * 70)
+
+
+def simulate_file_vectorized(scenario_data, scenario, trials: int, seed=None):
+    """Simuler les scènes de combat avec le backend NumPy (pip install numpy)"""
+    from src.scenes.scene_factory import SceneFactory
+    from src.systems.vectorized_combat import VectorizedCombat
+
+    party = scenario.create_party()
+    game_context = {'monster_factory': scenario.monster_factory}
+    results = {}
+    for scene_data in scenario_data.get('scenes', []):
+        if scene_data.get('type') != 'combat':
+            continue
+        scene = SceneFactory.create_scene_from_dict(scene_data, scenario.monster_factory)
+        monsters = scene.enemies_factory(game_context)
+        results[scene.scene_id] = VectorizedCombat.simulate(party, monsters, trials, seed=seed)
+    return results
+
+
+def analyze_file(json_path: Path):
+    """Évaluer analytiquement les scènes de combat d'un fichier (sans simulation)"""
+    from src.scenes.scene_factory import SceneFactory
+    from src.systems.combat_analysis import analyze_encounter
+
+    scenario_data, scenario = load_scenario(json_path)
+    print_scenario_header(scenario_data, json_path)
+
+    party = scenario.create_party()
+    game_context = {'monster_factory': scenario.monster_factory}
+    start = time.perf_counter()
+    for scene_data in scenario_data.get('scenes', []):
+        if scene_data.get('type') != 'combat':
+            continue
+        scene = SceneFactory.create_scene_from_dict(scene_data, scenario.monster_factory)
+        print(f"\n⚔️  {scene.scene_id}")
+        print(analyze_encounter(party, scene.enemies_factory(game_context)).summary())
+    print(f"\n⏱️  Analyse en {time.perf_counter() - start:.3f}s")
+
+
+def simulate_file(json_path: Path, trials: int, vectorized: bool = False, seed=None):
+    """Simuler toutes les scènes de combat d'un fichier"""
+    scenario_data, scenario = load_scenario(json_path)
+
+    print_scenario_header(scenario_data, json_path)
+
+    start = time.perf_counter()
+    if vectorized:
+        results = simulate_file_vectorized(scenario_data, scenario, trials, seed)
+    else:
+        if seed is not None:
+            # Le module random reste utilisé par les monstres de dnd_5e_core
+            random.seed(seed)
+        simulator = CombatSimulator(scenario.create_party(), scenario.monster_factory, rng=GameRNG(seed))
+        results = simulator.simulate_scenario_file(str(json_path), trials)
+    elapsed = time.perf_counter() - start
+
+    for scene_id, stats in results.items():
+        print(f"\n⚔️  {scene_id}")
+        print(stats.summary())
+
+    total = sum(stats.trials for stats in results.values())
+    if total:
+        print(f"\n⏱️  {total} combats en {elapsed:.2f}s ({elapsed / total * 1e6:.0f} µs/combat)")
+
+
+def simulate_files_parallel(paths: List[Path], trials: int, workers: int, seed=None):
+    """Simuler toutes les scènes de combat de tous les fichiers sur plusieurs processus"""
+    jobs = []
+    scenarios = {}
+    for json_path in paths:
+        scenario_data, scenario = load_scenario(json_path)
+        scenarios[json_path] = scenario_data
+        party = scenario.create_party()
+        for scene_data in scenario_data.get('scenes', []):
+            if scene_data.get('type') == 'combat':
+                jobs.append(((json_path, scene_data.get('id')), party, scene_data))
+
+    simulator = ParallelCombatSimulator(max_workers=workers or None, seed=seed)
+
+    start = time.perf_counter()
+    results = simulator.simulate_many(jobs, trials)
+    elapsed = time.perf_counter() - start
+
+    for json_path, scenario_data in scenarios.items():
+        print_scenario_header(scenario_data, json_path)
+        for (path, scene_id), stats in results.items():
+            if path == json_path:
+                print(f"\n⚔️  {scene_id}")
+                print(stats.summary())
+
+    total = sum(stats.trials for stats in results.values())
+    if total:
+        print(f"\n⏱️  {total} combats en {elapsed:.2f}s sur {simulator.max_workers} processus "
+              f"({elapsed / total * 1e6:.0f} µs/combat)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulation headless des combats")
+    parser.add_argument('scenarios', nargs='*',
+                        help="Fichiers JSON ou IDs de scénario (défaut: tous les data/scenes/*.json)")
+    parser.add_argument('--trials', type=int, default=1000, help="Nombre de combats par scène")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Nombre de processus (0 = tous les cœurs, 1 = séquentiel)")
+    parser.add_argument('--seed', type=int, default=None, help="Graine pour des résultats reproductibles")
+    parser.add_argument('--vectorized', action='store_true',
+                        help="Backend NumPy vectorisé (sans sorts ni potions, nécessite numpy)")
+    parser.add_argument('--analytic', action='store_true',
+                        help="Calcul exact des dommages moyens et rounds pour tuer (aucune simulation)")
+    args = parser.parse_args()
+
+    if args.scenarios:
+        paths = [Path(s) if s.endswith('.json') else Path(f"data/scenes/{s}.json") for s in args.scenarios]
+    else:
+        paths = sorted(Path("data/scenes").glob("*.json"))
+
+    missing = [path for path in paths if not path.exists()]
+    for path in missing:
+        print(f"❌ Fichier non trouvé: {path}")
+    paths = [path for path in paths if path.exists()]
+
+    if args.analytic:
+        for path in paths:
+            analyze_file(path)
+        return
+
+    if args.workers != 1 and not args.vectorized:
+        simulate_files_parallel(paths, args.trials, args.workers, args.seed)
+        return
+
+    for path in paths:
+        simulate_file(path, args.trials, args.vectorized, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,10 @@ Core entities and base classes
 
 from .entities import GameCharacter, GameMonster, Item, Weapon, Armor, Potion
 from .inventory import Inventory
+from .rng import GameRNG, get_rng
+from .dice import DiceExpression, parse_dice, roll_dice
+from .derived_stats import DerivedStats, derived_stats, invalidate_derived_stats
+from .timer_wheel import Timer, TimerWheel
 
 __all__ = [
     'GameCharacter',
@@ -12,6 +16,16 @@ __all__ = [
     'Weapon',
     'Armor',
     'Potion',
-    'Inventory'
+    'Inventory',
+    'GameRNG',
+    'get_rng',
+    'DiceExpression',
+    'parse_dice',
+    'roll_dice',
+    'DerivedStats',
+    'derived_stats',
+    'invalidate_derived_stats',
+    'Timer',
+    'TimerWheel'
 ]
 
@@ -8,6 +8,10 @@ from dnd_5e_core import Character, Monster
 from dnd_5e_core.equipment import Weapon, Armor, Equipment
 from dnd_5e_core.spells import Spell
 
+from .derived_stats import invalidate_derived_stats
+from .dice import parse_dice
+from .rng import GameRNG, default_rng
+
 
 class CharacterExtensions:
     """
@@ -39,6 +43,7 @@ class CharacterExtensions:
         character.equipped_weapon = weapon
         if weapon in character.inventory_items:
             character.inventory_items.remove(weapon)
+        invalidate_derived_stats(character)
 
     @staticmethod
     def equip_armor(character: Character, armor: Armor):
@@ -58,6 +63,7 @@ class CharacterExtensions:
             character._custom_armor_class = armor.armor_class.base
         else:
             character._custom_armor_class = armor.armor_class
+        invalidate_derived_stats(character)
 
     @staticmethod
     def get_armor_class(character: Character) -> int:
@@ -118,6 +124,13 @@ class CharacterExtensions:
         character.hit_points = character.max_hit_points
         character.spell_slots_current = CharacterExtensions.init_spell_slots(character)
 
+    @staticmethod
+    def rest_short(character: Character, rng: Optional[GameRNG] = None):
+        """Repos court - un dé de vie + modificateur de CON (1 HP minimum)"""
+        rng = rng or default_rng
+        heal = rng.roll_die(character.class_type.hit_die) + character.abilities.con // 2 - 5
+        character.hit_points = min(character.hit_points + max(1, heal), character.max_hit_points)
+
 
 class Potion:
     """
@@ -134,19 +147,9 @@ class Potion:
         self.effect_type = effect_type  # healing, mana, buff, etc.
         self.effect_value = effect_value  # "2d4+2"
 
-    def use(self) -> int:
+    def use(self, rng: Optional[GameRNG] = None) -> int:
         """Utiliser la potion et retourner valeur effet"""
-        import random
-
-        if '+' in self.effect_value:
-            dice, bonus = self.effect_value.split('+')
-            num, sides = map(int, dice.split('d'))
-            return sum(random.randint(1, sides) for _ in range(num)) + int(bonus)
-        elif 'd' in self.effect_value:
-            num, sides = map(int, self.effect_value.split('d'))
-            return sum(random.randint(1, sides) for _ in range(num))
-        else:
-            return int(self.effect_value)
+        return parse_dice(self.effect_value).roll(rng)
 
     def __str__(self):
         return f"{self.name} ({self.value} po)"
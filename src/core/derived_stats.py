@@ -0,0 +1,74 @@
+"""
+Statistiques dérivées des personnages (modificateurs, bonus d'attaque, dés de dommages)
+Calculées une fois puis mises en cache sur le personnage; le cache est invalidé
+par les changements d'équipement (CharacterExtensions.equip_weapon/equip_armor)
+et de niveau (LevelUpManager.level_up)
+"""
+
+from typing import NamedTuple
+
+from .dice import DiceExpression, parse_dice
+
+# Attribut du personnage portant le cache
+CACHE_ATTRIBUTE = '_derived_stats'
+
+# Arme type par classe: (dés de dommages, caractéristique des dommages)
+CLASS_WEAPONS = (
+    ('fighter', "1d8", 'str'),   # Épée longue
+    ('paladin', "1d8", 'str'),
+    ('rogue', "1d6", 'dex'),     # Épée courte/arc
+    ('ranger', "1d6", 'dex'),
+    ('cleric', "1d6", 'str'),    # Masse d'armes
+    ('wizard', "1d4", 'dex'),    # Dague
+    ('sorcerer', "1d4", 'dex'),
+)
+DEFAULT_WEAPON = ("1d8", 'str')  # Épée longue
+
+
+class DerivedStats(NamedTuple):
+    """Statistiques de combat d'un personnage (valeurs D&D 5e simplifiées d'EnhancedCombatSystem)"""
+    str_mod: int
+    dex_mod: int
+    proficiency_bonus: int
+    attack_bonus: int
+    damage_dice: str
+    damage: DiceExpression
+    damage_modifier: int
+
+
+def compute_derived_stats(character) -> DerivedStats:
+    """Calculer les statistiques dérivées (sans cache)"""
+    str_mod = (character.abilities.str - 10) // 2
+    dex_mod = (character.abilities.dex - 10) // 2
+    proficiency_bonus = character.level // 4 + 2
+
+    class_type = getattr(character, 'class_type', None)
+    class_name = class_type.index.lower() if class_type is not None else ''
+
+    # Jet d'attaque: DEX pour les roublards, FOR sinon
+    attack_bonus = (dex_mod if 'rogue' in class_name else str_mod) + proficiency_bonus
+
+    damage_dice, ability = DEFAULT_WEAPON
+    for name, dice, weapon_ability in CLASS_WEAPONS:
+        if name in class_name:
+            damage_dice, ability = dice, weapon_ability
+            break
+    damage_modifier = dex_mod if ability == 'dex' else str_mod
+
+    return DerivedStats(str_mod, dex_mod, proficiency_bonus, attack_bonus,
+                        damage_dice, parse_dice(damage_dice), damage_modifier)
+
+
+def derived_stats(character) -> DerivedStats:
+    """Statistiques dérivées du personnage (calculées au premier accès)"""
+    stats = getattr(character, CACHE_ATTRIBUTE, None)
+    if stats is None:
+        stats = compute_derived_stats(character)
+        setattr(character, CACHE_ATTRIBUTE, stats)
+    return stats
+
+
+def invalidate_derived_stats(character):
+    """Oublier les statistiques dérivées (équipement, niveau ou caractéristiques modifiés)"""
+    if getattr(character, CACHE_ATTRIBUTE, None) is not None:
+        setattr(character, CACHE_ATTRIBUTE, None)
@@ -0,0 +1,138 @@
+"""
+Moteur d'expressions de dés compilées
+Chaque expression ("2d4+2", "1d8+3", "4d6", "d20") est analysée une seule fois
+puis mise en cache: les jets ne font plus aucun traitement de chaîne
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from .rng import GameRNG, default_rng
+
+
+_TERM_PATTERN = re.compile(r'([+-]?)(\d*)(?:d(\d+))?')
+
+
+class DiceExpression:
+    """
+    Expression de dés compilée (immuable, partagée via parse_dice)
+    terms = ((nombre de dés, faces), ...) ; nombre négatif = dés soustraits
+    """
+
+    __slots__ = ('expression', 'terms', 'bonus', '_single')
+
+    def __init__(self, expression: str, terms: Tuple[Tuple[int, int], ...], bonus: int):
+        self.expression = expression
+        self.terms = terms
+        self.bonus = bonus
+        # Cas le plus courant (un seul groupe de dés positif): chemin rapide
+        self._single = terms[0] if len(terms) == 1 and terms[0][0] > 0 else None
+
+    def __repr__(self):
+        return f"DiceExpression({self.expression!r})"
+
+    def __str__(self):
+        return self.expression
+
+    # Statistiques
+
+    @property
+    def minimum(self) -> int:
+        return self.bonus + sum(count if count > 0 else count * sides for count, sides in self.terms)
+
+    @property
+    def maximum(self) -> int:
+        return self.bonus + sum(count * sides if count > 0 else count for count, sides in self.terms)
+
+    @property
+    def mean(self) -> float:
+        return self.bonus + sum(count * (sides + 1) / 2 for count, sides in self.terms)
+
+    @property
+    def dice_count(self) -> int:
+        """Nombre total de dés lancés"""
+        return sum(abs(count) for count, _ in self.terms)
+
+    # Jets
+
+    def _roll_once(self, rng: GameRNG, critical: bool) -> int:
+        if self._single is not None:
+            count, sides = self._single
+            return rng.roll_dice(count * 2 if critical else count, sides) + self.bonus
+
+        total = self.bonus
+        for count, sides in self.terms:
+            dice = abs(count) * 2 if critical else abs(count)
+            rolled = rng.roll_dice(dice, sides)
+            total += rolled if count > 0 else -rolled
+        return total
+
+    def roll(self, rng: Optional[GameRNG] = None, critical: bool = False,
+             advantage: bool = False, disadvantage: bool = False) -> int:
+        """
+        Lancer l'expression
+
+        Args:
+            rng: Générateur de la session (défaut: générateur global)
+            critical: Coup critique - les dés sont doublés, pas le bonus
+            advantage: Lancer deux fois et garder le meilleur
+            disadvantage: Lancer deux fois et garder le pire (annule l'avantage)
+        """
+        rng = rng or default_rng
+        result = self._roll_once(rng, critical)
+        if advantage != disadvantage:
+            second = self._roll_once(rng, critical)
+            result = max(result, second) if advantage else min(result, second)
+        return result
+
+    def roll_many(self, n: int, rng: Optional[GameRNG] = None, critical: bool = False) -> List[int]:
+        """Lancer l'expression `n` fois (dés générés en bloc)"""
+        rng = rng or default_rng
+        results = [self.bonus] * n
+        for count, sides in self.terms:
+            dice = abs(count) * 2 if critical else abs(count)
+            if dice == 0:
+                continue
+            rolls = rng.rolls(sides, n * dice)
+            sign = 1 if count > 0 else -1
+            for i in range(n):
+                results[i] += sign * sum(rolls[i * dice:(i + 1) * dice])
+        return results
+
+
+@lru_cache(maxsize=None)
+def parse_dice(expression: str) -> DiceExpression:
+    """
+    Compiler une expression de dés (résultat interné: une seule analyse par chaîne)
+
+    Raises:
+        ValueError: Expression invalide
+    """
+    text = expression.replace(' ', '').lower()
+    if not text:
+        raise ValueError(f"Expression de dés vide: {expression!r}")
+
+    terms = []
+    bonus = 0
+    position = 0
+    while position < len(text):
+        match = _TERM_PATTERN.match(text, position)
+        if not match or match.end() == position or (position and not match.group(1)):
+            raise ValueError(f"Expression de dés invalide: {expression!r}")
+        sign, number, sides = match.groups()
+        factor = -1 if sign == '-' else 1
+        if sides is not None:
+            terms.append((factor * int(number or 1), int(sides)))
+        elif number:
+            bonus += factor * int(number)
+        else:
+            raise ValueError(f"Expression de dés invalide: {expression!r}")
+        position = match.end()
+
+    return DiceExpression(expression, tuple(terms), bonus)
+
+
+def roll_dice(expression: str, rng: Optional[GameRNG] = None, critical: bool = False) -> int:
+    """Raccourci: compiler (depuis le cache) puis lancer"""
+    return parse_dice(expression).roll(rng, critical)
@@ -0,0 +1,152 @@
+"""
+Distributions de probabilité exactes des expressions de dés
+Calcul analytique par convolution (aucun tirage aléatoire)
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+from .dice import parse_dice
+
+
+class Distribution:
+    """
+    Distribution discrète sur des entiers consécutifs
+    probabilities[i] = P(X = offset + i)
+    """
+
+    __slots__ = ('offset', 'probabilities')
+
+    def __init__(self, offset: int, probabilities: Iterable[float]):
+        self.offset = offset
+        self.probabilities = tuple(probabilities)
+
+    def __repr__(self):
+        return f"Distribution({self.minimum}..{self.maximum}, moyenne={self.mean:.2f})"
+
+    @classmethod
+    def constant(cls, value: int) -> 'Distribution':
+        return cls(value, (1.0,))
+
+    @classmethod
+    def die(cls, sides: int) -> 'Distribution':
+        """Dé équilibré à `sides` faces"""
+        return cls(1, [1.0 / sides] * sides)
+
+    @classmethod
+    def mixture(cls, weighted: Iterable[Tuple[float, 'Distribution']]) -> 'Distribution':
+        """Mélange pondéré: sum(poids * distribution)"""
+        weighted = [(w, d) for w, d in weighted if w > 0]
+        if not weighted:
+            return cls.constant(0)
+        low = min(d.offset for _, d in weighted)
+        high = max(d.maximum for _, d in weighted)
+        probabilities = [0.0] * (high - low + 1)
+        for weight, dist in weighted:
+            start = dist.offset - low
+            for i, p in enumerate(dist.probabilities):
+                probabilities[start + i] += weight * p
+        return cls(low, probabilities)
+
+    # Statistiques
+
+    @property
+    def minimum(self) -> int:
+        return self.offset
+
+    @property
+    def maximum(self) -> int:
+        return self.offset + len(self.probabilities) - 1
+
+    @property
+    def mean(self) -> float:
+        return sum((self.offset + i) * p for i, p in enumerate(self.probabilities))
+
+    @property
+    def variance(self) -> float:
+        mean = self.mean
+        return sum((self.offset + i - mean) ** 2 * p for i, p in enumerate(self.probabilities))
+
+    def probability(self, value: int) -> float:
+        """P(X = value)"""
+        index = value - self.offset
+        if 0 <= index < len(self.probabilities):
+            return self.probabilities[index]
+        return 0.0
+
+    def at_least(self, value: int) -> float:
+        """P(X >= value)"""
+        index = max(0, value - self.offset)
+        return sum(self.probabilities[index:])
+
+    def items(self) -> List[Tuple[int, float]]:
+        return [(self.offset + i, p) for i, p in enumerate(self.probabilities)]
+
+    def to_dict(self) -> Dict[int, float]:
+        return dict(self.items())
+
+    # Opérations
+
+    def __add__(self, other: 'Distribution') -> 'Distribution':
+        """Somme de deux variables indépendantes (convolution)"""
+        if not isinstance(other, Distribution):
+            return self.shift(other)
+        result = [0.0] * (len(self.probabilities) + len(other.probabilities) - 1)
+        for i, p in enumerate(self.probabilities):
+            if p:
+                for j, q in enumerate(other.probabilities):
+                    result[i + j] += p * q
+        return Distribution(self.offset + other.offset, result)
+
+    __radd__ = __add__
+
+    def shift(self, value: int) -> 'Distribution':
+        return Distribution(self.offset + value, self.probabilities)
+
+    def negate(self) -> 'Distribution':
+        return Distribution(-self.maximum, reversed(self.probabilities))
+
+    def scale(self, factor: int) -> 'Distribution':
+        """Distribution de factor * X (factor >= 1)"""
+        probabilities = [0.0] * ((len(self.probabilities) - 1) * factor + 1)
+        probabilities[::factor] = self.probabilities
+        return Distribution(self.offset * factor, probabilities)
+
+    def repeat(self, count: int) -> 'Distribution':
+        """Somme de `count` tirages indépendants (exponentiation rapide)"""
+        result = Distribution.constant(0)
+        base = self
+        while count > 0:
+            if count & 1:
+                result = result + base
+            count >>= 1
+            if count:
+                base = base + base
+        return result
+
+    def clamp_min(self, minimum: int) -> 'Distribution':
+        """Distribution de max(minimum, X)"""
+        if self.offset >= minimum:
+            return self
+        if self.maximum <= minimum:
+            return Distribution.constant(minimum)
+        cut = minimum - self.offset
+        return Distribution(minimum, (sum(self.probabilities[:cut + 1]),) + self.probabilities[cut + 1:])
+
+
+@lru_cache(maxsize=None)
+def dice_distribution(expression: str, bonus: int = 0, critical: bool = False) -> Distribution:
+    """
+    Distribution exacte d'une expression de dés (mise en cache)
+
+    Args:
+        expression: Expression de dés ("2d6+3")
+        bonus: Bonus fixe supplémentaire (modificateur d'aptitude...)
+        critical: Coup critique - dés doublés, bonus compté une fois
+    """
+    dice = parse_dice(expression)
+    result = Distribution.constant(dice.bonus + bonus)
+    for count, sides in dice.terms:
+        rolled = Distribution.die(sides).repeat(abs(count) * (2 if critical else 1))
+        result = result + (rolled if count > 0 else rolled.negate())
+    return result
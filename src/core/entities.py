@@ -8,6 +8,9 @@ from dataclasses import dataclass, field
 from dnd_5e_core import Character, Monster
 from dnd_5e_core.equipment import Weapon as DndWeapon, Armor as DndArmor
 
+from .dice import parse_dice
+from .rng import GameRNG, default_rng
+
 
 class Item:
     """Base class for all items"""
@@ -78,18 +81,9 @@ class Potion(Item):
         self.effect_type = effect_type
         self.effect_value = effect_value
 
-    def use(self) -> int:
+    def use(self, rng: Optional[GameRNG] = None) -> int:
         """Use the potion and return effect value"""
-        import random
-        if '+' in self.effect_value:
-            dice, bonus = self.effect_value.split('+')
-            num, sides = map(int, dice.split('d'))
-            return sum(random.randint(1, int(sides)) for _ in range(int(num))) + int(bonus)
-        elif 'd' in self.effect_value:
-            num, sides = map(int, self.effect_value.split('d'))
-            return sum(random.randint(1, int(sides)) for _ in range(int(num)))
-        else:
-            return int(self.effect_value)
+        return parse_dice(self.effect_value).roll(rng)
 
 
 class GameCharacter(Character):
@@ -151,10 +145,10 @@ class GameCharacter(Character):
             return True
         return False
 
-    def use_potion(self, potion: Potion) -> int:
+    def use_potion(self, potion: Potion, rng: Optional[GameRNG] = None) -> int:
         """Use a potion from inventory"""
         if potion in self.inventory_items:
-            effect = potion.use()
+            effect = potion.use(rng)
             self.remove_item(potion)
 
             # Apply effect
@@ -182,11 +176,11 @@ class GameCharacter(Character):
         self.hit_points = self.max_hit_points
         self.spell_slots_current = self._init_spell_slots()
 
-    def rest_short(self):
+    def rest_short(self, rng: Optional[GameRNG] = None):
         """Short rest - restore some HP"""
         # Restore 1 hit die worth of HP
-        import random
-        heal = random.randint(1, self.class_type.hit_die) + self.abilities.con // 2 - 5
+        rng = rng or default_rng
+        heal = rng.roll_die(self.class_type.hit_die) + self.abilities.con // 2 - 5
         self.hit_points = min(self.hit_points + max(1, heal), self.max_hit_points)
 
     def get_attack_bonus(self) -> int:
@@ -228,9 +222,9 @@ class GameMonster(Monster):
         self.loot_table: List[Item] = kwargs.pop('loot_table', [])
         super().__init__(*args, **kwargs)
 
-    def get_loot(self) -> List[Item]:
+    def get_loot(self, rng: Optional[GameRNG] = None) -> List[Item]:
         """Get loot drops when defeated"""
-        import random
+        rng = rng or default_rng
         # 50% chance to drop each item
-        return [item for item in self.loot_table if random.random() > 0.5]
+        return [item for item in self.loot_table if rng.random() > 0.5]
 
@@ -0,0 +1,103 @@
+"""
+Service de nombres aléatoires injectable
+Une instance par session (transportée dans game_context['rng']), graine
+reproductible, sous-flux indépendants et pré-génération des jets de dés
+"""
+
+import hashlib
+import random
+from typing import Dict, Hashable, List, Optional, Sequence
+
+
+class GameRNG:
+    """
+    Générateur aléatoire d'une session de jeu ou de simulation
+    Remplace les appels directs au module random (état global partagé)
+    """
+
+    def __init__(self, seed: Optional[int] = None, buffer_size: int = 1024):
+        """
+        Args:
+            seed: Graine (None = aléatoire)
+            buffer_size: Nombre de jets pré-générés par type de dé
+        """
+        self.seed = seed
+        self.buffer_size = buffer_size
+        self._random = random.Random(seed)
+        # Jets pré-générés par nombre de faces (faces -> jets, faces -> position)
+        self._buffers: Dict[int, List[int]] = {}
+        self._positions: Dict[int, int] = {}
+
+    def spawn(self, key: Hashable) -> 'GameRNG':
+        """
+        Créer un sous-flux indépendant et reproductible
+        Même graine + même clé => même sous-flux (ex: un par worker ou par combat)
+        """
+        if self.seed is None:
+            child_seed = self._random.getrandbits(64)
+        else:
+            digest = hashlib.sha256(f"{self.seed}:{key}".encode('utf-8')).digest()
+            child_seed = int.from_bytes(digest[:8], 'big')
+        return GameRNG(child_seed, self.buffer_size)
+
+    def reseed(self, seed: Optional[int]):
+        """Réinitialiser le générateur (vide les jets pré-générés)"""
+        self.seed = seed
+        self._random.seed(seed)
+        self._buffers.clear()
+        self._positions.clear()
+
+    # Jets de dés (pré-générés en bloc)
+
+    def rolls(self, sides: int, count: int) -> List[int]:
+        """Générer `count` jets d'un dé à `sides` faces en un seul appel"""
+        return self._random.choices(range(1, sides + 1), k=count)
+
+    def roll_die(self, sides: int) -> int:
+        """Lancer un dé à `sides` faces (servi depuis le tampon pré-généré)"""
+        position = self._positions.get(sides, self.buffer_size)
+        if position >= self.buffer_size:
+            self._buffers[sides] = self.rolls(sides, self.buffer_size)
+            position = 0
+        self._positions[sides] = position + 1
+        return self._buffers[sides][position]
+
+    def roll_dice(self, count: int, sides: int) -> int:
+        """Somme de `count` dés à `sides` faces"""
+        return sum(self.roll_die(sides) for _ in range(count))
+
+    def d20(self) -> int:
+        return self.roll_die(20)
+
+    # Interface compatible avec le module random
+
+    def randint(self, a: int, b: int) -> int:
+        if a == 1:
+            return self.roll_die(b)
+        return self._random.randint(a, b)
+
+    def random(self) -> float:
+        return self._random.random()
+
+    def choice(self, seq: Sequence):
+        return self._random.choice(seq)
+
+    def sample(self, population: Sequence, k: int) -> List:
+        return self._random.sample(population, k)
+
+    def shuffle(self, seq: List):
+        self._random.shuffle(seq)
+
+    def getrandbits(self, k: int) -> int:
+        return self._random.getrandbits(k)
+
+
+# Générateur par défaut quand aucun n'est injecté
+default_rng = GameRNG()
+
+
+def get_rng(game_context: Optional[Dict] = None) -> GameRNG:
+    """Obtenir le générateur de la session (ou celui par défaut)"""
+    if game_context and game_context.get('rng') is not None:
+        return game_context['rng']
+    return default_rng
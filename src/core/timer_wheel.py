@@ -0,0 +1,94 @@
+"""
+Roue temporelle hiérarchique (hierarchical timing wheel)
+Les échéances sont rangées dans des niveaux de SLOTS cases (1 tick, SLOTS ticks,
+SLOTS² ticks, ...); une case de niveau supérieur est redistribuée vers le bas
+quand l'horloge l'atteint. Avancer d'un tick coûte O(échéances expirées),
+amorti, quel que soit le nombre de minuteurs en attente
+"""
+
+from typing import Any, List
+
+
+class Timer:
+    """Minuteur planifié (annulable)"""
+
+    __slots__ = ('deadline', 'item', 'cancelled')
+
+    def __init__(self, deadline: int, item: Any):
+        self.deadline = deadline
+        self.item = item
+        self.cancelled = False
+
+    def __repr__(self):
+        return f"Timer({self.item!r} @ {self.deadline}{', annulé' if self.cancelled else ''})"
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class TimerWheel:
+    """Minuteurs en ticks entiers (rounds de combat pour le moteur de conditions)"""
+
+    def __init__(self, slots: int = 64, levels: int = 4):
+        self.slots = slots
+        self.levels = levels
+        self.now = 0
+        self._wheels: List[List[List[Timer]]] = [[[] for _ in range(slots)] for _ in range(levels)]
+        self._spans = [slots ** level for level in range(levels + 1)]
+        # Échéances au-delà de l'horizon de la roue (replacées à chaque tour du dernier niveau)
+        self._overflow: List[Timer] = []
+        self._pending = 0
+
+    def __len__(self) -> int:
+        """Minuteurs en attente (annulés compris, retirés à leur échéance)"""
+        return self._pending
+
+    def schedule(self, delay: int, item: Any) -> Timer:
+        """Planifier `item` dans `delay` ticks (au moins 1)"""
+        timer = Timer(self.now + max(1, int(delay)), item)
+        self._place(timer)
+        self._pending += 1
+        return timer
+
+    def _place(self, timer: Timer):
+        delta = timer.deadline - self.now
+        spans = self._spans
+        for level in range(self.levels):
+            if delta < spans[level + 1]:
+                self._wheels[level][(timer.deadline // spans[level]) % self.slots].append(timer)
+                return
+        self._overflow.append(timer)
+
+    def _cascade(self, level: int):
+        """Redistribuer la case courante d'un niveau vers les niveaux inférieurs"""
+        bucket = self._wheels[level]
+        index = (self.now // self._spans[level]) % self.slots
+        timers, bucket[index] = bucket[index], []
+        for timer in timers:
+            self._place(timer)
+
+    def tick(self) -> List[Any]:
+        """Avancer d'un tick; retourne les éléments arrivés à échéance (non annulés)"""
+        self.now += 1
+        now = self.now
+        spans = self._spans
+
+        if self._overflow and now % spans[self.levels - 1] == 0:
+            overflow, self._overflow = self._overflow, []
+            for timer in overflow:
+                self._place(timer)
+        for level in range(self.levels - 1, 0, -1):
+            if now % spans[level] == 0:
+                self._cascade(level)
+
+        wheel = self._wheels[0]
+        timers, wheel[now % self.slots] = wheel[now % self.slots], []
+        self._pending -= len(timers)
+        return [timer.item for timer in timers if not timer.cancelled]
+
+    def advance(self, ticks: int = 1) -> List[Any]:
+        """Avancer de `ticks` ticks; retourne les éléments expirés dans l'ordre des échéances"""
+        expired = []
+        for _ in range(ticks):
+            expired.extend(self.tick())
+        return expired
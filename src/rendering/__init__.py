@@ -2,7 +2,9 @@
 Rendering module for game output
 """
 
-from .renderer import Renderer, ConsoleRenderer, create_renderer
-
-__all__ = ['Renderer', 'ConsoleRenderer', 'create_renderer']
+from .renderer import (
+    Renderer, ConsoleRenderer, ScriptedRenderer, ScriptExhausted, SessionRenderer, create_renderer
+)
 
+__all__ = ['Renderer', 'ConsoleRenderer', 'ScriptedRenderer', 'ScriptExhausted', 'SessionRenderer',
+           'create_renderer']
@@ -4,9 +4,11 @@ Permet de changer facilement le mode d'affichage (console, ncurses, etc.)
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Callable, List, Optional, Sequence, Union
 import time
 
+from ..core.rng import GameRNG
+
 
 class Renderer(ABC):
     """Interface abstraite pour renderers"""
@@ -21,6 +23,11 @@ class Renderer(ABC):
         """Afficher texte avec effet"""
         pass
 
+    @abstractmethod
+    def message(self, text: str = ""):
+        """Afficher une ligne de jeu (résultats, récompenses, état du groupe)"""
+        pass
+
     @abstractmethod
     def wait_for_input(self, prompt: str = "\n[Appuyez sur ENTRÉE pour continuer]"):
         """Attendre entrée utilisateur"""
@@ -36,6 +43,24 @@ class Renderer(ABC):
         """Afficher une map"""
         pass
 
+    @abstractmethod
+    def ask_text(self, prompt: str, default: str = "") -> str:
+        """Saisie libre (nom de sauvegarde, ...); `default` si vide"""
+        pass
+
+    @abstractmethod
+    def confirm(self, question: str) -> bool:
+        """Question oui/non"""
+        pass
+
+    @abstractmethod
+    def pause(self, seconds: float):
+        """Pause dramatique (repos, transitions)"""
+        pass
+
+    # Les scènes ne proposent de sauvegarder que si le renderer l'autorise
+    allow_save = True
+
 
 class ConsoleRenderer(Renderer):
     """
@@ -56,6 +81,10 @@ class ConsoleRenderer(Renderer):
             time.sleep(delay)
         print()
 
+    def message(self, text: str = ""):
+        """Ligne affichée immédiatement"""
+        print(text)
+
     def wait_for_input(self, prompt: str = "\n[Appuyez sur ENTRÉE pour continuer]"):
         """Pause"""
         input(prompt)
@@ -85,6 +114,133 @@ class ConsoleRenderer(Renderer):
             print(f"\n📍 Position: {player_pos}")
         print("─" * 70 + "\n")
 
+    def ask_text(self, prompt: str, default: str = "") -> str:
+        """Saisie libre"""
+        return input(prompt).strip() or default
+
+    def confirm(self, question: str) -> bool:
+        """Question oui/non"""
+        return input(question).strip().lower() in ['o', 'oui', 'y', 'yes']
+
+    def pause(self, seconds: float):
+        """Pause"""
+        time.sleep(seconds)
+
+
+class ScriptExhausted(RuntimeError):
+    """Plus aucun choix scripté disponible (ou limite de choix atteinte)"""
+
+
+# Politique de choix: liste d'indices/libellés, 'random', ou fonction (options) -> indice
+ChoicePolicy = Union[Sequence[Union[int, str]], str, Callable[[List[str]], int]]
+
+
+class ScriptedRenderer(Renderer):
+    """
+    Renderer non interactif pour parties automatiques (régression, exploration)
+    N'affiche rien, ne dort jamais et ne lit jamais l'entrée standard:
+    les choix viennent d'une politique (script, aléatoire ou fonction)
+    """
+
+    allow_save = False
+
+    def __init__(self, choices: ChoicePolicy = 'random', rng: Optional[GameRNG] = None,
+                 answers: Sequence[str] = (), confirm: bool = False,
+                 max_choices: Optional[int] = None, allow_save: bool = False):
+        """
+        Args:
+            choices: Indices (ou libellés) dans l'ordre, 'random', ou fonction (options) -> indice
+            rng: Générateur pour la politique aléatoire (reproductible)
+            answers: Réponses successives aux saisies libres (défaut ensuite)
+            confirm: Réponse aux questions oui/non
+            max_choices: Nombre maximal de choix (ScriptExhausted au-delà, évite les boucles)
+            allow_save: Proposer la sauvegarde dans les scènes
+        """
+        if isinstance(choices, str):
+            if choices != 'random':
+                raise ValueError(f"Politique de choix inconnue: {choices}")
+            self._policy = self._random_choice
+            self._script = None
+        elif callable(choices):
+            self._policy = choices
+            self._script = None
+        else:
+            self._policy = self._scripted_choice
+            self._script = list(choices)
+        self.rng = rng or GameRNG()
+        self._answers = list(answers)
+        self._confirm = confirm
+        self.max_choices = max_choices
+        self.allow_save = allow_save
+        self.choices_made: List[int] = []
+
+    def _scripted_choice(self, options: List[str]) -> int:
+        position = len(self.choices_made)
+        if position >= len(self._script):
+            raise ScriptExhausted(f"Script épuisé après {position} choix (options: {options})")
+        choice = self._script[position]
+        if isinstance(choice, str):
+            return options.index(choice)
+        return choice
+
+    def _random_choice(self, options: List[str]) -> int:
+        return self.rng.randint(0, len(options) - 1)
+
+    def print_header(self, title: str):
+        pass
+
+    def print_slow(self, text: str, delay: float = 0.02):
+        pass
+
+    def message(self, text: str = ""):
+        pass
+
+    def wait_for_input(self, prompt: str = "\n[Appuyez sur ENTRÉE pour continuer]"):
+        pass
+
+    def get_choice(self, options: List[str]) -> int:
+        if self.max_choices is not None and len(self.choices_made) >= self.max_choices:
+            raise ScriptExhausted(f"Limite de {self.max_choices} choix atteinte")
+        choice = self._policy(options)
+        if not 0 <= choice < len(options):
+            raise ValueError(f"Choix {choice} hors limites ({len(options)} options)")
+        self.choices_made.append(choice)
+        return choice
+
+    def display_map(self, map_ascii: str, player_pos: tuple = None):
+        pass
+
+    def ask_text(self, prompt: str, default: str = "") -> str:
+        return self._answers.pop(0) if self._answers else default
+
+    def confirm(self, question: str) -> bool:
+        return self._confirm
+
+    def pause(self, seconds: float):
+        pass
+
+
+class SessionRenderer(ConsoleRenderer):
+    """
+    Renderer des parties hébergées (SceneManager.start/step)
+    Affiche sans effet machine à écrire ni pause, sur la sortie courante
+    (redirigée vers le tampon de la session pendant chaque étape); les
+    interactions passent par les Prompt du SceneManager, jamais par input()
+    """
+
+    allow_save = False
+
+    def print_slow(self, text: str, delay: float = 0.02):
+        print(text)
+
+    def pause(self, seconds: float):
+        pass
+
+    def _interactive(self, *args, **kwargs):
+        raise RuntimeError("Interaction bloquante dans une session hébergée (utiliser SceneManager.step)")
+
+    wait_for_input = get_choice = ask_text = confirm = _interactive
+
 
 def create_renderer(use_ncurses: bool = False) -> Renderer:
     """
@@ -2,7 +2,7 @@
 Scenarios module - D&D 5e adventures
 """
 
-from .base_scenario import BaseScenario
+from .base_scenario import BaseScenario, MonsterFactoryWrapper
 
-__all__ = ['BaseScenario']
+__all__ = ['BaseScenario', 'MonsterFactoryWrapper']
 
@@ -5,42 +5,79 @@ Factorisation du code commun entre scénarios
 
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional
-from dnd_5e_core import Character, Monster
-from dnd_5e_core.combat import CombatSystem
+from dnd_5e_core import Character
 
 from ..utils.pdf_reader import PDFScenarioReader
 from ..utils.save_manager import SaveGameManager, JSONLoader
 from ..utils.exploration_map import ExplorationMap
 from ..utils.level_manager import LevelUpManager, VillageRestManager
-from ..utils.monster_factory import MonsterFactory
+from ..utils.monster_factory import (
+    LibraryMonsterSource, LocalMonsterSource, MonsterEngine, MonsterResolutionCache
+)
+from ..utils.monster_catalog import LOCAL_MONSTERS_PATH, open_default_catalog
+from ..utils.rules_catalog import open_rules_catalog
+from ..core.rng import GameRNG
 from ..scenes.scene_system import SceneManager
 from ..rendering.renderer import create_renderer, Renderer
+from ..systems.spellcasting import SpellcastingSystem
 from ..systems.spellcasting_v2 import SpellcastingManager
+from ..systems.conditions import ConditionEngine
 from ..systems.merchant import MerchantSystem
 
 
+class MonsterFactoryWrapper(MonsterEngine):
+    """
+    Moteur de monstres des scénarios: catalogue précompilé, puis JSON local, puis dnd_5e_core
+    Compatible avec l'ancienne interface create_monster(monster_id, name)
+    """
+
+    def __init__(self, use_catalog: bool = True, cache: Optional[MonsterResolutionCache] = None):
+        """
+        Args:
+            use_catalog: Lire les monstres depuis le catalogue précompilé (compilé au premier lancement)
+            cache: Cache de résolution (cache partagé du processus par défaut)
+        """
+        self.local_source = LocalMonsterSource(path=LOCAL_MONSTERS_PATH)
+        self.catalog = open_default_catalog(self.local_source) if use_catalog else None
+        sources = [self.catalog] if self.catalog is not None else []
+        super().__init__(sources + [self.local_source, LibraryMonsterSource()], cache)
+
+    @property
+    def local_monsters(self) -> Dict:
+        """Données JSON locales (chargées seulement si nécessaire)"""
+        return self.local_source.data
+
+
 class BaseScenario(ABC):
     """
     Classe de base abstraite pour tous les scénarios
     Fournit les fonctionnalités communes
     """
 
-    def __init__(self, pdf_path: str, use_ncurses: bool = False):
+    def __init__(self, pdf_path: str, use_ncurses: bool = False, seed: Optional[int] = None):
         """
         Initialiser le scénario
 
         Args:
             pdf_path: Chemin vers le PDF du scénario
             use_ncurses: Utiliser interface ncurses ou console
+            seed: Graine de la session (partie reproductible si fournie)
         """
         self.pdf_path = pdf_path
 
+        # Générateur aléatoire de la session
+        self.rng = GameRNG(seed)
+
         # Systèmes de jeu
         self.renderer = create_renderer(use_ncurses)
         # 🔧 Utiliser EnhancedCombatSystem pour calculer correctement les dommages
         from ..systems.enhanced_combat import EnhancedCombatSystem
-        self.combat_system = EnhancedCombatSystem(verbose=True)
+        self.combat_system = EnhancedCombatSystem(verbose=True, rng=self.rng)
         self.spellcasting = SpellcastingManager()
+        # Effets temporaires (buffs, débuffs) expirés au fil des rounds de combat
+        self.conditions = ConditionEngine()
+        # Sorts à effet durable (Bouclier): même moteur que la boucle de combat
+        self.spell_system = SpellcastingSystem(self.conditions)
         self.merchant_system = MerchantSystem()
         self.scene_manager = SceneManager()
 
@@ -52,176 +89,6 @@ class BaseScenario(ABC):
         self.village_rest = VillageRestManager()
 
         # 🆕 Monster loader depuis fichiers JSON locaux + dnd_5e_core package
-        from dnd_5e_core.data import load_monster
-        from dnd_5e_core import Monster, Abilities
-        from dnd_5e_core.combat import Action, ActionType, Damage
-        from dnd_5e_core.mechanics import DamageDice
-        from dnd_5e_core.equipment import DamageType
-        import json
-        from pathlib import Path
-
-        # Créer un wrapper pour compatibilité avec l'ancienne interface
-        class MonsterFactoryWrapper:
-            def __init__(self):
-                # Charger les monstres locaux depuis JSON
-                local_monsters_path = Path(__file__).parent.parent.parent / "data" / "monsters" / "all_monsters.json"
-                self.local_monsters = {}
-                if local_monsters_path.exists():
-                    try:
-                        with open(local_monsters_path, 'r', encoding='utf-8') as f:
-                            self.local_monsters = json.load(f)
-                    except Exception as e:
-                        print(f"⚠️ Erreur chargement monstres locaux: {e}")
-
-            def create_monster(self, monster_id: str, name: Optional[str] = None):
-                """Créer un monstre en utilisant les données locales ou dnd_5e_core.data.load_monster"""
-                # 1. Essayer d'abord les monstres locaux
-                if monster_id in self.local_monsters:
-                    return self._create_from_local(monster_id, name)
-
-                # 2. Sinon, essayer l'API dnd_5e_core
-                normalized_id = monster_id.replace('_', '-')
-                monster_data = load_monster(normalized_id)
-                if not monster_data:
-                    monster_data = load_monster(monster_id)
-
-                if monster_data:
-                    return self._create_from_api(monster_data, monster_id, name)
-
-                print(f"⚠️ Monstre non trouvé: {monster_id}")
-                return None
-
-            def _create_from_local(self, monster_id: str, name: Optional[str] = None):
-                """Créer un monstre depuis les données locales JSON"""
-                data = self.local_monsters[monster_id]
-
-                try:
-                    abilities = Abilities(
-                        str=data['abilities']['str'],
-                        dex=data['abilities']['dex'],
-                        con=data['abilities']['con'],
-                        int=data['abilities']['int'],
-                        wis=data['abilities']['wis'],
-                        cha=data['abilities']['cha']
-                    )
-
-                    # Convertir les actions
-                    actions = []
-                    for action_data in data.get('actions', []):
-                        # Ignorer les actions sans attaque (comme Multiattack)
-                        if 'attack_bonus' not in action_data:
-                            continue
-
-                        damage_type_name = action_data.get('damage_type', 'slashing')
-                        damage_type = DamageType(
-                            index=damage_type_name.lower(),
-                            name=damage_type_name.capitalize(),
-                            desc=f"{damage_type_name} damage"
-                        )
-
-                        action = Action(
-                            name=action_data['name'],
-                            desc=action_data.get('desc', ''),
-                            type=ActionType.MELEE if not action_data.get('range') else ActionType.RANGED,
-                            attack_bonus=action_data['attack_bonus'],
-                            damages=[Damage(
-                                type=damage_type,
-                                dd=DamageDice(action_data.get('damage_dice', '1d6'))
-                            )],
-                            normal_range=5 if not action_data.get('range') else int(action_data['range'].split('/')[0])
-                        )
-                        actions.append(action)
-
-                    # Extraire la vitesse
-                    speed_data = data.get('speed', {})
-                    if isinstance(speed_data, dict):
-                        walk_speed = speed_data.get('walk', '30 ft')
-                    else:
-                        walk_speed = '30 ft'
-                    speed = int(walk_speed.replace(' ft', '').replace('ft', '').strip())
-
-                    monster = Monster(
-                        index=monster_id,
-                        name=name if name else data['name'],
-                        abilities=abilities,
-                        proficiencies=[],
-                        armor_class=data['armor_class'],
-                        hit_points=data['hit_points'],
-                        hit_dice=data['hit_dice'],
-                        xp=data['xp'],
-                        speed=speed,
-                        challenge_rating=data['challenge_rating'],
-                        actions=actions
-                    )
-
-                    return monster
-
-                except Exception as e:
-                    print(f"⚠️ Erreur lors de la création du monstre local {monster_id}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    return None
-
-            def _create_from_api(self, monster_data: dict, monster_id: str, name: Optional[str] = None):
-                """Créer un monstre depuis les données de l'API dnd_5e_core"""
-                try:
-                    abilities = Abilities(
-                        str=monster_data.get('strength', 10),
-                        dex=monster_data.get('dexterity', 10),
-                        con=monster_data.get('constitution', 10),
-                        int=monster_data.get('intelligence', 10),
-                        wis=monster_data.get('wisdom', 10),
-                        cha=monster_data.get('charisma', 10)
-                    )
-
-                    # Convertir les actions
-                    actions = []
-                    for action_data in monster_data.get('actions', []):
-                        if 'attack_bonus' in action_data and 'damage' in action_data:
-                            damage_parts = action_data['damage'][0] if action_data['damage'] else {}
-                            damage_type_name = damage_parts.get('damage_type', {}).get('name', 'slashing')
-
-                            damage_type = DamageType(
-                                index=damage_type_name.lower(),
-                                name=damage_type_name,
-                                desc=f"{damage_type_name} damage"
-                            )
-
-                            action = Action(
-                                name=action_data.get('name', 'Attack'),
-                                desc=action_data.get('desc', ''),
-                                type=ActionType.MELEE,
-                                attack_bonus=action_data.get('attack_bonus', 0),
-                                damages=[Damage(
-                                    type=damage_type,
-                                    dd=DamageDice(damage_parts.get('damage_dice', '1d6'))
-                                )],
-                                normal_range=5
-                            )
-                            actions.append(action)
-
-                    monster = Monster(
-                        index=monster_data.get('index', monster_id),
-                        name=name if name else monster_data.get('name', 'Unknown'),
-                        abilities=abilities,
-                        proficiencies=[],
-                        armor_class=monster_data.get('armor_class', 10),
-                        hit_points=monster_data.get('hit_points', 1),
-                        hit_dice=monster_data.get('hit_dice', '1d8'),
-                        xp=monster_data.get('xp', 0),
-                        speed=monster_data.get('speed', {}).get('walk', '30 ft').replace(' ft', '').replace('ft', '').strip() if isinstance(monster_data.get('speed'), dict) else 30,
-                        challenge_rating=monster_data.get('challenge_rating', 0),
-                        actions=actions
-                    )
-
-                    return monster
-
-                except Exception as e:
-                    print(f"⚠️ Erreur lors de la création du monstre API {monster_id}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    return None
-
         self.monster_factory = MonsterFactoryWrapper()
 
         # Données du scénario
@@ -367,9 +234,12 @@ class BaseScenario(ABC):
             'game_state': self.game_state,
             'renderer': self.renderer,
             'combat_system': self.combat_system,
+            'conditions': self.conditions,
             'spellcasting': self.spellcasting,
+            'spell_system': self.spell_system,
             'merchant_system': self.merchant_system,
             'scenario_data': self.scenario_data,
+            'rng': self.rng,
             'weapons': weapons,        # 🆕
             'armors': armors,          # 🆕
             'equipments': equipments,  # 🆕
@@ -657,9 +527,8 @@ class BaseScenario(ABC):
 
         if choice == 0:
             # Sauvegarder
-            slot_name = input("\nNom de la sauvegarde (ou ENTER pour autosave): ").strip()
-            if not slot_name:
-                slot_name = "autosave"
+            slot_name = self.renderer.ask_text("\nNom de la sauvegarde (ou ENTER pour autosave): ",
+                                               default="autosave")
 
             if self.save_game(slot_name):
                 print(f"✅ Partie sauvegardée: {slot_name}")
@@ -669,8 +538,7 @@ class BaseScenario(ABC):
             return 'save_quit'
 
         elif choice == 1:
-            confirm = input("\n⚠️ Quitter sans sauvegarder? (oui/non): ").strip().lower()
-            if confirm in ['oui', 'o', 'yes', 'y']:
+            if self.renderer.confirm("\n⚠️ Quitter sans sauvegarder? (oui/non): "):
                 return 'quit'
             return 'continue'
 
@@ -690,7 +558,7 @@ class BaseScenario(ABC):
         print(f"  0. Nouvelle partie")
 
         try:
-            choice = input("\nCharger une partie? (numéro ou 0): ").strip()
+            choice = self.renderer.ask_text("\nCharger une partie? (numéro ou 0): ")
             if choice and choice.isdigit():
                 idx = int(choice)
                 if idx == 0:
@@ -716,9 +584,12 @@ class BaseScenario(ABC):
             'game_state': self.game_state,
             'renderer': self.renderer,
             'combat_system': self.combat_system,
+            'conditions': self.conditions,
             'spellcasting': self.spellcasting,
+            'spell_system': self.spell_system,
             'merchant_system': self.merchant_system,
-            'scenario_data': self.scenario_data
+            'scenario_data': self.scenario_data,
+            'rng': self.rng
         }
 
         # Reprendre à la scène sauvegardée
@@ -745,6 +616,11 @@ class BaseScenario(ABC):
             )
             from dnd_5e_core.equipment import HealingPotion, PotionRarity
 
+            # Objets lus dans le catalogue des règles partagé (repli: fichiers JSON de dnd_5e_core)
+            rules = open_rules_catalog()
+            if rules is not None:
+                load_weapon, load_armor, load_equipment = rules.weapon, rules.armor, rules.equipment
+
             # Charger armes - dnd_5e_core.data retourne des dicts, pas des objets
             for name in list_weapons()[:20]:
                 try:
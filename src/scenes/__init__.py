@@ -5,13 +5,14 @@ Module de gestion des scènes de jeu
 from .scene_system import (
     SceneType, SceneResult, BaseScene, NarrativeScene,
     ChoiceScene, CombatScene, MerchantScene, RestScene,
-    SceneManager
+    SceneManager, Prompt, PromptType
 )
 from .scene_factory import SceneFactory
+from .scene_graph import SceneGraph
 
 __all__ = [
     'SceneType', 'SceneResult', 'BaseScene', 'NarrativeScene',
     'ChoiceScene', 'CombatScene', 'MerchantScene', 'RestScene',
-    'SceneManager', 'SceneFactory'
+    'SceneManager', 'Prompt', 'PromptType', 'SceneFactory', 'SceneGraph'
 ]
 
@@ -2,11 +2,14 @@
 Scene Factory - Construit des scènes à partir de données JSON
 """
 
+from collections import Counter
 from typing import Dict, List, Optional, Callable
 from .scene_system import (
     BaseScene, NarrativeScene, ChoiceScene, CombatScene,
     MerchantScene, RestScene, SceneManager
 )
+from .scene_graph import SceneGraph
+from ..utils.monster_factory import group_monster_ids
 
 
 class SceneFactory:
@@ -14,6 +17,9 @@ class SceneFactory:
     Factory pour créer des scènes depuis JSON
     """
 
+    # Au-delà de ce nombre de monstres, les monstres identiques sont regroupés en hordes
+    HORDE_THRESHOLD = 20
+
     @staticmethod
     def create_scene_from_dict(scene_data: Dict, monster_factory=None) -> Optional[BaseScene]:
         """
@@ -58,11 +64,20 @@ class SceneFactory:
         elif scene_type == 'combat':
             # Créer une factory pour les monstres
             monster_names = scene_data.get('monsters', [])
+            horde = scene_data.get('horde', len(monster_names) >= SceneFactory.HORDE_THRESHOLD)
 
             def enemies_factory(game_context):
                 monsters = []
                 factory = game_context.get('monster_factory') or monster_factory
-                if factory:
+                if factory and horde and hasattr(factory, 'create_horde'):
+                    for monster_name, count in Counter(monster_names).items():
+                        group = factory.create_horde(monster_name, count)
+                        if group:
+                            monsters.append(group)
+                elif factory and hasattr(factory, 'create_many'):
+                    # Un seul accès au modèle par groupe de monstres identiques
+                    monsters = factory.create_many(group_monster_ids(monster_names))
+                elif factory:
                     for monster_name in monster_names:
                         monster = factory.create_monster(monster_name)
                         if monster:
@@ -99,21 +114,43 @@ class SceneFactory:
             return None
 
     @staticmethod
-    def build_scene_manager_from_json(scenario_data: Dict, monster_factory=None) -> SceneManager:
+    def build_scene_manager_from_json(scenario_data: Dict, monster_factory=None,
+                                      strict: bool = False,
+                                      graph: Optional[SceneGraph] = None) -> SceneManager:
         """
         Construire un SceneManager complet depuis les données JSON
+        Le graphe des scènes est compilé et validé au chargement (manager.graph)
 
         Args:
             scenario_data: Données complètes du scénario
             monster_factory: Factory pour créer les monstres
+            strict: Refuser un scénario aux liens cassés au lieu de le signaler
+            graph: Graphe déjà compilé et validé (partagé entre plusieurs parties)
 
         Returns:
             Un SceneManager configuré avec toutes les scènes
+
+        Raises:
+            ValueError: Graphe invalide (mode strict)
         """
         manager = SceneManager()
 
         scenes_data = scenario_data.get('scenes', [])
 
+        # Compiler et valider le graphe avant de créer les scènes
+        if graph is None:
+            graph = SceneGraph.compile(scenes_data)
+            errors = graph.errors()
+        else:
+            errors = []
+        if errors:
+            name = scenario_data.get('name') or scenario_data.get('scenario_id', '?')
+            if strict:
+                raise ValueError(f"Scénario {name} invalide: " + "; ".join(errors))
+            for error in errors:
+                print(f"⚠️ Scénario {name}: {error}")
+        manager.graph = graph
+
         # Créer toutes les scènes
         for scene_data in scenes_data:
             scene = SceneFactory.create_scene_from_dict(scene_data, monster_factory)
@@ -0,0 +1,185 @@
+"""
+Scene Graph - Graphe compilé et validé d'un scénario JSON
+Les scènes sont numérotées (identifiants entiers), les liens sont résolus une
+fois au chargement en listes d'adjacence; l'accessibilité est précalculée
+(masques de bits) et les liens cassés sont indexés au lieu d'apparaître en
+cours de partie ("Scène non trouvée")
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+# Types de liens
+LINK_NEXT = 'next_scene'
+LINK_CHOICE = 'choice'
+LINK_VICTORY = 'on_victory'
+LINK_DEFEAT = 'on_defeat'
+
+# Cibles conventionnelles sans scène (fin de partie gérée par SceneManager)
+TERMINAL_TARGETS = frozenset({'game_over'})
+
+# Cible non résolue dans les listes d'arcs
+UNRESOLVED = -1
+
+
+class SceneLink(NamedTuple):
+    """Arc sortant d'une scène"""
+    kind: str                     # LINK_NEXT, LINK_CHOICE, LINK_VICTORY, LINK_DEFEAT
+    target: int                   # Numéro de la scène cible (UNRESOLVED si absente)
+    target_id: str                # Identifiant de la cible dans le JSON
+    label: Optional[str] = None   # Texte du choix
+
+
+class DanglingLink(NamedTuple):
+    """Lien vers une scène inexistante"""
+    scene_id: str
+    kind: str
+    target_id: str
+
+
+def _links(scene_data: Dict) -> List[Tuple[str, str, Optional[str]]]:
+    """Liens (type, cible, libellé) déclarés par une scène JSON"""
+    links = []
+    if scene_data.get('next_scene'):
+        links.append((LINK_NEXT, scene_data['next_scene'], None))
+    for choice in scene_data.get('choices', []) or []:
+        if choice.get('next_scene'):
+            links.append((LINK_CHOICE, choice['next_scene'], choice.get('text')))
+    if scene_data.get('on_victory'):
+        links.append((LINK_VICTORY, scene_data['on_victory'], None))
+    if scene_data.get('on_defeat'):
+        links.append((LINK_DEFEAT, scene_data['on_defeat'], None))
+    return links
+
+
+@dataclass(frozen=True)
+class SceneGraph:
+    """
+    Graphe immuable des scènes
+    Scène i: ids[i], types[i]; successeurs résolus: adjacency[i]; arcs détaillés: links[i]
+    """
+    ids: Tuple[str, ...]
+    index: Mapping[str, int]                # Identifiant -> numéro (lecture seule)
+    types: Tuple[Optional[str], ...]
+    links: Tuple[Tuple[SceneLink, ...], ...]
+    adjacency: Tuple[Tuple[int, ...], ...]
+    reach: Tuple[int, ...]                  # reach[i]: masque des scènes accessibles depuis i (i compris)
+    start: int
+    dangling: Tuple[DanglingLink, ...]
+    duplicates: Tuple[str, ...]
+
+    @classmethod
+    def compile(cls, scenes_data: Iterable[Dict], start_id: Optional[str] = None) -> 'SceneGraph':
+        """
+        Compiler les scènes JSON d'un scénario
+
+        Args:
+            scenes_data: Liste 'scenes' du JSON
+            start_id: Scène de départ (première scène par défaut)
+        """
+        scenes_data = [s for s in scenes_data if s.get('id')]
+        index: Dict[str, int] = {}
+        duplicates = []
+        for scene_data in scenes_data:
+            if scene_data['id'] in index:
+                duplicates.append(scene_data['id'])
+            else:
+                index[scene_data['id']] = len(index)
+
+        # La dernière définition l'emporte (comme SceneManager.add_scene)
+        by_id = {scene_data['id']: scene_data for scene_data in scenes_data}
+        ids = tuple(index)
+        types = tuple(by_id[scene_id].get('type') for scene_id in ids)
+
+        links, adjacency, dangling = [], [], []
+        for scene_id in ids:
+            scene_links = []
+            for kind, target_id, label in _links(by_id[scene_id]):
+                target = index.get(target_id, UNRESOLVED)
+                if target == UNRESOLVED and target_id not in TERMINAL_TARGETS:
+                    dangling.append(DanglingLink(scene_id, kind, target_id))
+                scene_links.append(SceneLink(kind, target, target_id, label))
+            links.append(tuple(scene_links))
+            adjacency.append(tuple(dict.fromkeys(l.target for l in scene_links if l.target != UNRESOLVED)))
+
+        if start_id is None:
+            start = 0 if ids else UNRESOLVED
+        else:
+            start = index.get(start_id, UNRESOLVED)
+
+        return cls(ids=ids, index=MappingProxyType(index), types=types,
+                   links=tuple(links), adjacency=tuple(adjacency),
+                   reach=cls._reachability(adjacency), start=start, dangling=tuple(dangling), duplicates=tuple(duplicates))
+
+    @staticmethod
+    def _reachability(adjacency: List[Tuple[int, ...]]) -> Tuple[int, ...]:
+        """Fermeture transitive (parcours depuis chaque scène, masques de bits)"""
+        reach = []
+        for origin in range(len(adjacency)):
+            mask = 1 << origin
+            stack = [origin]
+            while stack:
+                for target in adjacency[stack.pop()]:
+                    bit = 1 << target
+                    if not mask & bit:
+                        mask |= bit
+                        stack.append(target)
+            reach.append(mask)
+        return tuple(reach)
+
+    # Requêtes
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, scene_id: str) -> bool:
+        return scene_id in self.index
+
+    def number(self, scene_id: str) -> int:
+        """Numéro d'une scène (UNRESOLVED si absente)"""
+        return self.index.get(scene_id, UNRESOLVED)
+
+    def can_reach(self, origin: int, target: int) -> bool:
+        """La scène `target` est-elle accessible depuis `origin` (O(1))"""
+        return bool(self.reach[origin] >> target & 1)
+
+    @property
+    def reachable(self) -> Tuple[int, ...]:
+        """Scènes accessibles depuis le départ"""
+        if self.start == UNRESOLVED:
+            return ()
+        mask = self.reach[self.start]
+        return tuple(i for i in range(len(self.ids)) if mask >> i & 1)
+
+    @property
+    def unreachable(self) -> Tuple[str, ...]:
+        """Scènes jamais atteintes depuis le départ"""
+        reachable = set(self.reachable)
+        return tuple(scene_id for i, scene_id in enumerate(self.ids) if i not in reachable)
+
+    @property
+    def endings(self) -> Tuple[int, ...]:
+        """Scènes sans successeur (fin de scénario)"""
+        return tuple(i for i, successors in enumerate(self.adjacency) if not successors)
+
+    # Validation
+
+    def errors(self) -> List[str]:
+        """Problèmes bloquants: départ absent, liens cassés, identifiants dupliqués"""
+        errors = []
+        if self.start == UNRESOLVED:
+            errors.append("Scène de départ introuvable")
+        for link in self.dangling:
+            errors.append(f"{link.scene_id}: {link.kind} -> '{link.target_id}' introuvable")
+        for scene_id in self.duplicates:
+            errors.append(f"{scene_id}: identifiant dupliqué")
+        return errors
+
+    def warnings(self) -> List[str]:
+        """Problèmes non bloquants: scènes inaccessibles"""
+        return [f"{scene_id}: inaccessible depuis le départ" for scene_id in self.unreachable]
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors()
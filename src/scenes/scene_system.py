@@ -1,12 +1,17 @@
 """
 Scene System - Composite Pattern pour scénarios D&D
 Permet de factoriser les scènes de jeu
+
+Chaque scène est une petite machine à états (générateur steps()) qui émet des
+Prompt et reçoit les réponses du joueur: SceneManager.run les résout avec le
+renderer (partie bloquante), SceneManager.start/step les expose une à une
+(sessions entrelacées dans un même processus, sans thread par partie)
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Callable
+from dataclasses import dataclass, replace
+from typing import Any, List, Dict, Optional, Callable, Generator, Tuple
 from enum import Enum
-import time
 
 
 class SceneType(Enum):
@@ -27,6 +32,102 @@ class SceneResult(Enum):
     EXIT = "exit"
 
 
+class PromptType(Enum):
+    """Interactions attendues du joueur"""
+    CONTINUE = "continue"   # Appuyer sur ENTRÉE
+    CHOICE = "choice"       # Indice d'une option (0..n-1)
+    TEXT = "text"           # Saisie libre
+    CONFIRM = "confirm"     # Oui/non
+    END = "end"             # Partie terminée (aucune réponse attendue)
+
+
+@dataclass(frozen=True)
+class Prompt:
+    """Question posée au joueur par une scène"""
+    type: PromptType
+    text: str = ""
+    options: Tuple[str, ...] = ()
+    default: str = ""
+    scene_id: Optional[str] = None
+    result: Optional['SceneResult'] = None     # Résultat final (END)
+
+    @classmethod
+    def pause(cls, text: str = "\n[Appuyez sur ENTRÉE pour continuer]") -> 'Prompt':
+        return cls(PromptType.CONTINUE, text)
+
+    @classmethod
+    def choice(cls, options: List[str]) -> 'Prompt':
+        return cls(PromptType.CHOICE, options=tuple(options))
+
+    @classmethod
+    def ask(cls, text: str, default: str = "") -> 'Prompt':
+        return cls(PromptType.TEXT, text, default=default)
+
+    @classmethod
+    def confirm(cls, text: str) -> 'Prompt':
+        return cls(PromptType.CONFIRM, text)
+
+    def validate(self, value: Any) -> Any:
+        """
+        Normaliser une réponse du joueur
+
+        Raises:
+            ValueError: Réponse invalide pour ce type de question
+        """
+        if self.type == PromptType.CHOICE:
+            if isinstance(value, bool) or not isinstance(value, int) or not 0 <= value < len(self.options):
+                raise ValueError(f"Choix invalide: {value!r} (0..{len(self.options) - 1})")
+            return value
+        if self.type == PromptType.TEXT:
+            return (value or "").strip() or self.default
+        if self.type == PromptType.CONFIRM:
+            if isinstance(value, str):
+                return value.strip().lower() in ['o', 'oui', 'y', 'yes']
+            return bool(value)
+        if self.type == PromptType.END:
+            raise ValueError("Partie terminée")
+        return None
+
+    def answer(self, renderer) -> Any:
+        """Obtenir la réponse via un renderer (partie bloquante)"""
+        if self.type == PromptType.CHOICE:
+            return renderer.get_choice(list(self.options))
+        if self.type == PromptType.TEXT:
+            return renderer.ask_text(self.text, self.default)
+        if self.type == PromptType.CONFIRM:
+            return renderer.confirm(self.text)
+        renderer.wait_for_input(self.text)
+        return None
+
+
+# Machine à états d'une scène: émet des Prompt, reçoit les réponses, retourne le résultat
+SceneSteps = Generator[Prompt, Any, 'SceneResult']
+
+
+def run_steps(steps: Generator, renderer):
+    """Dérouler une machine à états en répondant aux Prompt avec le renderer"""
+    try:
+        prompt = next(steps)
+        while True:
+            prompt = steps.send(prompt.answer(renderer))
+    except StopIteration as stop:
+        return stop.value
+
+
+def _save_game(game_context: Dict, prompt: str) -> Generator[Prompt, Any, bool]:
+    """Sauvegarder via le scénario du contexte (nom demandé au joueur)"""
+    scenario = game_context.get('scenario')
+    if not scenario:
+        return False
+    slot_name = yield Prompt.ask(prompt, default="autosave")
+    renderer = game_context['renderer']
+    if scenario.save_game(slot_name):
+        renderer.message(f"✅ Partie sauvegardée: {slot_name}")
+    else:
+        renderer.message("❌ Erreur lors de la sauvegarde")
+    return True
+
+
 class BaseScene(ABC):
     """
     Classe abstraite pour toutes les scènes
@@ -41,13 +142,18 @@ class BaseScene(ABC):
         self.visited = False
 
     @abstractmethod
-    def execute(self, game_context: Dict) -> SceneResult:
+    def steps(self, game_context: Dict) -> SceneSteps:
         """
-        Exécuter la scène
+        Machine à états de la scène (générateur)
+        Émet des Prompt, reçoit les réponses du joueur et retourne le SceneResult
         game_context contient: party, game_state, renderer, etc.
         """
         pass
 
+    def execute(self, game_context: Dict) -> SceneResult:
+        """Exécuter la scène d'un bloc (réponses obtenues du renderer)"""
+        return run_steps(self.steps(game_context), game_context['renderer'])
+
     def on_enter(self, game_context: Dict):
         """Hook appelé en entrant dans la scène"""
         self.visited = True
@@ -72,26 +178,17 @@ class NarrativeScene(BaseScene):
         self.next_scene_id = next_scene_id
         self.delay = delay
 
-    def execute(self, game_context: Dict) -> SceneResult:
+    def steps(self, game_context: Dict) -> SceneSteps:
         self.on_enter(game_context)
 
         renderer = game_context['renderer']
         renderer.print_slow(self.text, self.delay)
 
         # 🆕 Proposer de sauvegarder après avoir lu le texte
-        save_choice = input("\n💾 Sauvegarder la partie? (o/n): ").strip().lower()
-        if save_choice in ['o', 'oui', 'y', 'yes']:
-            scenario = game_context.get('scenario')
-            if scenario:
-                slot_name = input("Nom de la sauvegarde (ou ENTER pour autosave): ").strip()
-                if not slot_name:
-                    slot_name = "autosave"
-                if scenario.save_game(slot_name):
-                    print(f"✅ Partie sauvegardée: {slot_name}")
-                else:
-                    print("❌ Erreur lors de la sauvegarde")
-
-        renderer.wait_for_input()
+        if renderer.allow_save and (yield Prompt.confirm("\n💾 Sauvegarder la partie? (o/n): ")):
+            yield from _save_game(game_context, "Nom de la sauvegarde (ou ENTER pour autosave): ")
+
+        yield Prompt.pause()
 
         self.on_exit(game_context)
         return SceneResult.CONTINUE
@@ -117,7 +214,7 @@ class ChoiceScene(BaseScene):
         super().__init__(scene_id, title, description)
         self.choices = choices
 
-    def execute(self, game_context: Dict) -> SceneResult:
+    def steps(self, game_context: Dict) -> SceneSteps:
         self.on_enter(game_context)
 
         renderer = game_context['renderer']
@@ -135,29 +232,22 @@ class ChoiceScene(BaseScene):
                 choice_mapping.append(i)
 
         if not available_choices:
-            print("Aucun choix disponible!")
+            renderer.message("Aucun choix disponible!")
             return SceneResult.FAILURE
 
         # 🆕 Ajouter option de sauvegarde
-        available_choices.append("💾 Sauvegarder la partie")
-
-        # Obtenir choix joueur
-        choice_idx = renderer.get_choice(available_choices)
-
-        # 🆕 Gérer la sauvegarde
-        if choice_idx == len(available_choices) - 1:
-            scenario = game_context.get('scenario')
-            if scenario:
-                slot_name = input("\nNom de la sauvegarde (ou ENTER pour autosave): ").strip()
-                if not slot_name:
-                    slot_name = "autosave"
-                if scenario.save_game(slot_name):
-                    print(f"✅ Partie sauvegardée: {slot_name}")
-                else:
-                    print("❌ Erreur lors de la sauvegarde")
-                renderer.wait_for_input()
-            # Ré-afficher les choix
-            return self.execute(game_context)
+        can_save = renderer.allow_save
+        if can_save:
+            available_choices.append("💾 Sauvegarder la partie")
+
+        # Obtenir choix joueur (ré-affichés après une sauvegarde)
+        while True:
+            choice_idx = yield Prompt.choice(available_choices)
+            if not (can_save and choice_idx == len(available_choices) - 1):
+                break
+            # 🆕 Gérer la sauvegarde
+            if (yield from _save_game(game_context, "\nNom de la sauvegarde (ou ENTER pour autosave): ")):
+                yield Prompt.pause()
 
         selected_choice = self.choices[choice_mapping[choice_idx]]
 
@@ -200,7 +290,7 @@ class CombatScene(BaseScene):
         self.on_victory_scene = on_victory_scene
         self.on_defeat_scene = on_defeat_scene
 
-    def execute(self, game_context: Dict) -> SceneResult:
+    def steps(self, game_context: Dict) -> SceneSteps:
         self.on_enter(game_context)
 
         renderer = game_context['renderer']
@@ -213,82 +303,54 @@ class CombatScene(BaseScene):
         # Lancer combat
         combat_system = game_context.get('combat_system')
         if not combat_system:
-            print("❌ Système de combat non disponible!")
+            renderer.message("❌ Système de combat non disponible!")
             return SceneResult.FAILURE
 
         party = game_context['party']
         alive_chars = [c for c in party if c.hit_points > 0]
-        alive_monsters = enemies.copy()
 
         # Afficher info combat
-        print(f"\n⚔️  Votre groupe:")
+        renderer.message(f"\n⚔️  Votre groupe:")
         for char in alive_chars:
-            print(f"  - {char.name}: {char.hit_points}/{char.max_hit_points} HP")
+            renderer.message(f"  - {char.name}: {char.hit_points}/{char.max_hit_points} HP")
 
-        print(f"\n👹 Ennemis:")
-        for monster in alive_monsters:
-            print(f"  - {monster.name}: {monster.hit_points} HP")
+        renderer.message(f"\n👹 Ennemis:")
+        for monster in enemies:
+            renderer.message(f"  - {monster.name}: {monster.hit_points} HP")
 
-        renderer.wait_for_input("\n[Combat! Appuyez sur ENTRÉE]")
+        yield Prompt.pause("\n[Combat! Appuyez sur ENTRÉE]")
 
         # Combat loop - utilise CombatSystem correctement
-        round_num = 1
-        max_rounds = 50
-
-        while alive_chars and alive_monsters and round_num <= max_rounds:
-            print(f"\n{'─' * 60}")
-            print(f"  TOUR {round_num}")
-            print(f"{'─' * 60}\n")
-
-            # Tours personnages
-            for char in alive_chars[:]:
-                if not alive_monsters:
-                    break
-                if char.hit_points <= 0:
-                    if char in alive_chars:
-                        alive_chars.remove(char)
-                    continue
-
-                # Appeler character_turn avec TOUS les paramètres
-                combat_system.character_turn(
-                    character=char,
-                    alive_chars=alive_chars,
-                    alive_monsters=alive_monsters,
-                    party=party,
-                    weapons=game_context.get('weapons', []),
-                    armors=game_context.get('armors', []),
-                    equipments=game_context.get('equipments', []),
-                    potions=game_context.get('potions', [])
-                )
-
-            # Tours monstres
-            for monster in alive_monsters[:]:
-                if not alive_chars:
-                    break
-                if monster.hit_points <= 0:
-                    if monster in alive_monsters:
-                        alive_monsters.remove(monster)
-                    continue
-
-                # Limiter attaque à la ligne de front (comme dans advanced_combat)
-                char_indices = {party.index(c): c for c in alive_chars if c in party}
-                melee_chars = [c for idx, c in char_indices.items() if idx < 3]
-                ranged_chars = [c for idx, c in char_indices.items() if idx >= 3]
-                accessible_chars = melee_chars if melee_chars else ranged_chars
-
-                combat_system.monster_turn(
-                    monster=monster,
-                    alive_monsters=alive_monsters,
-                    alive_chars=accessible_chars if accessible_chars else alive_chars,
-                    party=party,
-                    round_num=round_num
-                )
-
-            round_num += 1
+        # Import ici pour éviter dépendance circulaire
+        from src.systems.combat_simulator import run_combat_loop
+
+        def print_round_header(round_num: int):
+            renderer.message(f"\n{'─' * 60}")
+            renderer.message(f"  TOUR {round_num}")
+            renderer.message(f"{'─' * 60}\n")
+
+        # Les systèmes avec flux d'événements affichent eux-mêmes l'en-tête de round
+        # et se jouent sur états compacts (le rendu passe par les événements)
+        has_events = getattr(combat_system, 'events', None) is not None
+
+        result = run_combat_loop(
+            combat_system,
+            party,
+            enemies,
+            weapons=game_context.get('weapons', []),
+            armors=game_context.get('armors', []),
+            equipments=game_context.get('equipments', []),
+            potions=game_context.get('potions', []),
+            max_rounds=50,
+            on_round=None if has_events else print_round_header,
+            compact=has_events,
+            initiative=True,
+            conditions=game_context.get('conditions')
+        )
 
         # Résultat
-        if alive_chars:
-            print("\n✅ VICTOIRE!")
+        if result.victory:
+            renderer.message("\n✅ VICTOIRE!")
 
             # Récompenses
             total_xp = sum(m.xp for m in enemies)
@@ -298,7 +360,7 @@ class CombatScene(BaseScene):
             self.on_exit(game_context)
             return SceneResult.SUCCESS
         else:
-            print("\n❌ DÉFAITE!")
+            renderer.message("\n❌ DÉFAITE!")
             self.next_scene_id = self.on_defeat_scene
             self.on_exit(game_context)
             return SceneResult.FAILURE
@@ -315,8 +377,9 @@ class MerchantScene(BaseScene):
         self.merchant_id = merchant_id
         self.next_scene_id = next_scene_id
 
-    def execute(self, game_context: Dict) -> SceneResult:
+    def steps(self, game_context: Dict) -> SceneSteps:
         self.on_enter(game_context)
+        renderer = game_context['renderer']
 
         # Import ici pour éviter dépendance circulaire
         from src.systems.merchant import MerchantSystem
@@ -328,21 +391,20 @@ class MerchantScene(BaseScene):
         # 🆕 Passer weapons et armors au marchand
         weapons = game_context.get('weapons', [])
         armors = game_context.get('armors', [])
-        merchant = MerchantSystem.get_merchant(self.merchant_id, weapons, armors)
+        merchant = merchant_system.get_merchant(self.merchant_id, weapons, armors)
 
         if not merchant:
-            print(f"❌ Marchand {self.merchant_id} non trouvé!")
+            renderer.message(f"❌ Marchand {self.merchant_id} non trouvé!")
             return SceneResult.FAILURE
 
         party = game_context['party']
-        renderer = game_context['renderer']
 
         # Boucle d'achat
         shopping = True
         while shopping:
-            print(merchant_system.display_shop(merchant, party[0]))
+            renderer.message(merchant_system.display_shop(merchant, party[0]))
 
-            choice = renderer.get_choice([
+            choice = yield Prompt.choice([
                 "Acheter pour un personnage",
                 "Voir inventaires du groupe",
                 "Quitter la boutique"
@@ -352,19 +414,19 @@ class MerchantScene(BaseScene):
                 # Acheter pour un personnage
                 items = merchant_system.get_buyable_items(merchant)
                 if not items:
-                    print("\n❌ Le marchand n'a plus rien à vendre!")
-                    renderer.wait_for_input()
+                    renderer.message("\n❌ Le marchand n'a plus rien à vendre!")
+                    yield Prompt.pause()
                     continue
 
                 # Choisir personnage
-                print("\nPour quel personnage voulez-vous acheter?")
+                renderer.message("\nPour quel personnage voulez-vous acheter?")
                 char_choices = [f"{char.name} ({char.gold} po)" for char in party]
-                char_idx = renderer.get_choice(char_choices)
+                char_idx = yield Prompt.choice(char_choices)
                 character = party[char_idx]
 
                 # Choisir article
-                print(f"\n💰 {character.name} a {character.gold} po")
-                print("\nQue voulez-vous acheter?")
+                renderer.message(f"\n💰 {character.name} a {character.gold} po")
+                renderer.message("\nQue voulez-vous acheter?")
 
                 item_choices = []
                 item_mapping = []
@@ -376,20 +438,20 @@ class MerchantScene(BaseScene):
                         item_mapping.append((item_id, price))
 
                 if not item_choices:
-                    print(f"\n❌ {character.name} n'a pas assez d'or pour acheter quoi que ce soit!")
-                    renderer.wait_for_input()
+                    renderer.message(f"\n❌ {character.name} n'a pas assez d'or pour acheter quoi que ce soit!")
+                    yield Prompt.pause()
                     continue
 
                 item_choices.append("Annuler")
-                item_idx = renderer.get_choice(item_choices)
+                item_idx = yield Prompt.choice(item_choices)
 
                 if item_idx < len(item_mapping):
                     # Acheter l'article
                     item_id, price = item_mapping[item_idx]
 
                     if merchant_system.buy_item(character, merchant, item_id):
-                        print(f"\n✅ {character.name} a acheté {item_id.replace('_', ' ')} pour {price} po!")
-                        print(f"   Or restant: {character.gold} po")
+                        renderer.message(f"\n✅ {character.name} a acheté {item_id.replace('_', ' ')} pour {price} po!")
+                        renderer.message(f"   Or restant: {character.gold} po")
 
                         # Obtenir l'article acheté (dernier dans l'inventaire)
                         from src.core.adapters import CharacterExtensions
@@ -400,61 +462,61 @@ class MerchantScene(BaseScene):
 
                             # Proposer d'équiper si c'est une arme ou armure
                             if isinstance(purchased_item, Weapon):
-                                print(f"\n🗡️  Voulez-vous équiper {purchased_item.name} maintenant?")
-                                equip_choice = renderer.get_choice(["Oui, équiper", "Non, garder dans l'inventaire"])
+                                renderer.message(f"\n🗡️  Voulez-vous équiper {purchased_item.name} maintenant?")
+                                equip_choice = yield Prompt.choice(["Oui, équiper", "Non, garder dans l'inventaire"])
 
                                 if equip_choice == 0:
                                     CharacterExtensions.equip_weapon(character, purchased_item)
-                                    print(f"   ✅ {purchased_item.name} équipé!")
-                                    print(f"   ⚔️  Dégâts: {purchased_item.damage_dice}")
+                                    renderer.message(f"   ✅ {purchased_item.name} équipé!")
+                                    renderer.message(f"   ⚔️  Dégâts: {purchased_item.damage_dice}")
 
                             elif isinstance(purchased_item, Armor):
-                                print(f"\n🛡️  Voulez-vous équiper {purchased_item.name} maintenant?")
-                                equip_choice = renderer.get_choice(["Oui, équiper", "Non, garder dans l'inventaire"])
+                                renderer.message(f"\n🛡️  Voulez-vous équiper {purchased_item.name} maintenant?")
+                                equip_choice = yield Prompt.choice(["Oui, équiper", "Non, garder dans l'inventaire"])
 
                                 if equip_choice == 0:
                                     CharacterExtensions.equip_armor(character, purchased_item)
-                                    print(f"   ✅ {purchased_item.name} équipé!")
-                                    print(f"   🛡️  CA: {CharacterExtensions.get_armor_class(character)}")
+                                    renderer.message(f"   ✅ {purchased_item.name} équipé!")
+                                    renderer.message(f"   🛡️  CA: {CharacterExtensions.get_armor_class(character)}")
 
                             # Afficher inventaire mis à jour
-                            print(f"\n📦 Inventaire de {character.name}:")
+                            renderer.message(f"\n📦 Inventaire de {character.name}:")
                             for item in character.inventory_items:
-                                print(f"   - {item.name}")
+                                renderer.message(f"   - {item.name}")
 
                         # Mettre à jour état du jeu
                         game_context['game_state']['gold_spent'] = game_context['game_state'].get('gold_spent', 0) + price
                     else:
-                        print(f"\n❌ Impossible d'acheter cet article!")
+                        renderer.message(f"\n❌ Impossible d'acheter cet article!")
 
-                    renderer.wait_for_input()
+                    yield Prompt.pause()
                 # Sinon, annuler (ne fait rien)
 
             elif choice == 1:
                 # Voir inventaires
-                print("\n" + "="*60)
-                print("  📦 INVENTAIRES DU GROUPE")
-                print("="*60)
+                renderer.message("\n" + "="*60)
+                renderer.message("  📦 INVENTAIRES DU GROUPE")
+                renderer.message("="*60)
 
                 for char in party:
-                    print(f"\n👤 {char.name}")
-                    print(f"   💰 Or: {char.gold} po")
+                    renderer.message(f"\n👤 {char.name}")
+                    renderer.message(f"   💰 Or: {char.gold} po")
 
                     if hasattr(char, 'equipped_weapon') and char.equipped_weapon:
-                        print(f"   🗡️  Arme: {char.equipped_weapon.name}")
+                        renderer.message(f"   🗡️  Arme: {char.equipped_weapon.name}")
 
                     if hasattr(char, 'equipped_armor') and char.equipped_armor:
-                        print(f"   🛡️  Armure: {char.equipped_armor.name}")
+                        renderer.message(f"   🛡️  Armure: {char.equipped_armor.name}")
 
                     if hasattr(char, 'inventory_items') and char.inventory_items:
-                        print(f"   📦 Inventaire ({len(char.inventory_items)} objets):")
+                        renderer.message(f"   📦 Inventaire ({len(char.inventory_items)} objets):")
                         for item in char.inventory_items:
-                            print(f"      - {item.name}")
+                            renderer.message(f"      - {item.name}")
                     else:
-                        print(f"   📦 Inventaire vide")
+                        renderer.message(f"   📦 Inventaire vide")
 
-                print("\n" + "="*60)
-                renderer.wait_for_input()
+                renderer.message("\n" + "="*60)
+                yield Prompt.pause()
 
             else:
                 shopping = False
@@ -474,7 +536,7 @@ class RestScene(BaseScene):
         self.rest_type = rest_type  # "short" or "long"
         self.next_scene_id = next_scene_id
 
-    def execute(self, game_context: Dict) -> SceneResult:
+    def steps(self, game_context: Dict) -> SceneSteps:
         self.on_enter(game_context)
 
         party = game_context['party']
@@ -482,7 +544,7 @@ class RestScene(BaseScene):
 
         if self.rest_type == "long":
             renderer.print_slow("Vous installez un campement pour la nuit...")
-            time.sleep(1)
+            renderer.pause(1)
 
             for char in party:
                 if char.hit_points > 0:
@@ -493,21 +555,23 @@ class RestScene(BaseScene):
                     from src.core.adapters import CharacterExtensions
                     CharacterExtensions.long_rest(char)
 
-                    print(f"✨ {char.name}: {old_hp} → {char.hit_points} HP, sorts restaurés")
+                    renderer.message(f"✨ {char.name}: {old_hp} → {char.hit_points} HP, sorts restaurés")
 
             renderer.print_slow("\n💤 Votre groupe est complètement reposé!")
 
         else:  # short rest
             renderer.print_slow("Vous prenez un court repos...")
+            from src.core.adapters import CharacterExtensions
+            from src.core.rng import get_rng
+            rng = get_rng(game_context)
             for char in party:
                 if char.hit_points > 0:
-                    from src.core.adapters import CharacterExtensions
                     old_hp = char.hit_points
-                    CharacterExtensions.rest_short(char) if hasattr(CharacterExtensions, 'rest_short') else None
+                    CharacterExtensions.rest_short(char, rng)
                     if char.hit_points > old_hp:
-                        print(f"✨ {char.name}: +{char.hit_points - old_hp} HP")
+                        renderer.message(f"✨ {char.name}: +{char.hit_points - old_hp} HP")
 
-        renderer.wait_for_input()
+        yield Prompt.pause()
         self.on_exit(game_context)
         return SceneResult.CONTINUE
 
@@ -522,6 +586,11 @@ class SceneManager:
         self.scenes: Dict[str, BaseScene] = {}
         self.current_scene_id: Optional[str] = None
         self.history: List[str] = []
+        # Graphe compilé (scénarios JSON, voir SceneFactory.build_scene_manager_from_json)
+        self.graph = None
+        # Partie pas à pas en cours (voir start/step)
+        self._session: Optional[SceneSteps] = None
+        self._prompt: Optional[Prompt] = None
 
     def add_scene(self, scene: BaseScene):
         """Ajouter une scène"""
@@ -531,16 +600,17 @@ class SceneManager:
         """Définir scène de départ"""
         self.current_scene_id = scene_id
 
-    def execute_scene(self, scene_id: str, game_context: Dict) -> SceneResult:
-        """Exécuter une scène"""
+    def _scene_steps(self, scene_id: str, game_context: Dict) -> SceneSteps:
+        """Machine à états d'une scène du scénario"""
+        renderer = game_context['renderer']
         if scene_id not in self.scenes:
-            print(f"❌ Scène {scene_id} non trouvée!")
+            renderer.message(f"❌ Scène {scene_id} non trouvée!")
             return SceneResult.FAILURE
 
         scene = self.scenes[scene_id]
         self.history.append(scene_id)
 
-        result = scene.execute(game_context)
+        result = yield from scene.steps(game_context)
 
         # Mettre à jour scène courante
         # Si next_scene_id est None, on termine le scénario
@@ -548,35 +618,89 @@ class SceneManager:
 
         return result
 
-    def run(self, game_context: Dict, start_scene_id: Optional[str] = None):
-        """
-        Exécuter le scénario complet
-        Boucle principale du jeu
-        """
+    def execute_scene(self, scene_id: str, game_context: Dict) -> SceneResult:
+        """Exécuter une scène"""
+        return run_steps(self._scene_steps(scene_id, game_context), game_context['renderer'])
+
+    def _play(self, game_context: Dict, start_scene_id: Optional[str] = None) -> SceneSteps:
+        """Machine à états du scénario complet (enchaînement des scènes)"""
+        renderer = game_context['renderer']
         if start_scene_id:
             self.current_scene_id = start_scene_id
 
         if not self.current_scene_id:
-            print("❌ Aucune scène de départ définie!")
-            return
+            renderer.message("❌ Aucune scène de départ définie!")
+            return SceneResult.FAILURE
 
+        result = SceneResult.CONTINUE
         while self.current_scene_id:
-            result = self.execute_scene(self.current_scene_id, game_context)
+            result = yield from self._scene_steps(self.current_scene_id, game_context)
 
             if result == SceneResult.EXIT:
-                print("\n" + "="*70)
-                print("🏁 Fin du scénario")
-                print("="*70)
+                renderer.message("\n" + "="*70)
+                renderer.message("🏁 Fin du scénario")
+                renderer.message("="*70)
                 break
             elif result == SceneResult.FAILURE:
                 # Gérer échec (game over, etc.)
-                print("\n💀 Game Over")
+                renderer.message("\n💀 Game Over")
                 break
 
             # Si pas de prochaine scène, fin du scénario
             if not self.current_scene_id:
-                print("\n" + "="*70)
-                print("🏁 Fin du scénario - Merci d'avoir joué!")
-                print("="*70)
+                renderer.message("\n" + "="*70)
+                renderer.message("🏁 Fin du scénario - Merci d'avoir joué!")
+                renderer.message("="*70)
                 break
 
+        return result
+
+    def run(self, game_context: Dict, start_scene_id: Optional[str] = None):
+        """
+        Exécuter le scénario complet
+        Boucle principale du jeu (réponses obtenues du renderer)
+        """
+        run_steps(self._play(game_context, start_scene_id), game_context['renderer'])
+
+    # API pas à pas: une partie = start() puis step(réponse) jusqu'au Prompt END
+    # (un SceneManager par partie: les scènes gardent l'état de la partie en cours)
+
+    def start(self, game_context: Dict, start_scene_id: Optional[str] = None) -> Prompt:
+        """Démarrer la partie; retourne la première question posée au joueur"""
+        self._session = self._play(game_context, start_scene_id)
+        self._prompt = None
+        return self._advance(None, first=True)
+
+    def step(self, value: Any = None) -> Prompt:
+        """
+        Répondre à la question en cours; retourne la suivante
+
+        Args:
+            value: Indice pour CHOICE, texte pour TEXT, booléen (ou 'o'/'n') pour CONFIRM
+
+        Raises:
+            ValueError: Réponse invalide (la question en cours reste posée)
+            RuntimeError: Partie non démarrée
+        """
+        if self._session is None:
+            raise RuntimeError("Partie non démarrée (appeler start())")
+        return self._advance(self._prompt.validate(value))
+
+    @property
+    def prompt(self) -> Optional[Prompt]:
+        """Question en cours (None avant start())"""
+        return self._prompt
+
+    @property
+    def finished(self) -> bool:
+        return self.prompt is not None and self.prompt.type == PromptType.END
+
+    def _advance(self, value: Any, first: bool = False) -> Prompt:
+        try:
+            prompt = next(self._session) if first else self._session.send(value)
+            self._prompt = replace(prompt, scene_id=self.history[-1] if self.history else None)
+        except StopIteration as stop:
+            self._session = None
+            self._prompt = Prompt(PromptType.END, scene_id=self.history[-1] if self.history else None,
+                                  result=stop.value)
+        return self._prompt
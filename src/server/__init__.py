@@ -0,0 +1,7 @@
+"""
+Hosted play - serveur de parties multi-sessions
+"""
+
+from .game_server import GameServer, GameSession
+
+__all__ = ['GameServer', 'GameSession']
@@ -0,0 +1,306 @@
+"""
+Game Server - Serveur asyncio multi-sessions pour parties hébergées
+Chaque connexion TCP (protocole texte, une ligne par réponse) joue sa propre
+partie: groupe, game_context et SceneManager dédiés, pilotés pas à pas
+(SceneManager.start/step). Les données en lecture seule (scénarios JSON et
+leurs graphes, moteur de monstres, trésors, catalogue de règles) sont chargées
+une seule fois et partagées par toutes les sessions
+
+Les étapes (un combat entier peut en être une) sont jouées dans le pool de
+threads de la boucle d'événements; la sortie d'une étape (print des scènes et
+du combat) va dans le tampon de sa session via un sys.stdout par thread
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import sys
+import threading
+from itertools import count
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ..core.rng import GameRNG
+from ..rendering.renderer import SessionRenderer
+from ..scenes.scene_factory import SceneFactory
+from ..scenes.scene_graph import SceneGraph
+from ..scenes.scene_system import Prompt, PromptType, SceneManager
+from ..systems.conditions import ConditionEngine
+from ..systems.enhanced_combat import EnhancedCombatSystem
+from ..systems.merchant import MerchantSystem
+from ..systems.spellcasting import SpellcastingSystem
+
+DEFAULT_SCENES_DIR = Path("data/scenes")
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Fin de chaque message du serveur: le client peut répondre
+PROMPT_MARK = "\n» "
+QUIT_COMMANDS = ('quit', 'exit', 'q')
+SESSION_ERROR = "\n❌ Erreur interne du serveur: la partie est interrompue\n"
+
+logger = logging.getLogger(__name__)
+
+
+class _StepOutput(threading.local):
+    """Tampon de l'étape en cours dans ce thread (None: sortie d'origine)"""
+    buffer: Optional[io.StringIO] = None
+
+
+_step_output = _StepOutput()
+_stdout_lock = threading.Lock()
+
+
+class _SessionStdout(io.TextIOBase):
+    """
+    sys.stdout des sessions: chaque thread écrit dans le tampon de son étape
+    (contextlib.redirect_stdout, global au processus, mélangerait les parties)
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        buffer = _step_output.buffer
+        return (self.stream if buffer is None else buffer).write(text)
+
+    def flush(self):
+        if _step_output.buffer is None:
+            self.stream.flush()
+
+
+def _capture_stdout():
+    """Installer _SessionStdout (une fois, ou de nouveau si sys.stdout a été remplacé)"""
+    with _stdout_lock:
+        if not isinstance(sys.stdout, _SessionStdout):
+            sys.stdout = _SessionStdout(sys.stdout)
+
+
+class GameSession:
+    """Partie d'un joueur: état propre, sortie capturée étape par étape"""
+
+    def __init__(self, session_id: int, scenario_id: str, manager: SceneManager, game_context: Dict):
+        self.session_id = session_id
+        self.scenario_id = scenario_id
+        self.manager = manager
+        self.game_context = game_context
+
+    @property
+    def finished(self) -> bool:
+        return self.manager.finished
+
+    def start(self) -> str:
+        """Démarrer la partie; retourne le texte à envoyer au joueur"""
+        return self._run(self.manager.start, self.game_context)
+
+    def handle(self, line: str) -> str:
+        """Traiter une ligne du joueur; retourne le texte à envoyer"""
+        prompt = self.manager.prompt
+        try:
+            value = prompt.validate(self.parse(prompt, line))
+        except ValueError:
+            if prompt.type == PromptType.CHOICE:
+                return f"Veuillez entrer un nombre entre 1 et {len(prompt.options)}" + self.format_prompt(prompt)
+            return self.format_prompt(prompt)
+        return self._run(self.manager.step, value)
+
+    def _run(self, action, *args) -> str:
+        _capture_stdout()
+        output = _step_output.buffer = io.StringIO()
+        try:
+            prompt = action(*args)
+        finally:
+            _step_output.buffer = None
+        return output.getvalue() + self.format_prompt(prompt)
+
+    @staticmethod
+    def parse(prompt: Prompt, line: str):
+        """Convertir une ligne saisie en réponse au Prompt (choix numérotés à partir de 1)"""
+        if prompt.type == PromptType.CHOICE:
+            return int(line.strip()) - 1
+        if prompt.type == PromptType.CONTINUE:
+            return None
+        return line
+
+    @staticmethod
+    def format_prompt(prompt: Prompt) -> str:
+        """Texte d'une question (terminé par PROMPT_MARK si une réponse est attendue)"""
+        if prompt.type == PromptType.END:
+            return "\n🏁 Partie terminée\n"
+        if prompt.type == PromptType.CHOICE:
+            lines = ["", "Que voulez-vous faire ?"]
+            lines += [f"  {i}. {option}" for i, option in enumerate(prompt.options, 1)]
+            lines.append(f"Votre choix (1-{len(prompt.options)})")
+            return '\n'.join(lines) + PROMPT_MARK
+        return prompt.text.rstrip() + PROMPT_MARK
+
+
+class GameServer:
+    """
+    Serveur de parties hébergées
+    Le scénario modèle fournit les groupes (create_party), l'état initial,
+    le moteur de monstres et les trésors partagés
+    """
+
+    def __init__(self, template, scenes_dir: Path = DEFAULT_SCENES_DIR, max_sessions: int = 500,
+                 idle_timeout: float = 900.0, seed: Optional[int] = None):
+        """
+        Args:
+            template: Scénario modèle (BaseScenario)
+            scenes_dir: Dossier des scénarios JSON proposés
+            max_sessions: Nombre maximal de parties simultanées
+            idle_timeout: Déconnexion après ce délai sans réponse (secondes)
+            seed: Graine du serveur (graines des sessions reproductibles)
+        """
+        self.template = template
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.rng = GameRNG(seed)
+        self.sessions: Dict[int, GameSession] = {}
+        self._session_ids = count(1)
+
+        # Données partagées en lecture seule
+        self.monster_factory = template.monster_factory
+        self.scenarios: Dict[str, Tuple[Dict, SceneGraph]] = {}
+        for path in sorted(Path(scenes_dir).glob('*.json')):
+            with open(path, 'r', encoding='utf-8') as f:
+                scenario_data = json.load(f)
+            self.scenarios[path.stem] = (scenario_data, SceneGraph.compile(scenario_data.get('scenes', [])))
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.weapons, self.armors, self.equipments, self.potions = template._load_equipment()
+
+    # Sessions
+
+    def scenario_ids(self) -> List[str]:
+        """Scénarios jouables (graphe valide)"""
+        return [scenario_id for scenario_id, (_, graph) in self.scenarios.items() if graph.is_valid]
+
+    def create_session(self, scenario_id: str, seed: Optional[int] = None) -> GameSession:
+        """
+        Créer une partie (groupe, contexte et SceneManager dédiés)
+
+        Raises:
+            KeyError: Scénario inconnu
+            RuntimeError: Nombre maximal de sessions atteint
+        """
+        if len(self.sessions) >= self.max_sessions:
+            raise RuntimeError(f"Serveur complet ({self.max_sessions} parties)")
+        scenario_data, graph = self.scenarios[scenario_id]
+        rng = GameRNG(seed if seed is not None else self.rng.randint(0, 2 ** 31 - 1))
+        manager = SceneFactory.build_scene_manager_from_json(scenario_data, self.monster_factory, graph=graph)
+        conditions = ConditionEngine()
+        game_context = {
+            'party': self.template.create_party(),
+            'game_state': self.template._init_game_state(),
+            'renderer': SessionRenderer(),
+            'combat_system': EnhancedCombatSystem(verbose=True, rng=rng),
+            'conditions': conditions,
+            'spell_system': SpellcastingSystem(conditions),
+            # Stocks des marchands propres à la partie
+            'merchant_system': MerchantSystem(),
+            'monster_factory': self.monster_factory,
+            'rng': rng,
+            'weapons': self.weapons,
+            'armors': self.armors,
+            'equipments': self.equipments,
+            'potions': self.potions,
+        }
+        session = GameSession(next(self._session_ids), scenario_id, manager, game_context)
+        self.sessions[session.session_id] = session
+        return session
+
+    def close_session(self, session: GameSession):
+        self.sessions.pop(session.session_id, None)
+
+    # Réseau
+
+    def welcome(self) -> str:
+        """Menu des scénarios"""
+        lines = ["=" * 70, "  🎲 SERVEUR DE PARTIES D&D 5e", "=" * 70, ""]
+        for i, scenario_id in enumerate(self.scenario_ids(), 1):
+            lines.append(f"  {i}. {self.scenarios[scenario_id][0].get('name', scenario_id)}")
+        lines.append(f"\nChoisissez un scénario (1-{len(self.scenario_ids())}) ou 'q' pour quitter")
+        return '\n'.join(lines) + PROMPT_MARK
+
+    async def _readline(self, reader: asyncio.StreamReader) -> Optional[str]:
+        """Ligne suivante du client (None: déconnexion, inactivité ou abandon)"""
+        try:
+            data = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+        except asyncio.TimeoutError:
+            return None
+        if not data:
+            return None
+        line = data.decode('utf-8', errors='replace').strip()
+        return None if line.lower() in QUIT_COMMANDS else line
+
+    async def _step(self, session: GameSession, action, *args) -> Optional[str]:
+        """
+        Jouer une étape hors de la boucle d'événements (pool de threads par défaut)
+
+        Returns:
+            Texte à envoyer, None si la scène a levé une exception (journalisée)
+        """
+        try:
+            return await asyncio.get_running_loop().run_in_executor(None, action, *args)
+        except Exception:
+            logger.exception("Session %d (%s): erreur pendant une étape", session.session_id, session.scenario_id)
+            return None
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Une connexion = une partie"""
+        async def send(text: str):
+            writer.write(text.encode('utf-8'))
+            await writer.drain()
+
+        session = None
+        try:
+            await send(self.welcome())
+            scenario_ids = self.scenario_ids()
+            while session is None:
+                line = await self._readline(reader)
+                if line is None:
+                    return
+                try:
+                    scenario_id = scenario_ids[int(line) - 1]
+                    session = self.create_session(scenario_id)
+                except (ValueError, IndexError):
+                    await send(f"Veuillez entrer un nombre entre 1 et {len(scenario_ids)}" + PROMPT_MARK)
+                except RuntimeError as e:
+                    await send(f"❌ {e}\n")
+                    return
+
+            text = await self._step(session, session.start)
+            while text is not None:
+                await send(text)
+                if session.finished:
+                    return
+                line = await self._readline(reader)
+                if line is None:
+                    return
+                text = await self._step(session, session.handle, line)
+            await send(SESSION_ERROR)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if session is not None:
+                self.close_session(session)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> asyncio.AbstractServer:
+        """Ouvrir le socket d'écoute (port 0: port libre choisi par le système)"""
+        # File d'attente à la taille du serveur: afflux de connexions simultanées
+        return await asyncio.start_server(self.handle_client, host, port, backlog=self.max_sessions)
+
+    async def serve_forever(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        server = await self.start(host, port)
+        address = server.sockets[0].getsockname()
+        print(f"🎲 Serveur de parties en écoute sur {address[0]}:{address[1]}")
+        async with server:
+            await server.serve_forever()
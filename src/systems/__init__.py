@@ -4,6 +4,17 @@ Game systems module
 
 from .merchant import MerchantSystem, MerchantStock
 from .spellcasting_v2 import SpellcastingManager
+from .combat_simulator import CombatSimulator, SimulationStats
+from .parallel_simulator import ParallelCombatSimulator
+from .combat_events import CombatEvent, CombatEventStream, CombatEventType, ConsoleSink
+from .combat_replay import CombatReplay, ReplayError, record_fight
+from .conditions import ConditionEngine, StatusEffect
+from .scenario_explorer import ExplorationReport, ScenarioExplorer
 
-__all__ = ['MerchantSystem', 'MerchantStock', 'SpellcastingManager']
+__all__ = ['MerchantSystem', 'MerchantStock', 'SpellcastingManager',
+           'CombatSimulator', 'SimulationStats', 'ParallelCombatSimulator',
+           'CombatEvent', 'CombatEventStream', 'CombatEventType', 'ConsoleSink',
+           'CombatReplay', 'ReplayError', 'record_fight',
+           'ConditionEngine', 'StatusEffect',
+           'ExplorationReport', 'ScenarioExplorer']
 
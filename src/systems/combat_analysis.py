@@ -0,0 +1,215 @@
+"""
+Combat Analysis - Évaluation analytique des rencontres (sans simulation)
+Probabilités de toucher, distributions exactes des dommages par attaque et
+par round, dommages moyens et nombre de rounds pour tuer une cible
+
+Reprend les règles d'EnhancedCombatSystem (personnages: 1 naturel = échec,
+20 naturel = critique) et de dnd_5e_core (monstres: pas de critique)
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from dnd_5e_core.combat import ActionType
+
+from ..core.dice_distribution import Distribution, dice_distribution
+from .enhanced_combat import EnhancedCombatSystem
+
+
+# Distance d'attaque utilisée par dnd_5e_core pour les monstres
+MELEE_DISTANCE = 5.0
+
+
+def _d20_faces(advantage: bool = False, disadvantage: bool = False) -> List[float]:
+    """P(face = k) pour k = 1..20 (avantage / désavantage inclus)"""
+    if advantage == disadvantage:
+        return [1 / 20] * 20
+    if advantage:
+        return [(k * k - (k - 1) ** 2) / 400 for k in range(1, 21)]
+    return [((21 - k) ** 2 - (20 - k) ** 2) / 400 for k in range(1, 21)]
+
+
+@lru_cache(maxsize=None)
+def hit_chances(attack_bonus: int, armor_class: int, natural_rolls: bool = True,
+                advantage: bool = False, disadvantage: bool = False) -> Tuple[float, float]:
+    """
+    Probabilités d'une attaque contre une CA
+
+    Args:
+        natural_rolls: Règles des personnages (1 = échec, 20 = critique);
+                       False pour les monstres de dnd_5e_core (jet + bonus >= CA)
+
+    Returns:
+        (P(touché sans critique), P(critique))
+    """
+    hit = crit = 0.0
+    for face, p in enumerate(_d20_faces(advantage, disadvantage), start=1):
+        if natural_rolls and face == 20:
+            crit += p
+        elif natural_rolls and face == 1:
+            continue
+        elif face + attack_bonus >= armor_class:
+            hit += p
+    return hit, crit
+
+
+def hit_probability(attack_bonus: int, armor_class: int, natural_rolls: bool = True,
+                    advantage: bool = False, disadvantage: bool = False) -> float:
+    """P(toucher) critiques compris"""
+    return sum(hit_chances(attack_bonus, armor_class, natural_rolls, advantage, disadvantage))
+
+
+@lru_cache(maxsize=None)
+def attack_distribution(expression: str, bonus: int, armor_class: int, attack_bonus: int,
+                        natural_rolls: bool = True, disadvantage: bool = False,
+                        minimum_damage: int = 0) -> Distribution:
+    """
+    Distribution exacte des dommages d'une attaque (0 si ratée)
+    Mise en cache par (expression, bonus, CA, bonus d'attaque, règles)
+    """
+    hit, crit = hit_chances(attack_bonus, armor_class, natural_rolls, disadvantage=disadvantage)
+    damage = dice_distribution(expression, bonus).clamp_min(minimum_damage)
+    weighted = [(1 - hit - crit, Distribution.constant(0)), (hit, damage)]
+    if crit:
+        # Coup critique: total des dommages doublé (EnhancedCombatSystem)
+        weighted.append((crit, damage.scale(2)))
+    return Distribution.mixture(weighted)
+
+
+# Personnages
+
+def character_attack_distribution(character, armor_class: int) -> Distribution:
+    """Dommages d'un tour d'attaque d'un personnage (profil d'EnhancedCombatSystem)"""
+    attack_bonus, damage_dice, ability_mod = EnhancedCombatSystem.get_attack_profile(character)
+    return attack_distribution(damage_dice, ability_mod, armor_class, attack_bonus,
+                               natural_rolls=True, minimum_damage=1)
+
+
+# Monstres
+
+def _attack_damage(attack, armor_class: int) -> Distribution:
+    """Dommages d'une attaque de monstre (somme de ses groupes de dommages)"""
+    disadvantage = attack.type != ActionType.MELEE and MELEE_DISTANCE > attack.normal_range
+    hit, _ = hit_chances(attack.attack_bonus, armor_class, natural_rolls=False, disadvantage=disadvantage)
+    damage = Distribution.constant(0)
+    for dmg in attack.damages or []:
+        # DamageDice.roll() ne descend jamais sous 0
+        damage = damage + dice_distribution(dmg.dd.dice, dmg.dd.bonus).clamp_min(0)
+    return Distribution.mixture([(1 - hit, Distribution.constant(0)), (hit, damage)])
+
+
+def monster_round_distribution(monster, armor_class: int) -> Distribution:
+    """
+    Dommages d'un tour de monstre contre une CA
+    Action de mêlée choisie uniformément (comme CombatSystem._monster_normal_attack),
+    attaque de secours 1d8 sans jet si le monstre n'en a aucune
+    """
+    actions = [a for a in getattr(monster, 'actions', None) or []
+               if getattr(a, 'type', None) in (ActionType.MELEE, ActionType.MIXED)]
+    if not actions:
+        return dice_distribution("1d8")
+
+    choices = []
+    for action in actions:
+        damage = Distribution.constant(0)
+        for attack in action.multi_attack or [action]:
+            if hasattr(attack, 'attack_bonus'):
+                damage = damage + _attack_damage(attack, armor_class)
+        choices.append(damage)
+    return Distribution.mixture((1 / len(choices), d) for d in choices)
+
+
+# Rounds pour tuer
+
+def kill_probabilities(round_damage: Distribution, hit_points: int, max_rounds: int = 100) -> List[float]:
+    """
+    P(cible morte à la fin du round n) pour n = 1..max_rounds
+    Chaîne absorbante sur les dommages cumulés (< hit_points = vivante)
+    """
+    if hit_points <= 0:
+        return [1.0] * max_rounds
+
+    alive = [0.0] * hit_points
+    alive[0] = 1.0
+    steps = [(value, p) for value, p in round_damage.items() if p]
+    result = []
+    for _ in range(max_rounds):
+        following = [0.0] * hit_points
+        for taken, p in enumerate(alive):
+            if p:
+                for value, q in steps:
+                    total = max(0, taken + value)
+                    if total < hit_points:
+                        following[total] += p * q
+        alive = following
+        result.append(1.0 - sum(alive))
+    return result
+
+
+def expected_rounds_to_kill(round_damage: Distribution, hit_points: int, max_rounds: int = 100) -> float:
+    """
+    Espérance du nombre de rounds pour tuer la cible
+    (sum des P(vivante après n rounds), tronquée à max_rounds)
+    """
+    return 1.0 + sum(1.0 - p for p in kill_probabilities(round_damage, hit_points, max_rounds)[:-1])
+
+
+@dataclass
+class EncounterAnalysis:
+    """Évaluation analytique d'une rencontre groupe contre monstres"""
+    party_damage: Dict[str, float] = field(default_factory=dict)     # dommages/round du groupe par monstre
+    rounds_to_kill: Dict[str, float] = field(default_factory=dict)   # rounds pour tuer chaque monstre
+    monster_damage: Dict[str, float] = field(default_factory=dict)   # dommages/round de chaque monstre
+    party_hit_points: int = 0
+
+    @property
+    def rounds_to_clear(self) -> float:
+        """Rounds pour éliminer tous les monstres (attaque concentrée, un à la fois)"""
+        return sum(self.rounds_to_kill.values())
+
+    @property
+    def incoming_damage(self) -> float:
+        """Dommages subis par le groupe pendant le combat (monstres éliminés un à un)"""
+        total = 0.0
+        remaining = sum(self.monster_damage.values())
+        for key, rounds in self.rounds_to_kill.items():
+            total += remaining * rounds
+            remaining -= self.monster_damage.get(key, 0.0)
+        return total
+
+    @property
+    def damage_ratio(self) -> float:
+        """Dommages subis / HP du groupe (> 1 = combat mortel en moyenne)"""
+        if not self.party_hit_points:
+            return 0.0
+        return self.incoming_damage / self.party_hit_points
+
+    def summary(self) -> str:
+        lines = [f"  Rounds pour vaincre: {self.rounds_to_clear:.2f}",
+                 f"  Dommages subis: {self.incoming_damage:.1f} / {self.party_hit_points} HP "
+                 f"({self.damage_ratio:.0%})"]
+        for key, rounds in self.rounds_to_kill.items():
+            lines.append(f"    {key}: groupe {self.party_damage[key]:.1f} dmg/round, "
+                         f"mort en {rounds:.2f} rounds, inflige {self.monster_damage[key]:.1f} dmg/round")
+        return '\n'.join(lines)
+
+
+def analyze_encounter(party: List, monsters: List, max_rounds: int = 100) -> EncounterAnalysis:
+    """
+    Évaluer une rencontre sans simulation
+    Le groupe concentre ses attaques sur un monstre à la fois (comme le ciblage
+    du plus faible d'EnhancedCombatSystem); les monstres visent la CA moyenne du groupe
+    """
+    analysis = EncounterAnalysis(party_hit_points=sum(c.hit_points for c in party))
+    party_ac = round(sum(c.armor_class for c in party) / len(party)) if party else 10
+
+    for index, monster in enumerate(sorted(monsters, key=lambda m: m.hit_points)):
+        key = f"{monster.name} #{index + 1}"
+        monster_ac = getattr(monster, 'armor_class', 12)
+        round_damage = sum((character_attack_distribution(c, monster_ac) for c in party),
+                           Distribution.constant(0))
+        analysis.party_damage[key] = round_damage.mean
+        analysis.rounds_to_kill[key] = expected_rounds_to_kill(round_damage, monster.hit_points, max_rounds)
+        analysis.monster_damage[key] = monster_round_distribution(monster, party_ac).mean
+    return analysis
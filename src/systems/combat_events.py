@@ -0,0 +1,164 @@
+"""
+Combat Events - Flux d'événements de combat typés
+Les événements (attaque, touché, raté, critique, dommages, mort, soin) sont
+stockés bruts dans un tampon circulaire borné; le texte n'est produit que
+si un sink console est branché (aucun formatage en simulation headless)
+"""
+
+from collections import Counter, deque
+from enum import Enum
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple
+
+
+class CombatEventType(Enum):
+    ROUND = "round"
+    ATTACK = "attack"
+    HIT = "hit"
+    MISS = "miss"
+    CRIT = "crit"
+    DAMAGE = "damage"
+    DEATH = "death"
+    HEAL = "heal"
+    MESSAGE = "message"  # Texte déjà formaté (messages de dnd_5e_core)
+
+
+class CombatEvent(NamedTuple):
+    """Événement brut (références aux combattants, aucun texte)"""
+    type: CombatEventType
+    round: int
+    actor: object = None
+    target: object = None
+    value: int = 0        # Dommages, soins
+    roll: int = 0         # Jet de d20
+    bonus: int = 0        # Bonus d'attaque
+    armor_class: int = 0  # CA de la cible
+
+
+def _name(combatant) -> str:
+    name = getattr(combatant, 'name', combatant)
+    return str(name)
+
+
+def _title(combatant) -> str:
+    return _name(combatant).title()
+
+
+def _attack_detail(event: CombatEvent) -> str:
+    return f"(jet: {event.roll}+{event.bonus}={event.roll + event.bonus} vs CA {event.armor_class})"
+
+
+def _format_round(event: CombatEvent) -> str:
+    return f"\n{'─' * 60}\n  TOUR {event.round}\n{'─' * 60}\n"
+
+
+def _format_miss(event: CombatEvent) -> str:
+    if event.roll == 1:
+        return "❌ ÉCHEC CRITIQUE! (jet: 1)"
+    return f"❌ Raté! {_attack_detail(event)}"
+
+
+# Formatage par type (appelé uniquement par les sinks texte)
+FORMATTERS: Dict[CombatEventType, Callable[[CombatEvent], str]] = {
+    CombatEventType.ROUND: _format_round,
+    CombatEventType.ATTACK: lambda e: f"⚔️  {_name(e.actor)} attaque {_title(e.target)}!",
+    CombatEventType.HIT: lambda e: f"✅ Touché! {_attack_detail(e)}",
+    CombatEventType.MISS: _format_miss,
+    CombatEventType.CRIT: lambda e: f"🎯 COUP CRITIQUE! (jet: {e.roll})",
+    CombatEventType.DAMAGE: lambda e: f"💥 {_name(e.actor)} inflige {e.value} dommages!",
+    CombatEventType.DEATH: lambda e: f"💀 {_title(e.target)} est MORT!",
+    CombatEventType.HEAL: lambda e: f"💚 {_name(e.target)} récupère {e.value} HP",
+    CombatEventType.MESSAGE: lambda e: e.actor,
+}
+
+
+def format_event(event: CombatEvent) -> str:
+    """Texte français d'un événement"""
+    return FORMATTERS[event.type](event)
+
+
+class ConsoleSink:
+    """Sink texte: formate chaque événement et l'envoie à `write` (print par défaut)"""
+
+    def __init__(self, write: Callable[[str], None] = print, skip: Iterable[CombatEventType] = ()):
+        """
+        Args:
+            write: Fonction d'écriture d'une ligne
+            skip: Types d'événements à ne pas afficher
+        """
+        self.write = write
+        self.skip = frozenset(skip)
+
+    def __call__(self, event: CombatEvent):
+        if event.type not in self.skip:
+            self.write(format_event(event))
+
+
+class CombatEventStream:
+    """
+    Flux d'événements d'un système de combat
+    Tampon circulaire borné + sinks optionnels appelés à chaque événement
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Args:
+            capacity: Nombre d'événements conservés (0 = aucun, sinks seulement)
+        """
+        self.buffer = deque(maxlen=capacity)
+        self.sinks: List[Callable[[CombatEvent], None]] = []
+        self.round = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.buffer.maxlen
+
+    def attach(self, sink: Callable[[CombatEvent], None]):
+        self.sinks.append(sink)
+
+    def detach(self, sink: Callable[[CombatEvent], None]):
+        if sink in self.sinks:
+            self.sinks.remove(sink)
+
+    @property
+    def has_sinks(self) -> bool:
+        return bool(self.sinks)
+
+    def emit(self, event_type: CombatEventType, actor=None, target=None,
+             value: int = 0, roll: int = 0, bonus: int = 0, armor_class: int = 0):
+        """Enregistrer un événement (et le transmettre aux sinks)"""
+        if not self.sinks and not self.buffer.maxlen:
+            return
+        event = CombatEvent(event_type, self.round, actor, target, value, roll, bonus, armor_class)
+        self.buffer.append(event)
+        for sink in self.sinks:
+            sink(event)
+
+    def begin_round(self, round_num: int):
+        self.round = round_num
+        self.emit(CombatEventType.ROUND)
+
+    def clear(self):
+        self.buffer.clear()
+        self.round = 0
+
+    def __iter__(self) -> Iterator[CombatEvent]:
+        return iter(self.buffer)
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def of_type(self, event_type: CombatEventType) -> List[CombatEvent]:
+        return [e for e in self.buffer if e.type is event_type]
+
+    def counts(self) -> Counter:
+        """Nombre d'événements par type (dans la fenêtre du tampon)"""
+        return Counter(e.type for e in self.buffer)
+
+    def total(self, event_type: CombatEventType, actor=None) -> int:
+        """Somme des valeurs (dommages, soins) d'un type, éventuellement pour un acteur"""
+        return sum(e.value for e in self.buffer
+                   if e.type is event_type and (actor is None or e.actor is actor))
+
+    def lines(self) -> List[str]:
+        """Texte de tous les événements du tampon (formatage à la demande)"""
+        return [format_event(e) for e in self.buffer]
@@ -0,0 +1,512 @@
+"""
+Combat Replay - Enregistrement binaire compact et relecture des combats
+Chaque tirage aléatoire (jets, choix) et les événements clés (attaques,
+dommages, morts, soins) sont encodés en varints; la relecture rejoue le
+combat dans EnhancedCombatSystem sans aucun générateur aléatoire
+
+Format: en-tête b'DR' + version, taille du groupe, nombre de monstres,
+rounds maximum et options du combat (initiative, trésors, conditions), puis
+enregistrements étiquetés
+    varint((charge << 2) | genre)
+    genre 0 = jet (valeur), 1 = choix (index), 2 = événement (code, puis
+    acteur, cible, valeur), 3 = flottant (8 octets)
+Le dernier enregistrement est l'issue du combat (événement OUTCOME_CODE)
+"""
+
+import random
+import struct
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ..core.rng import GameRNG
+from .combat_events import CombatEvent, CombatEventType
+from .combat_simulator import FightResult, run_combat_loop
+from .conditions import ConditionEngine
+from .enhanced_combat import EnhancedCombatSystem
+
+
+MAGIC = b'DR'
+VERSION = 2
+
+ROLL, CHOICE, EVENT, FLOAT = range(4)
+
+# Événements archivés (les autres se déduisent des jets)
+RECORDED_EVENTS = (CombatEventType.ROUND, CombatEventType.ATTACK, CombatEventType.DAMAGE,
+                   CombatEventType.DEATH, CombatEventType.HEAL)
+EVENT_CODES = {event_type: code for code, event_type in enumerate(RECORDED_EVENTS)}
+# Issue du combat (valeur: 1 = victoire, un personnage est encore debout)
+OUTCOME_CODE = len(RECORDED_EVENTS)
+
+# Options du combat enregistrées dans l'en-tête
+OPTION_INITIATIVE, OPTION_TREASURE, OPTION_CONDITIONS = 1, 2, 4
+
+# Fonctions du module random utilisées par dnd_5e_core
+LIBRARY_RANDOM_FUNCTIONS = ('randint', 'choice', 'sample', 'shuffle', 'random', 'uniform')
+
+
+class ReplayError(Exception):
+    """Journal illisible ou relecture désynchronisée"""
+    pass
+
+
+# Varints
+
+def write_varint(buffer: bytearray, value: int):
+    """Entier positif en varint (7 bits par octet)"""
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data: bytes, position: int) -> Tuple[int, int]:
+    """Lire un varint; retourne (valeur, position suivante)"""
+    result = shift = 0
+    while True:
+        if position >= len(data):
+            raise ReplayError("Journal tronqué")
+        byte = data[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+# Aléatoire de dnd_5e_core
+
+class _ActiveRNG(threading.local):
+    """Générateur actif du thread courant (None: fonctions d'origine du module random)"""
+    rng: Optional[GameRNG] = None
+
+
+_active = _ActiveRNG()
+_ORIGINALS = {name: getattr(random, name) for name in LIBRARY_RANDOM_FUNCTIONS}
+_DISPATCH_MODULES = 0   # Taille de sys.modules au dernier branchement
+
+
+def _redirected(name: str, rng: GameRNG) -> Callable:
+    if name == 'uniform':
+        return lambda a, b: a + (b - a) * rng.random()
+    return getattr(rng, name)
+
+
+def _make_dispatcher(name: str) -> Callable:
+    original = _ORIGINALS[name]
+
+    def dispatch(*args, **kwargs):
+        rng = _active.rng
+        if rng is None:
+            return original(*args, **kwargs)
+        return _redirected(name, rng)(*args, **kwargs)
+
+    dispatch.__name__ = dispatch.__qualname__ = name
+    dispatch.__doc__ = original.__doc__
+    return dispatch
+
+
+_DISPATCHERS = {name: _make_dispatcher(name) for name in LIBRARY_RANDOM_FUNCTIONS}
+
+
+def _install_dispatchers():
+    """
+    Brancher les aiguillages dans random et les modules dnd_5e_core (une seule fois;
+    nouveau parcours seulement si des modules ont été importés depuis)
+    """
+    global _DISPATCH_MODULES
+    if len(sys.modules) == _DISPATCH_MODULES:
+        return
+    for name, dispatcher in _DISPATCHERS.items():
+        setattr(random, name, dispatcher)
+    for module_name, module in list(sys.modules.items()):
+        if not module_name.startswith('dnd_5e_core') or module is None:
+            continue
+        for name, original in _ORIGINALS.items():
+            if getattr(module, name, None) is original:
+                setattr(module, name, _DISPATCHERS[name])
+    _DISPATCH_MODULES = len(sys.modules)
+
+
+@contextmanager
+def library_random(rng: GameRNG):
+    """
+    Rediriger le module random (utilisé par dnd_5e_core) vers `rng`, pour le thread courant
+    Couvre random.X, les imports locaux et les `from random import X` des modules dnd_5e_core:
+    des aiguillages y sont branchés une fois pour toutes; hors de ce contexte (ou dans un
+    autre thread) ils appellent les fonctions d'origine
+    """
+    _install_dispatchers()
+    previous, _active.rng = _active.rng, rng
+    try:
+        yield rng
+    finally:
+        _active.rng = previous
+
+
+# Enregistrement
+
+class RecordingRNG(GameRNG):
+    """GameRNG qui tire dans `source` et journalise chaque résultat consommé"""
+
+    def __init__(self, source: GameRNG, buffer: bytearray):
+        self.source = source
+        self.seed = source.seed
+        self.buffer_size = source.buffer_size
+        self.log = buffer
+
+    def _record(self, kind: int, payload: int):
+        write_varint(self.log, (payload << 2) | kind)
+
+    def spawn(self, key) -> GameRNG:
+        return self.source.spawn(key)
+
+    def rolls(self, sides: int, count: int) -> List[int]:
+        values = self.source.rolls(sides, count)
+        for value in values:
+            self._record(ROLL, value)
+        return values
+
+    def roll_die(self, sides: int) -> int:
+        value = self.source.roll_die(sides)
+        self._record(ROLL, value)
+        return value
+
+    def randint(self, a: int, b: int) -> int:
+        value = self.source.randint(a, b)
+        self._record(ROLL, value - a)
+        return value
+
+    def getrandbits(self, k: int) -> int:
+        value = self.source.getrandbits(k)
+        self._record(ROLL, value)
+        return value
+
+    def random(self) -> float:
+        value = self.source.random()
+        self._record(FLOAT, 0)
+        self.log.extend(struct.pack('<d', value))
+        return value
+
+    def choice(self, seq: Sequence):
+        index = self.source.randint(0, len(seq) - 1)
+        self._record(CHOICE, index)
+        return seq[index]
+
+    def sample(self, population: Sequence, k: int) -> List:
+        indices = self.source.sample(range(len(population)), k)
+        for index in indices:
+            self._record(CHOICE, index)
+        return [population[i] for i in indices]
+
+    def shuffle(self, seq: List):
+        for i in reversed(range(1, len(seq))):
+            j = self.source.randint(0, i)
+            self._record(CHOICE, j)
+            seq[i], seq[j] = seq[j], seq[i]
+
+
+class CombatRecorder:
+    """
+    Enregistre un combat: tirages aléatoires + événements avec identifiants
+    Identifiants: personnages 0..n-1 (ordre du groupe), monstres n.. (ordre des ennemis)
+    """
+
+    def __init__(self, party: List, enemies: List, max_rounds: int = 50, options: int = 0):
+        self.buffer = bytearray(MAGIC)
+        self.buffer.append(VERSION)
+        self.ids: Dict[int, int] = {}
+        for combatant in list(party) + list(enemies):
+            self.ids[id(combatant)] = len(self.ids)
+            template = getattr(combatant, 'template', None)
+            if template is not None:
+                # Hordes: les événements désignent le modèle
+                self.ids[id(template)] = self.ids[id(combatant)]
+        write_varint(self.buffer, len(party))
+        write_varint(self.buffer, sum(getattr(e, 'count', 1) for e in enemies))
+        write_varint(self.buffer, max_rounds)
+        write_varint(self.buffer, options)
+
+    def _id(self, combatant) -> int:
+        """Identifiant + 1 (0 = aucun)"""
+        if combatant is None:
+            return 0
+        return self.ids.get(id(combatant), -1) + 1
+
+    def __call__(self, event: CombatEvent):
+        """Sink du flux d'événements"""
+        code = EVENT_CODES.get(event.type)
+        if code is None:
+            return
+        write_varint(self.buffer, (code << 2) | EVENT)
+        write_varint(self.buffer, self._id(event.actor))
+        write_varint(self.buffer, self._id(event.target))
+        write_varint(self.buffer, _zigzag(event.value))
+
+    def finish(self, result: FightResult):
+        """Enregistrer l'issue du combat (même définition que FightResult.victory)"""
+        write_varint(self.buffer, (OUTCOME_CODE << 2) | EVENT)
+        write_varint(self.buffer, 0)
+        write_varint(self.buffer, 0)
+        write_varint(self.buffer, _zigzag(int(result.victory)))
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.buffer)
+
+
+def record_fight(combat_system: EnhancedCombatSystem, party: List, enemies: List,
+                 weapons: Optional[List] = None, armors: Optional[List] = None,
+                 equipments: Optional[List] = None, potions: Optional[List] = None,
+                 max_rounds: int = 50, on_round=None, initiative: bool = False,
+                 conditions: Optional[ConditionEngine] = None) -> Tuple[FightResult, bytes]:
+    """
+    Jouer un combat (run_combat_loop) en l'enregistrant
+    Les options du combat (initiative, trésors, conditions) sont notées dans
+    l'en-tête: CombatReplay.play les reprend ou exige les mêmes trésors
+
+    Returns:
+        (FightResult, journal binaire)
+    """
+    options = _options(initiative, (weapons, armors, equipments, potions), conditions)
+    recorder = CombatRecorder(party, enemies, max_rounds, options)
+    source = combat_system.rng
+    rng = RecordingRNG(source, recorder.buffer)
+
+    combat_system.rng = rng
+    combat_system.events.attach(recorder)
+    try:
+        with library_random(rng):
+            result = run_combat_loop(combat_system, party, enemies, weapons, armors, equipments,
+                                     potions, max_rounds, on_round, initiative=initiative,
+                                     conditions=conditions)
+    finally:
+        combat_system.rng = source
+        combat_system.events.detach(recorder)
+    recorder.finish(result)
+    return result, recorder.to_bytes()
+
+
+def _options(initiative: bool, treasure: Sequence[Optional[List]], conditions) -> int:
+    """Masque d'options de l'en-tête"""
+    options = OPTION_INITIATIVE if initiative else 0
+    if any(items is not None for items in treasure):
+        options |= OPTION_TREASURE
+    if conditions is not None:
+        options |= OPTION_CONDITIONS
+    return options
+
+
+# Relecture
+
+class ReplayRNG(GameRNG):
+    """Générateur sans hasard: restitue les tirages d'un journal dans l'ordre"""
+
+    def __init__(self, replay: 'CombatReplay'):
+        self.seed = None
+        self.buffer_size = 0
+        self.data = replay.data
+        self.position = replay.body_start
+
+    def _next(self, expected: int) -> int:
+        data = self.data
+        while True:
+            tag, self.position = read_varint(data, self.position)
+            kind = tag & 3
+            if kind == EVENT:
+                # Événements: ignorés par le générateur (vérifiés par le lecteur)
+                for _ in range(3):
+                    _, self.position = read_varint(data, self.position)
+                continue
+            if kind != expected:
+                raise ReplayError(f"Relecture désynchronisée (attendu {expected}, lu {kind})")
+            return tag >> 2
+
+    def spawn(self, key) -> GameRNG:
+        raise ReplayError("Sous-flux indisponible pendant une relecture")
+
+    def reseed(self, seed: Optional[int]):
+        pass
+
+    def rolls(self, sides: int, count: int) -> List[int]:
+        return [self._next(ROLL) for _ in range(count)]
+
+    def roll_die(self, sides: int) -> int:
+        return self._next(ROLL)
+
+    def randint(self, a: int, b: int) -> int:
+        return a + self._next(ROLL)
+
+    def getrandbits(self, k: int) -> int:
+        return self._next(ROLL)
+
+    def random(self) -> float:
+        self._next(FLOAT)
+        value, = struct.unpack_from('<d', self.data, self.position)
+        self.position += 8
+        return value
+
+    def choice(self, seq: Sequence):
+        return seq[self._next(CHOICE)]
+
+    def sample(self, population: Sequence, k: int) -> List:
+        return [population[self._next(CHOICE)] for _ in range(k)]
+
+    def shuffle(self, seq: List):
+        for i in reversed(range(1, len(seq))):
+            j = self._next(CHOICE)
+            seq[i], seq[j] = seq[j], seq[i]
+
+
+class CombatReplay:
+    """Lecteur d'un journal de combat"""
+
+    def __init__(self, data: bytes):
+        if data[:2] != MAGIC:
+            raise ReplayError("Journal de combat invalide")
+        if data[2] != VERSION:
+            raise ReplayError(f"Version de journal non supportée: {data[2]}")
+        self.data = data
+        position = 3
+        self.party_size, position = read_varint(data, position)
+        self.monster_count, position = read_varint(data, position)
+        self.max_rounds, position = read_varint(data, position)
+        options, position = read_varint(data, position)
+        self.initiative = bool(options & OPTION_INITIATIVE)
+        self.has_treasure = bool(options & OPTION_TREASURE)
+        self.has_conditions = bool(options & OPTION_CONDITIONS)
+        self.body_start = position
+
+    def _scan(self) -> Tuple[List[Tuple[CombatEventType, Optional[int], Optional[int], int]], Optional[bool]]:
+        """Événements archivés et issue enregistrée (None si le journal n'a pas d'issue)"""
+        data = self.data
+        position = self.body_start
+        events = []
+        victory = None
+        while position < len(data):
+            tag, position = read_varint(data, position)
+            kind = tag & 3
+            if kind == EVENT:
+                actor, position = read_varint(data, position)
+                target, position = read_varint(data, position)
+                value, position = read_varint(data, position)
+                if tag >> 2 == OUTCOME_CODE:
+                    victory = bool(_unzigzag(value))
+                    continue
+                events.append((RECORDED_EVENTS[tag >> 2], actor - 1 if actor else None,
+                               target - 1 if target else None, _unzigzag(value)))
+            elif kind == FLOAT:
+                position += 8
+        return events, victory
+
+    def events(self) -> List[Tuple[CombatEventType, Optional[int], Optional[int], int]]:
+        """Événements archivés: (type, id acteur, id cible, valeur) - sans rejouer le combat"""
+        return self._scan()[0]
+
+    @property
+    def victory(self) -> Optional[bool]:
+        """Issue enregistrée (FightResult.victory: un personnage est encore debout)"""
+        return self._scan()[1]
+
+    def summary(self) -> Dict:
+        """Issue du combat (rounds, victoire enregistrée, morts, dommages par acteur) sans le rejouer"""
+        events, victory = self._scan()
+        rounds = 0
+        deaths: List[int] = []
+        damage: Dict[int, int] = {}
+        for event_type, actor, target, value in events:
+            if event_type is CombatEventType.ROUND:
+                rounds += 1
+            elif event_type is CombatEventType.DEATH:
+                deaths.append(target)
+            elif event_type is CombatEventType.DAMAGE:
+                damage[actor] = damage.get(actor, 0) + value
+        return {
+            'rounds': rounds,
+            'victory': victory,
+            'dead_characters': sorted({t for t in deaths if t < self.party_size}),
+            'damage': damage,
+        }
+
+    def play(self, party: List, enemies: List, combat_system: Optional[EnhancedCombatSystem] = None,
+             weapons: Optional[List] = None, armors: Optional[List] = None,
+             equipments: Optional[List] = None, potions: Optional[List] = None,
+             conditions: Optional[ConditionEngine] = None, verify: bool = True) -> FightResult:
+        """
+        Rejouer le combat dans EnhancedCombatSystem (sans hasard)
+        L'ordre d'initiative est repris de l'en-tête
+
+        Args:
+            party, enemies: État initial identique à celui de l'enregistrement
+            combat_system: Système de combat (EnhancedCombatSystem silencieux par défaut)
+            weapons, armors, equipments, potions: Trésors de l'enregistrement
+            conditions: Moteur d'effets (nouveau moteur par défaut si l'enregistrement en avait un)
+            verify: Comparer les événements et l'issue rejoués à l'enregistrement
+
+        Raises:
+            ReplayError: Relecture désynchronisée ou trésors manquants
+        """
+        treasure = (weapons, armors, equipments, potions)
+        if self.has_treasure and all(items is None for items in treasure):
+            raise ReplayError("Combat enregistré avec trésors: weapons/armors/equipments/potions requis")
+        if self.has_conditions and conditions is None:
+            conditions = ConditionEngine()
+        rng = ReplayRNG(self)
+        if combat_system is None:
+            combat_system = EnhancedCombatSystem(verbose=False)
+        checker = CombatRecorder(party, enemies, self.max_rounds,
+                                 _options(self.initiative, treasure, conditions))
+        source = combat_system.rng
+        combat_system.rng = rng
+        if verify:
+            combat_system.events.attach(checker)
+        try:
+            with library_random(rng):
+                result = run_combat_loop(combat_system, party, enemies, weapons, armors, equipments,
+                                         potions, max_rounds=self.max_rounds, initiative=self.initiative,
+                                         conditions=conditions)
+        finally:
+            combat_system.rng = source
+            combat_system.events.detach(checker)
+
+        if verify:
+            events, victory = self._scan()
+            if CombatReplay(checker.to_bytes()).events() != events:
+                raise ReplayError("Les événements rejoués diffèrent de l'enregistrement")
+            if victory is not None and victory != result.victory:
+                raise ReplayError("L'issue rejouée diffère de l'enregistrement")
+        return result
+
+
+# Archives (millions de combats)
+
+def write_replays(path: str, replays: Iterable[bytes]) -> int:
+    """Écrire des journaux dans un fichier (préfixe de longueur varint); retourne le nombre écrit"""
+    count = 0
+    with open(path, 'wb') as f:
+        for data in replays:
+            header = bytearray()
+            write_varint(header, len(data))
+            f.write(header)
+            f.write(data)
+            count += 1
+    return count
+
+
+def read_replays(path: str) -> Iterator[CombatReplay]:
+    """Lire les journaux d'un fichier d'archive"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    position = 0
+    while position < len(data):
+        length, position = read_varint(data, position)
+        yield CombatReplay(data[position:position + length])
+        position += length
@@ -0,0 +1,138 @@
+"""
+Combat Roster - Combattants vivants et formation (ligne de front / arrière)
+Mises à jour en temps constant: un round coûte O(n) au lieu de O(n²)
+"""
+
+from typing import Callable, Iterable, List, Optional
+
+
+class RosterList(list):
+    """
+    Vue liste d'un groupe du roster, passée telle quelle à CombatSystem
+    Mise à jour sur place: retrait O(1) par permutation avec le dernier
+    élément (l'ordre des survivants n'est pas conservé), appartenance
+    testée en O(1) par une table id -> position
+
+    Les retraits faits par le système de combat (list.remove) sont
+    répercutés au roster; les autres mutations de liste ne sont pas suivies
+    """
+
+    def __init__(self, members: Iterable = (), on_remove: Optional[Callable[[object], None]] = None):
+        super().__init__(members)
+        self._index = {id(member): position for position, member in enumerate(self)}
+        self._on_remove = on_remove
+
+    def __contains__(self, item) -> bool:
+        return id(item) in self._index
+
+    def append(self, item):
+        if id(item) not in self._index:
+            self._index[id(item)] = len(self)
+            super().append(item)
+
+    def discard(self, item) -> bool:
+        """Retirer un membre en O(1); retourne False s'il était absent"""
+        position = self._index.pop(id(item), None)
+        if position is None:
+            return False
+        last = super().pop()
+        if position < len(self):
+            self[position] = last
+            self._index[id(last)] = position
+        return True
+
+    def remove(self, item):
+        if id(item) not in self._index:
+            raise ValueError("RosterList.remove(x): x not in list")
+        if self._on_remove is None:
+            self.discard(item)
+        else:
+            self._on_remove(item)
+
+
+class CombatRoster:
+    """
+    Combattants vivants d'un combat
+    L'ordre du groupe définit la formation: les FRONT_LINE_SIZE premiers
+    personnages forment la ligne de front, les autres la ligne arrière
+    """
+
+    FRONT_LINE_SIZE = 3
+
+    def __init__(self, party: List, enemies: Iterable, front_line_size: Optional[int] = None):
+        self.party = party
+        self.front_line_size = self.FRONT_LINE_SIZE if front_line_size is None else front_line_size
+
+        # Vues persistantes, tenues à jour sur place à chaque décès ou renfort
+        self._front = RosterList(on_remove=self.kill)
+        self._back = RosterList(on_remove=self.kill)
+        self._characters = RosterList(on_remove=self.kill)
+        self._monsters = RosterList(enemies, on_remove=self.kill)
+
+        for position, char in enumerate(party):
+            if char.hit_points <= 0:
+                continue
+            self._characters.append(char)
+            line = self._front if position < self.front_line_size else self._back
+            line.append(char)
+
+    def __repr__(self):
+        return (f"CombatRoster({len(self._characters)} personnages "
+                f"[{len(self._front)} front/{len(self._back)} arrière], {len(self._monsters)} monstres)")
+
+    # Mises à jour
+
+    def kill(self, combatant):
+        """Retirer un combattant mort (O(1), sans effet s'il est déjà retiré)"""
+        if self._characters.discard(combatant):
+            if not self._front.discard(combatant):
+                self._back.discard(combatant)
+        else:
+            self._monsters.discard(combatant)
+
+    def add_monster(self, monster):
+        """Ajouter un monstre en cours de combat (renforts)"""
+        self._monsters.append(monster)
+
+    # Requêtes
+
+    def is_alive(self, combatant) -> bool:
+        return combatant in self._characters or combatant in self._monsters
+
+    def is_front_line(self, char) -> bool:
+        return char in self._front
+
+    @property
+    def has_characters(self) -> bool:
+        return bool(self._characters)
+
+    @property
+    def has_monsters(self) -> bool:
+        return bool(self._monsters)
+
+    @property
+    def is_over(self) -> bool:
+        return not (self._characters and self._monsters)
+
+    @property
+    def characters(self) -> RosterList:
+        """Personnages vivants"""
+        return self._characters
+
+    @property
+    def monsters(self) -> RosterList:
+        """Monstres vivants"""
+        return self._monsters
+
+    @property
+    def front_line(self) -> RosterList:
+        return self._front
+
+    @property
+    def back_line(self) -> RosterList:
+        return self._back
+
+    @property
+    def accessible_characters(self) -> RosterList:
+        """Cibles des monstres: ligne de front, ou ligne arrière si elle est tombée"""
+        return self._front if self._front else self._back
@@ -0,0 +1,390 @@
+"""
+Combat Simulator - Simulation headless des combats
+Rejoue la boucle de combat de CombatScene sans renderer, input() ni print()
+pour estimer l'équilibrage des rencontres (taux de victoire, rounds, HP, morts)
+"""
+
+import copy
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..core.rng import GameRNG, default_rng
+from .combat_roster import CombatRoster
+from .conditions import ConditionEngine
+from .enhanced_combat import EnhancedCombatSystem
+from .compact_combat import run_compact_combat
+from .horde_combat import MonsterHorde, run_horde_combat
+from .initiative import InitiativeScheduler
+
+
+@dataclass
+class FightResult:
+    """Résultat d'un combat unique"""
+    victory: bool
+    rounds: int
+    alive_chars: List
+    alive_monsters: List
+
+    @property
+    def timed_out(self) -> bool:
+        """Combat interrompu par la limite de rounds"""
+        return bool(self.alive_chars and self.alive_monsters)
+
+
+def run_combat_loop(combat_system,
+                    party: List,
+                    enemies: List,
+                    weapons: Optional[List] = None,
+                    armors: Optional[List] = None,
+                    equipments: Optional[List] = None,
+                    potions: Optional[List] = None,
+                    max_rounds: int = 50,
+                    on_round: Optional[Callable[[int], None]] = None,
+                    compact: bool = False,
+                    initiative: bool = False,
+                    reinforcements: Optional[Dict[int, List]] = None,
+                    conditions: Optional[ConditionEngine] = None) -> FightResult:
+    """
+    Boucle de combat partagée par CombatScene et le simulateur
+
+    Args:
+        combat_system: CombatSystem (ou EnhancedCombatSystem)
+        party: Groupe complet (l'ordre définit la ligne de front)
+        enemies: Monstres du combat
+        weapons, armors, equipments, potions: Trésors (None = pas de trésor)
+        max_rounds: Nombre maximum de rounds
+        on_round: Callback optionnel appelé au début de chaque round
+                  (le système de combat émet aussi un événement ROUND s'il a un flux d'événements)
+        compact: Jouer le combat sur des états compacts (EnhancedCombatSystem seulement,
+                 voir compact_combat.run_compact_combat)
+        initiative: Tours dans l'ordre d'initiative (d20 + DEX) au lieu de
+                    personnages puis monstres (voir initiative.InitiativeScheduler)
+        reinforcements: Monstres rejoignant le combat, par numéro de round
+        conditions: Moteur d'effets temporaires, avancé d'un round à chaque nouveau round;
+                    les Conditions posées pendant un tour y sont suivies (ConditionEngine.observe)
+
+    Returns:
+        FightResult
+    """
+    # Hordes de monstres identiques: résolution en bloc
+    if any(isinstance(enemy, MonsterHorde) for enemy in enemies):
+        return run_horde_combat(combat_system, party, enemies, weapons, armors, equipments, potions,
+                                max_rounds, on_round, initiative, reinforcements, conditions)
+    if compact and isinstance(combat_system, EnhancedCombatSystem):
+        return run_compact_combat(combat_system, party, enemies, weapons, armors, equipments, potions,
+                                  max_rounds, on_round, initiative, reinforcements, conditions)
+
+    roster = CombatRoster(party, enemies)
+    events = getattr(combat_system, 'events', None)
+    party_ids = {id(char) for char in party}
+    observed = list(party) + list(enemies)
+    if conditions is not None:
+        for combatant in observed:
+            conditions.observe(combatant)
+
+    def take_turn(combatant, round_num: int):
+        if id(combatant) in party_ids:
+            combat_system.character_turn(
+                character=combatant,
+                alive_chars=roster.characters,
+                alive_monsters=roster.monsters,
+                party=party,
+                weapons=weapons,
+                armors=armors,
+                equipments=equipments,
+                potions=potions
+            )
+        else:
+            # Limiter attaque à la ligne de front (comme dans advanced_combat)
+            combat_system.monster_turn(
+                monster=combatant,
+                alive_monsters=roster.monsters,
+                alive_chars=roster.accessible_characters,
+                party=party,
+                round_num=round_num
+            )
+        if conditions is not None:
+            # Conditions posées pendant le tour (attaques, sorts): expirées par le moteur
+            conditions.track_pending(source=combatant)
+
+    def begin_round(round_num: int):
+        if conditions is not None and round_num > 1:
+            conditions.advance(1)
+        if events is not None:
+            events.begin_round(round_num)
+        if on_round:
+            on_round(round_num)
+
+    def join(monster):
+        roster.add_monster(monster)
+        observed.append(monster)
+        if conditions is not None:
+            conditions.observe(monster)
+        return monster
+
+    rounds = play_turns(roster, party, enemies, take_turn, begin_round, join, max_rounds,
+                        initiative, reinforcements, getattr(combat_system, 'rng', None))
+
+    if conditions is not None:
+        for combatant in observed:
+            conditions.release(combatant)
+
+    return FightResult(
+        victory=roster.has_characters,
+        rounds=rounds,
+        alive_chars=list(roster.characters),
+        alive_monsters=list(roster.monsters)
+    )
+
+
+def play_turns(roster: CombatRoster, characters: List, monsters: List,
+               take_turn: Callable[[object, int], None],
+               begin_round: Callable[[int], None],
+               join: Callable[[object], object],
+               max_rounds: int = 50,
+               initiative: bool = False,
+               reinforcements: Optional[Dict[int, List]] = None,
+               rng: Optional[GameRNG] = None) -> int:
+    """
+    Déroulement des tours, commun à run_combat_loop et run_compact_combat
+
+    Args:
+        roster: Combattants vivants
+        characters, monsters: Combattants dans l'ordre d'origine (groupe, ennemis);
+                              les vues du roster ne gardent pas cet ordre
+        take_turn: Jouer le tour d'un combattant (combattant, round)
+        begin_round: Appelé au début de chaque round
+        join: Ajouter un monstre de renfort; retourne le combattant ajouté au roster
+        max_rounds, initiative, reinforcements: Voir run_combat_loop
+        rng: Générateur des jets d'initiative
+
+    Returns:
+        Nombre de rounds joués
+    """
+    if initiative:
+        # Ordre d'initiative (tas): un tour = O(log n), renforts insérés en cours de combat
+        scheduler = InitiativeScheduler(rng)
+        scheduler.add_all([c for c in characters if roster.is_alive(c)] + list(roster.monsters))
+        pending = dict(reinforcements or {})
+        is_alive = roster.is_alive
+        current_round = 0
+
+        while not roster.is_over:
+            turn = scheduler.next_turn(is_alive)
+            if turn is None:
+                break
+            if turn.round_num != current_round:
+                current_round = turn.round_num
+                if current_round > max_rounds:
+                    break
+                begin_round(current_round)
+                for monster in pending.pop(current_round, ()):
+                    scheduler.add(join(monster))
+
+            if turn.combatant.hit_points <= 0:
+                roster.kill(turn.combatant)
+                continue
+            take_turn(turn.combatant, current_round)
+            for readied in scheduler.triggered(turn.combatant, is_alive):
+                if roster.is_over:
+                    break
+                take_turn(readied.combatant, current_round)
+
+        return min(current_round, max_rounds)
+
+    # Personnages puis monstres, dans l'ordre du groupe et des ennemis
+    monster_order = list(monsters)
+    round_num = 1
+    while not roster.is_over and round_num <= max_rounds:
+        begin_round(round_num)
+        for monster in (reinforcements or {}).get(round_num, ()):
+            monster_order.append(join(monster))
+
+        # Tours personnages
+        for char in characters:
+            if not roster.has_monsters:
+                break
+            if not roster.is_alive(char):
+                continue
+            if char.hit_points <= 0:
+                roster.kill(char)
+                continue
+            take_turn(char, round_num)
+
+        # Tours monstres
+        for monster in monster_order:
+            if not roster.has_characters:
+                break
+            if not roster.is_alive(monster):
+                continue
+            if monster.hit_points <= 0:
+                roster.kill(monster)
+                continue
+            take_turn(monster, round_num)
+
+        round_num += 1
+    return round_num - 1
+
+
+@dataclass
+class SimulationStats:
+    """
+    Statistiques agrégées sur N combats simulés
+    Tous les compteurs sont additifs (fusion possible entre simulations)
+    """
+    trials: int = 0
+    wins: int = 0
+    timeouts: int = 0
+    rounds_histogram: Dict[int, int] = field(default_factory=dict)
+    hp_remaining: Dict[str, int] = field(default_factory=dict)
+    max_hp: Dict[str, int] = field(default_factory=dict)
+    deaths: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, result: FightResult, party: List):
+        """Enregistrer le résultat d'un combat"""
+        self.trials += 1
+        if result.victory:
+            self.wins += 1
+        if result.timed_out:
+            self.timeouts += 1
+        self.rounds_histogram[result.rounds] = self.rounds_histogram.get(result.rounds, 0) + 1
+
+        for char in party:
+            self.max_hp[char.name] = char.max_hit_points
+            self.hp_remaining[char.name] = self.hp_remaining.get(char.name, 0) + max(0, char.hit_points)
+            if char.hit_points <= 0:
+                self.deaths[char.name] = self.deaths.get(char.name, 0) + 1
+            else:
+                self.deaths.setdefault(char.name, 0)
+
+    def merge(self, other: 'SimulationStats') -> 'SimulationStats':
+        """Fusionner les compteurs d'une autre simulation dans celle-ci"""
+        self.trials += other.trials
+        self.wins += other.wins
+        self.timeouts += other.timeouts
+        for rounds, count in other.rounds_histogram.items():
+            self.rounds_histogram[rounds] = self.rounds_histogram.get(rounds, 0) + count
+        for name, hp in other.hp_remaining.items():
+            self.hp_remaining[name] = self.hp_remaining.get(name, 0) + hp
+        for name, count in other.deaths.items():
+            self.deaths[name] = self.deaths.get(name, 0) + count
+        self.max_hp.update(other.max_hp)
+        return self
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.trials if self.trials else 0.0
+
+    @property
+    def mean_rounds(self) -> float:
+        if not self.trials:
+            return 0.0
+        return sum(r * n for r, n in self.rounds_histogram.items()) / self.trials
+
+    def mean_hp_remaining(self, name: str) -> float:
+        """HP moyens restants d'un personnage en fin de combat"""
+        return self.hp_remaining.get(name, 0) / self.trials if self.trials else 0.0
+
+    def death_rate(self, name: str) -> float:
+        """Proportion de combats où le personnage finit à 0 HP"""
+        return self.deaths.get(name, 0) / self.trials if self.trials else 0.0
+
+    def summary(self) -> str:
+        """Résumé lisible des statistiques"""
+        lines = [
+            f"Combats: {self.trials} | Victoires: {self.win_rate:.1%} | "
+            f"Rounds moyens: {self.mean_rounds:.2f} | Limite atteinte: {self.timeouts}"
+        ]
+        for name in self.hp_remaining:
+            lines.append(
+                f"  - {name}: {self.mean_hp_remaining(name):.1f}/{self.max_hp.get(name, 0)} HP moyens, "
+                f"morts {self.death_rate(name):.1%}"
+            )
+        return '\n'.join(lines)
+
+
+class CombatSimulator:
+    """
+    Simulateur headless: rejoue N fois un combat avec un groupe frais
+    Aucun affichage, aucune attente, aucune saisie
+    """
+
+    def __init__(self, party: List, monster_factory=None, max_rounds: int = 50,
+                 combat_system=None, rng: Optional[GameRNG] = None, compact: bool = True):
+        """
+        Args:
+            party: Groupe de référence (copié avant chaque combat)
+            monster_factory: Factory utilisée par les enemies_factory des scènes
+            max_rounds: Nombre maximum de rounds par combat
+            combat_system: Système de combat (EnhancedCombatSystem silencieux par défaut)
+            rng: Générateur aléatoire de la simulation (défaut: générateur global)
+            compact: Combats sur états compacts (voir run_combat_loop)
+        """
+        self.party = party
+        self.monster_factory = monster_factory
+        self.max_rounds = max_rounds
+        self.rng = rng or default_rng
+        self.compact = compact
+        self.combat_system = combat_system or EnhancedCombatSystem(verbose=False, rng=self.rng)
+        self.game_context = {'monster_factory': monster_factory, 'rng': self.rng}
+
+    def run_fight(self, enemies_factory: Callable) -> Tuple[FightResult, List]:
+        """
+        Jouer un combat unique
+
+        Returns:
+            (FightResult, groupe utilisé pour ce combat)
+        """
+        party = self.copy_party()
+        enemies = enemies_factory(self.game_context)
+        result = run_combat_loop(self.combat_system, party, enemies, max_rounds=self.max_rounds,
+                                 compact=self.compact)
+        return result, party
+
+    # Attributs jamais modifiés en combat: partagés entre les copies du groupe
+    SHARED_ATTRIBUTES = ('race', 'subrace', 'class_type', 'proficiencies', 'abilities', 'ability_modifiers')
+
+    def copy_party(self) -> List:
+        """Copie profonde du groupe de référence, sans dupliquer les données statiques"""
+        memo = {}
+        for char in self.party:
+            for attr in self.SHARED_ATTRIBUTES:
+                value = getattr(char, attr, None)
+                if value is not None:
+                    memo[id(value)] = value
+        return copy.deepcopy(self.party, memo)
+
+    def simulate(self, enemies_factory: Callable, trials: int = 1000) -> SimulationStats:
+        """Simuler `trials` combats contre les ennemis produits par enemies_factory"""
+        stats = SimulationStats()
+        for _ in range(trials):
+            result, party = self.run_fight(enemies_factory)
+            stats.record(result, party)
+        return stats
+
+    def simulate_scene(self, scene, trials: int = 1000) -> SimulationStats:
+        """Simuler une CombatScene"""
+        return self.simulate(scene.enemies_factory, trials)
+
+    def simulate_scenario_file(self, json_file_path: str, trials: int = 1000) -> Dict[str, SimulationStats]:
+        """
+        Simuler toutes les scènes de combat d'un fichier data/scenes/*.json
+
+        Returns:
+            Dict scene_id -> SimulationStats
+        """
+        from ..scenes.scene_factory import SceneFactory
+
+        with open(Path(json_file_path), 'r', encoding='utf-8') as f:
+            scenario_data = json.load(f)
+
+        results = {}
+        for scene_data in scenario_data.get('scenes', []):
+            if scene_data.get('type') != 'combat':
+                continue
+            scene = SceneFactory.create_scene_from_dict(scene_data, self.monster_factory)
+            results[scene.scene_id] = self.simulate_scene(scene, trials)
+
+        return results
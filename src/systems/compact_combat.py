@@ -0,0 +1,339 @@
+"""
+Compact Combat - État de combat compact (__slots__) séparé des objets dnd_5e_core
+Pendant le combat, HP, CA, profils d'attaque et dés précompilés vivent dans
+des CombatantState; les objets Character/Monster ne servent qu'à l'affichage,
+aux tours délégués à dnd_5e_core (soins, potions, sorts, capacités spéciales)
+et reçoivent les résultats en fin de combat
+
+Initiative, renforts et moteur de conditions: mêmes options que run_combat_loop
+(boucle de tours commune, combat_simulator.play_turns)
+
+Règles: celles d'EnhancedCombatSystem pour les attaques des personnages et de
+dnd_5e_core pour les attaques de mêlée des monstres (action au hasard, pas de
+critique, ligne de front d'abord)
+"""
+
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from dnd_5e_core.combat import ActionType
+
+from ..core.derived_stats import derived_stats
+from ..core.dice import parse_dice
+from ..core.rng import default_rng
+from .combat_events import CombatEventType
+from .combat_roster import CombatRoster
+from .conditions import ConditionEngine
+from .horde_combat import FALLBACK_DICE, CompiledAttack, compile_attacks
+
+CHARACTER = 0
+MONSTER = 1
+
+# Attaques compilées par liste d'actions (partagée par les copies d'un même prototype)
+_compiled_attacks: Dict[int, Tuple[list, List[List[CompiledAttack]]]] = {}
+_COMPILED_ATTACKS_LIMIT = 4096
+
+
+def _attacks_for(monster) -> List[List[CompiledAttack]]:
+    actions = getattr(monster, 'actions', None) or []
+    entry = _compiled_attacks.get(id(actions))
+    if entry is None or entry[0] is not actions:
+        if len(_compiled_attacks) >= _COMPILED_ATTACKS_LIMIT:
+            _compiled_attacks.clear()
+        entry = _compiled_attacks[id(actions)] = (actions, compile_attacks(monster))
+    return entry[1]
+
+
+def _resistances(character) -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]:
+    """(immunités, résistances d'armure, résistances d'arme) appliquées par Character.take_damage"""
+    from dnd_5e_core.equipment.armor import ArmorData
+    from dnd_5e_core.equipment.weapon import WeaponData
+
+    immunities = resistances = weapon_resistances = frozenset()
+    armor = getattr(character, 'armor', None)
+    if isinstance(armor, ArmorData):
+        immunities = frozenset(getattr(armor, 'damage_immunities', None) or ())
+        resistances = frozenset(getattr(armor, 'damage_resistances', None) or ())
+    weapon = getattr(character, 'weapon', None)
+    if isinstance(weapon, WeaponData):
+        weapon_resistances = frozenset(getattr(weapon, 'resistances_granted', None) or ())
+    return immunities, resistances, weapon_resistances
+
+
+def _is_compact_monster(monster) -> bool:
+    """Monstre dont tous les tours sont des attaques de mêlée simples (sinon tour délégué)"""
+    if getattr(monster, 'sc', None) is not None or getattr(monster, 'sa', None):
+        return False
+    for action in getattr(monster, 'actions', None) or []:
+        if getattr(action, 'type', None) not in (ActionType.MELEE, ActionType.MIXED):
+            continue
+        for attack in action.multi_attack or [action]:
+            if not hasattr(attack, 'attack_bonus') or getattr(attack, 'effects', None):
+                return False
+    return True
+
+
+class CombatantState:
+    """État compact d'un combattant (aucun dictionnaire d'instance)"""
+
+    __slots__ = ('entity', 'key', 'side', 'hp', 'max_hp', 'ac',
+                 'attack_bonus', 'damage', 'damage_bonus', 'attacks', 'compact',
+                 'healing_spells', 'immunities', 'resistances', 'weapon_resistances')
+
+    def __init__(self, entity, key: int, side: int):
+        self.entity = entity
+        self.key = key
+        self.side = side
+        self.hp = entity.hit_points
+        self.max_hp = getattr(entity, 'max_hit_points', None) or entity.hit_points
+        self.ac = getattr(entity, 'armor_class', 12)
+        self.attack_bonus = 0
+        self.damage = None
+        self.damage_bonus = 0
+        self.attacks: List[List[CompiledAttack]] = []
+        self.compact = True
+        self.healing_spells: List = []
+        self.immunities = self.resistances = self.weapon_resistances = frozenset()
+
+    def __repr__(self):
+        return f"CombatantState({self.name!r}, {self.hp}/{self.max_hp} HP, CA {self.ac})"
+
+    @property
+    def name(self) -> str:
+        return self.entity.name
+
+    @property
+    def hit_points(self) -> int:
+        # Lu par CombatRoster
+        return self.hp
+
+    @property
+    def abilities(self):
+        # Lu par InitiativeScheduler (modificateur de DEX)
+        return getattr(self.entity, 'abilities', None)
+
+    @classmethod
+    def for_character(cls, character, key: int) -> 'CombatantState':
+        state = cls(character, key, CHARACTER)
+        stats = derived_stats(character)
+        state.attack_bonus = stats.attack_bonus
+        state.damage = stats.damage
+        state.damage_bonus = stats.damage_modifier
+        state.immunities, state.resistances, state.weapon_resistances = _resistances(character)
+        sc = getattr(character, 'sc', None)
+        if getattr(character, 'is_spell_caster', False) and hasattr(sc, 'learned_spells'):
+            state.healing_spells = [s for s in sc.learned_spells if getattr(s, 'heal_at_slot_level', None)]
+        return state
+
+    @classmethod
+    def for_monster(cls, monster, key: int) -> 'CombatantState':
+        state = cls(monster, key, MONSTER)
+        state.attacks = _attacks_for(monster)
+        state.compact = _is_compact_monster(monster)
+        return state
+
+    def absorb(self, damage: int, damage_type: str) -> int:
+        """Subir des dommages (mêmes réductions que Character.take_damage); retourne les dommages réels"""
+        actual = damage
+        if damage_type in self.immunities:
+            actual = 0
+        elif damage_type in self.resistances:
+            actual = damage // 2
+        if actual > 0 and damage_type in self.weapon_resistances:
+            actual //= 2
+        self.hp = max(0, self.hp - actual)
+        return actual
+
+    def can_heal(self) -> bool:
+        """Sort de soin disponible (emplacement restant)"""
+        slots = self.entity.sc.spell_slots
+        return any(slots[s.level - 1] > 0 for s in self.healing_spells)
+
+    def write_back(self):
+        """Reporter l'état sur l'objet dnd_5e_core"""
+        self.entity.hit_points = self.hp
+        if self.side == CHARACTER and self.hp <= 0:
+            self.entity.status = "DEAD"
+
+    def reload(self):
+        """Relire l'objet dnd_5e_core après un tour délégué"""
+        self.hp = self.entity.hit_points
+        self.ac = getattr(self.entity, 'armor_class', self.ac)
+
+
+def run_compact_combat(combat_system,
+                       party: List,
+                       enemies: List,
+                       weapons: Optional[List] = None,
+                       armors: Optional[List] = None,
+                       equipments: Optional[List] = None,
+                       potions: Optional[List] = None,
+                       max_rounds: int = 50,
+                       on_round: Optional[Callable[[int], None]] = None,
+                       initiative: bool = False,
+                       reinforcements: Optional[Dict[int, List]] = None,
+                       conditions: Optional[ConditionEngine] = None):
+    """
+    Boucle de combat sur états compacts (même interface que run_combat_loop)
+    Les objets dnd_5e_core sont mis à jour en fin de combat (et autour des tours délégués);
+    les effets du moteur de conditions modifient les objets, la CA des états est relue
+    quand un effet est posé ou expire
+
+    Returns:
+        FightResult
+    """
+    from .combat_simulator import FightResult, play_turns
+
+    rng = getattr(combat_system, 'rng', None) or default_rng
+    events = getattr(combat_system, 'events', None)
+
+    characters = [CombatantState.for_character(char, i) for i, char in enumerate(party)]
+    monsters = [CombatantState.for_monster(monster, i) for i, monster in enumerate(enemies)]
+    # Formation: même roster que run_combat_loop, sur les états
+    roster = CombatRoster(characters, monsters)
+    states = {id(state.entity): state for state in characters + monsters}
+    if conditions is not None:
+        for state in states.values():
+            conditions.observe(state.entity)
+
+    def sync():
+        for state in states.values():
+            state.write_back()
+
+    def refresh(effects):
+        """Relire la CA des cibles d'effets posés ou expirés"""
+        for effect in effects:
+            state = states.get(id(effect.target))
+            if state is not None:
+                state.ac = getattr(state.entity, 'armor_class', state.ac)
+
+    def delegate(turn: Callable, alive_chars: Optional[List[CombatantState]] = None, **kwargs):
+        """Tour joué par dnd_5e_core sur les objets complets, puis relu (personnages et monstres)"""
+        sync()
+        alive_chars = [s.entity for s in (roster.characters if alive_chars is None else alive_chars)]
+        alive_monsters = [s.entity for s in roster.monsters]
+        turn(alive_chars=alive_chars, alive_monsters=alive_monsters, **kwargs)
+        for state in list(roster.characters) + list(roster.monsters):
+            state.reload()
+            if state.hp <= 0:
+                roster.kill(state)
+
+    def character_turn(char: CombatantState):
+        entity = char.entity
+        needs_heal = (char.healing_spells and char.can_heal()
+                      and any(c.hp < 0.5 * c.max_hp for c in roster.characters))
+        needs_potion = char.hp < 0.3 * char.max_hp and getattr(entity, 'healing_potions', None)
+        if needs_heal or needs_potion or getattr(entity, 'conditions', None):
+            delegate(combat_system.character_turn, character=entity, party=party, weapons=weapons,
+                     armors=armors, equipments=equipments, potions=potions)
+            return
+
+        # Attaque du monstre le plus faible (règles d'EnhancedCombatSystem)
+        target = min(roster.monsters, key=lambda m: m.hp)
+        if events is not None:
+            events.emit(CombatEventType.ATTACK, entity, target.entity)
+        # Dommages lancés avant le jet d'attaque, doublés sur un critique (EnhancedCombatSystem)
+        damage = max(1, char.damage.roll(rng) + char.damage_bonus)
+        attack_roll = rng.d20()
+        if events is not None:
+            if attack_roll == 20:
+                event_type = CombatEventType.CRIT
+            elif attack_roll != 1 and attack_roll + char.attack_bonus >= target.ac:
+                event_type = CombatEventType.HIT
+            else:
+                event_type = CombatEventType.MISS
+            events.emit(event_type, entity, target.entity, 0, attack_roll, char.attack_bonus, target.ac)
+        if attack_roll == 1 or (attack_roll != 20 and attack_roll + char.attack_bonus < target.ac):
+            return
+
+        if attack_roll == 20:
+            damage *= 2
+        if events is not None:
+            events.emit(CombatEventType.DAMAGE, entity, target.entity, damage)
+        target.hp -= damage
+        if target.hp <= 0:
+            roster.kill(target)
+            target.write_back()
+            if events is not None:
+                events.emit(CombatEventType.DEATH, entity, target.entity)
+            combat_system._handle_victory(entity, target.entity, weapons, armors, equipments, potions)
+
+    def take_turn(state: CombatantState, round_num: int):
+        if state.side == CHARACTER:
+            character_turn(state)
+        elif not state.compact:
+            # Sorts de soin compris: les monstres sont relus eux aussi
+            delegate(combat_system.monster_turn, alive_chars=roster.accessible_characters,
+                     monster=state.entity, party=party, round_num=round_num)
+        else:
+            _monster_attack(state, roster, rng, events)
+        if conditions is not None:
+            # Conditions posées pendant le tour (attaques, sorts): expirées par le moteur
+            refresh(conditions.track_pending(source=state.entity))
+
+    def begin_round(round_num: int):
+        if conditions is not None and round_num > 1:
+            refresh(conditions.advance(1))
+        if events is not None:
+            events.begin_round(round_num)
+        if on_round:
+            on_round(round_num)
+
+    def join(monster) -> CombatantState:
+        state = CombatantState.for_monster(monster, len(states))
+        states[id(monster)] = state
+        roster.add_monster(state)
+        if conditions is not None:
+            conditions.observe(monster)
+        return state
+
+    rounds = play_turns(roster, characters, monsters, take_turn, begin_round, join, max_rounds,
+                        initiative, reinforcements, rng)
+
+    sync()
+    if conditions is not None:
+        for state in states.values():
+            conditions.release(state.entity)
+    return FightResult(
+        victory=roster.has_characters,
+        rounds=rounds,
+        alive_chars=[s.entity for s in roster.characters],
+        alive_monsters=[s.entity for s in roster.monsters]
+    )
+
+
+def _monster_attack(monster: CombatantState, roster: CombatRoster, rng, events):
+    """Attaque de mêlée d'un monstre (règles de Monster.attack de dnd_5e_core)"""
+    target = rng.choice(roster.accessible_characters[:3])
+    entity = monster.entity
+    if events is not None:
+        events.emit(CombatEventType.ATTACK, entity, target.entity)
+
+    if not monster.attacks:
+        # Attaque de secours de dnd_5e_core: 1d8 sans jet d'attaque
+        total, damage_type = parse_dice(FALLBACK_DICE).roll(rng), "bludgeoning"
+    else:
+        total = 0
+        damage_type = "bludgeoning"
+        for attack_bonus, disadvantage, damages, attack_type in rng.choice(monster.attacks):
+            roll = rng.d20()
+            if disadvantage:
+                roll = min(roll, rng.d20())
+            hit = roll + attack_bonus >= target.ac
+            if events is not None:
+                events.emit(CombatEventType.HIT if hit else CombatEventType.MISS, entity, target.entity,
+                            0, roll, attack_bonus, target.ac)
+            if hit:
+                for dice, bonus in damages:
+                    total += max(0, dice.roll(rng) + bonus)
+                damage_type = attack_type
+
+    if total <= 0:
+        return
+    actual = target.absorb(total, damage_type)
+    if events is not None:
+        events.emit(CombatEventType.DAMAGE, entity, target.entity, actual)
+    if target.hp <= 0:
+        roster.kill(target)
+        target.write_back()
+        if events is not None:
+            events.emit(CombatEventType.DEATH, entity, target.entity)
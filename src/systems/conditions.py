@@ -0,0 +1,216 @@
+"""
+Conditions - Moteur d'effets temporaires (buffs, débuffs, conditions dnd_5e_core)
+Les durées (rounds ou minutes) sont planifiées dans une roue temporelle
+hiérarchique: l'expiration d'un round coûte O(effets expirés), sans parcourir
+les conditions de chaque combattant
+
+Un effet peut modifier des attributs numériques (CA, ...) et/ou poser une
+Condition de dnd_5e_core; tout est retiré à l'expiration ou à la dissipation
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.timer_wheel import Timer, TimerWheel
+
+ROUNDS_PER_MINUTE = 10
+
+# Attributs calculés par dnd_5e_core (propriétés en lecture seule) -> attribut de bonus lu par la propriété
+MODIFIER_FALLBACKS = {'armor_class': 'ac_bonus'}
+
+
+@dataclass(eq=False)
+class StatusEffect:
+    """Effet actif sur une cible"""
+    name: str
+    target: object
+    modifiers: Dict[str, int] = field(default_factory=dict)
+    condition: Optional[object] = None      # dnd_5e_core.combat.Condition
+    source: Optional[object] = None
+    expires_at: Optional[int] = None        # Round d'expiration (None = jusqu'à dissipation)
+    active: bool = True
+    _applied: Dict[str, int] = field(default_factory=dict, repr=False)
+    _timer: Optional[Timer] = field(default=None, repr=False)
+
+
+def _adjust(target, attribute: str, value: int) -> str:
+    """Ajouter `value` à un attribut; retourne l'attribut réellement modifié"""
+    try:
+        setattr(target, attribute, getattr(target, attribute, 0) + value)
+        return attribute
+    except AttributeError:
+        fallback = MODIFIER_FALLBACKS.get(attribute)
+        if fallback is None:
+            raise
+        setattr(target, fallback, getattr(target, fallback, 0) + value)
+        return fallback
+
+
+class ConditionList(list):
+    """
+    Liste `conditions` d'un combattant observé: chaque ajout (append, insert,
+    extend, comme le fait dnd_5e_core en posant une Condition) est signalé
+    au moteur, qui le suit en O(ajouts) sans parcourir les combattants
+    """
+
+    def __init__(self, conditions: Iterable, target, pending: List[Tuple[object, object]]):
+        super().__init__(conditions)
+        self._target = target
+        self._pending = pending
+
+    def append(self, condition):
+        super().append(condition)
+        self._pending.append((self._target, condition))
+
+    def insert(self, index: int, condition):
+        super().insert(index, condition)
+        self._pending.append((self._target, condition))
+
+    def extend(self, conditions: Iterable):
+        conditions = list(conditions)
+        super().extend(conditions)
+        self._pending.extend((self._target, condition) for condition in conditions)
+
+
+class ConditionEngine:
+    """Effets actifs de tous les combattants, expirés par une roue temporelle (1 tick = 1 round)"""
+
+    def __init__(self, wheel: Optional[TimerWheel] = None):
+        self.wheel = wheel if wheel is not None else TimerWheel()
+        self._effects: Dict[int, List[StatusEffect]] = {}
+        # Conditions dnd_5e_core gérées par le moteur: (id(cible), id(condition))
+        self._managed: Set[Tuple[int, int]] = set()
+        # Ajouts signalés par les listes observées, en attente de suivi
+        self._pending: List[Tuple[object, object]] = []
+
+    @property
+    def round(self) -> int:
+        return self.wheel.now
+
+    def __len__(self) -> int:
+        return sum(len(effects) for effects in self._effects.values())
+
+    # Application
+
+    def apply(self, target, name: str, rounds: Optional[int] = None, minutes: Optional[int] = None,
+              modifiers: Optional[Dict[str, int]] = None, condition=None, source=None) -> StatusEffect:
+        """
+        Appliquer un effet
+
+        Args:
+            target: Personnage ou monstre
+            name: Nom de l'effet ('shield', 'bless', ...)
+            rounds, minutes: Durée (les deux s'additionnent; aucune = jusqu'à dissipation)
+            modifiers: Bonus d'attributs ({'armor_class': 5})
+            condition: Condition dnd_5e_core posée sur la cible pendant l'effet
+            source: Lanceur (informatif)
+        """
+        effect = StatusEffect(name, target, dict(modifiers or {}), condition, source)
+        for attribute, value in effect.modifiers.items():
+            applied = _adjust(target, attribute, value)
+            effect._applied[applied] = effect._applied.get(applied, 0) + value
+        if condition is not None:
+            conditions = getattr(target, 'conditions', None)
+            if conditions is None:
+                target.conditions = conditions = []
+            conditions.append(condition)
+            self._managed.add((id(target), id(condition)))
+
+        duration = (rounds or 0) + (minutes or 0) * ROUNDS_PER_MINUTE
+        if rounds is not None or minutes is not None:
+            effect._timer = self.wheel.schedule(duration, effect)
+            effect.expires_at = effect._timer.deadline
+        self._effects.setdefault(id(target), []).append(effect)
+        return effect
+
+    def track(self, target, condition, source=None) -> Optional[StatusEffect]:
+        """
+        Suivre une Condition déjà posée par dnd_5e_core (attaques de monstres)
+        Elle sera retirée après condition.duration rounds (non suivie si durée absente)
+        """
+        if getattr(condition, 'duration', None) is None:
+            return None
+        conditions = getattr(target, 'conditions', None) or []
+        if condition in conditions:
+            conditions.remove(condition)
+        return self.apply(target, condition.index, rounds=condition.duration, condition=condition, source=source)
+
+    def observe(self, target):
+        """Observer les ajouts à target.conditions (début de combat, renforts)"""
+        conditions = getattr(target, 'conditions', None)
+        if not isinstance(conditions, ConditionList):
+            target.conditions = ConditionList(conditions or (), target, self._pending)
+
+    def release(self, target):
+        """Rendre une liste ordinaire à la cible (fin de combat)"""
+        conditions = getattr(target, 'conditions', None)
+        if isinstance(conditions, ConditionList):
+            target.conditions = list(conditions)
+
+    def track_pending(self, source=None) -> List[StatusEffect]:
+        """Suivre les Conditions ajoutées aux cibles observées depuis le dernier appel (fin de tour)"""
+        tracked = []
+        pending, self._pending[:] = list(self._pending), []
+        for target, condition in pending:
+            if (id(target), id(condition)) in self._managed:
+                continue
+            effect = self.track(target, condition, source)
+            if effect is not None:
+                tracked.append(effect)
+        return tracked
+
+    # Retrait
+
+    def _revert(self, effect: StatusEffect):
+        effect.active = False
+        target = effect.target
+        for attribute, value in effect._applied.items():
+            setattr(target, attribute, getattr(target, attribute, 0) - value)
+        if effect.condition is not None:
+            conditions = getattr(target, 'conditions', None) or []
+            if effect.condition in conditions:
+                conditions.remove(effect.condition)
+            self._managed.discard((id(target), id(effect.condition)))
+        effects = self._effects.get(id(target))
+        if effects is not None:
+            effects.remove(effect)
+            if not effects:
+                del self._effects[id(target)]
+
+    def remove(self, effect: StatusEffect) -> bool:
+        """Dissiper un effet avant son expiration"""
+        if not effect.active:
+            return False
+        if effect._timer is not None:
+            effect._timer.cancel()
+        self._revert(effect)
+        return True
+
+    def clear(self, target) -> int:
+        """Dissiper tous les effets d'une cible (mort, fin de combat)"""
+        effects = list(self._effects.get(id(target), ()))
+        for effect in effects:
+            self.remove(effect)
+        return len(effects)
+
+    # Écoulement du temps
+
+    def advance(self, rounds: int = 1) -> List[StatusEffect]:
+        """Faire passer `rounds` rounds; retourne les effets expirés"""
+        expired = self.wheel.advance(rounds)
+        for effect in expired:
+            if effect.active:
+                self._revert(effect)
+        return expired
+
+    def advance_minutes(self, minutes: int) -> List[StatusEffect]:
+        return self.advance(minutes * ROUNDS_PER_MINUTE)
+
+    # Requêtes
+
+    def effects(self, target) -> List[StatusEffect]:
+        """Effets actifs d'une cible"""
+        return list(self._effects.get(id(target), ()))
+
+    def has_effect(self, target, name: str) -> bool:
+        return any(effect.name == name for effect in self._effects.get(id(target), ()))
@@ -5,8 +5,11 @@ Pour gérer les personnages sans méthode attack()
 
 from dnd_5e_core.combat import CombatSystem
 from dnd_5e_core.mechanics import DamageDice
-from typing import List, Optional
-from random import randint
+from typing import Callable, List, Optional, Tuple
+
+from ..core.derived_stats import derived_stats
+from ..core.rng import GameRNG, default_rng
+from .combat_events import CombatEventStream, CombatEventType, ConsoleSink
 
 
 class EnhancedCombatSystem(CombatSystem):
@@ -15,6 +18,30 @@ class EnhancedCombatSystem(CombatSystem):
     même pour les personnages qui n'ont pas de méthode attack()
     """
 
+    def __init__(self, verbose: bool = True, message_callback: Optional[Callable[[str], None]] = None,
+                 rng: Optional[GameRNG] = None, events: Optional[CombatEventStream] = None):
+        super().__init__(verbose=verbose, message_callback=message_callback)
+        self.rng = rng or default_rng
+        self.events = events if events is not None else CombatEventStream()
+        # Texte produit uniquement si quelqu'un le lit (console ou callback)
+        # Les soins sont déjà décrits par les messages de dnd_5e_core
+        if verbose or message_callback:
+            self.events.attach(ConsoleSink(self._write_line, skip=(CombatEventType.HEAL,)))
+
+    def _write_line(self, text: str):
+        """Écrire un texte formaté (callback ligne par ligne, sinon print)"""
+        if self.message_callback:
+            CombatSystem.log_message(self, text, clean_ansi=True)
+        else:
+            print(text)
+
+    def log_message(self, message: str, clean_ansi: bool = False):
+        """Messages texte de dnd_5e_core: transmis au flux d'événements"""
+        if message:
+            if clean_ansi and self.events.has_sinks:
+                message = self.ansi_escape.sub('', message).strip()
+            self.events.emit(CombatEventType.MESSAGE, message)
+
     def character_turn(self,
                       character,
                       alive_chars: List,
@@ -41,35 +68,28 @@ class EnhancedCombatSystem(CombatSystem):
 
         if healing_spells and any(c for c in alive_chars if c.hit_points < 0.5 * c.max_hit_points):
             # Appeler la version parente pour les soins
-            super().character_turn(character, alive_chars, alive_monsters, party,
-                                 weapons, armors, equipments, potions)
+            self._parent_turn_with_heal_events(character, alive_chars, alive_monsters, party,
+                                               weapons, armors, equipments, potions)
             return
 
         # 2. Potions
         if hasattr(character, 'healing_potions') and character.hit_points < 0.3 * character.max_hit_points and character.healing_potions:
-            super().character_turn(character, alive_chars, alive_monsters, party,
-                                 weapons, armors, equipments, potions)
+            self._parent_turn_with_heal_events(character, alive_chars, alive_monsters, party,
+                                               weapons, armors, equipments, potions)
             return
 
         # 3. ATTAQUE - Version améliorée
         monster = self._select_target_monster(character, alive_chars, alive_monsters)
+        events = self.events
 
-        self.log_message(f"⚔️  {character.name} attaque {monster.name.title()}!")
+        events.emit(CombatEventType.ATTACK, character, monster)
 
         # Calcul de dommages D&D 5e correct (ne pas utiliser character.attack())
         damage = self._calculate_character_damage(character)
 
         # Jet d'attaque
-        attack_roll = randint(1, 20)
-        str_mod = (character.abilities.str - 10) // 2
-        dex_mod = (character.abilities.dex - 10) // 2
-
-        # Choisir STR ou DEX selon la classe
-        attack_bonus = str_mod
-        if hasattr(character, 'class_type') and 'rogue' in character.class_type.index.lower():
-            attack_bonus = dex_mod
-
-        attack_bonus += character.level // 4 + 2  # Bonus de maîtrise
+        attack_roll = self.rng.d20()
+        attack_bonus = derived_stats(character).attack_bonus
 
         total_attack = attack_roll + attack_bonus
 
@@ -77,65 +97,54 @@ class EnhancedCombatSystem(CombatSystem):
         monster_ac = getattr(monster, 'armor_class', 12)
 
         if attack_roll == 1:
-            self.log_message(f"❌ ÉCHEC CRITIQUE! (jet: 1)")
+            events.emit(CombatEventType.MISS, character, monster, 0, attack_roll, attack_bonus, monster_ac)
             return
         elif attack_roll == 20:
             damage *= 2  # Coup critique
-            self.log_message(f"🎯 COUP CRITIQUE! (jet: 20)")
-            self.log_message(f"💥 {character.name} inflige {damage} dommages!")
+            events.emit(CombatEventType.CRIT, character, monster, 0, attack_roll, attack_bonus, monster_ac)
         elif total_attack >= monster_ac:
-            self.log_message(f"✅ Touché! (jet: {attack_roll}+{attack_bonus}={total_attack} vs CA {monster_ac})")
-            self.log_message(f"💥 {character.name} inflige {damage} dommages!")
+            events.emit(CombatEventType.HIT, character, monster, 0, attack_roll, attack_bonus, monster_ac)
         else:
-            self.log_message(f"❌ Raté! (jet: {attack_roll}+{attack_bonus}={total_attack} vs CA {monster_ac})")
+            events.emit(CombatEventType.MISS, character, monster, 0, attack_roll, attack_bonus, monster_ac)
             return
 
+        events.emit(CombatEventType.DAMAGE, character, monster, damage)
+
         # Appliquer dommages
         monster.hit_points -= damage
 
         if monster.hit_points <= 0:
             if monster in alive_monsters:
                 alive_monsters.remove(monster)
-            self.log_message(f"💀 {monster.name.title()} est MORT!")
+            events.emit(CombatEventType.DEATH, character, monster)
             self._handle_victory(character, monster, weapons, armors, equipments, potions)
 
+    def _parent_turn_with_heal_events(self, character, alive_chars, alive_monsters, party,
+                                      weapons, armors, equipments, potions):
+        """Tour de soins/potion de dnd_5e_core, avec un événement HEAL par personnage soigné"""
+        before = [c.hit_points for c in party]
+        super().character_turn(character, alive_chars, alive_monsters, party,
+                               weapons, armors, equipments, potions)
+        for char, hit_points in zip(party, before):
+            if char.hit_points > hit_points:
+                self.events.emit(CombatEventType.HEAL, character, char, char.hit_points - hit_points)
+
+    @staticmethod
+    def get_attack_profile(character) -> Tuple[int, str, int]:
+        """
+        Profil d'attaque D&D 5e d'un personnage (statistiques dérivées en cache)
+
+        Returns:
+            (bonus d'attaque, dés de dommages, modificateur de dommages)
+        """
+        stats = derived_stats(character)
+        return stats.attack_bonus, stats.damage_dice, stats.damage_modifier
+
     def _calculate_character_damage(self, character) -> int:
         """
         Calculer les dommages d'un personnage selon D&D 5e
         """
-        # Modificateurs d'aptitudes
-        str_mod = (character.abilities.str - 10) // 2
-        dex_mod = (character.abilities.dex - 10) // 2
-
-        # Déterminer l'arme et le modificateur
-        damage_dice = "1d8"  # Par défaut (épée longue)
-        ability_mod = str_mod
-
-        # Ajuster selon la classe
-        if hasattr(character, 'class_type'):
-            class_name = character.class_type.index.lower()
-
-            if 'fighter' in class_name or 'paladin' in class_name:
-                damage_dice = "1d8"  # Épée longue
-                ability_mod = str_mod
-            elif 'rogue' in class_name or 'ranger' in class_name:
-                damage_dice = "1d6"  # Épée courte/arc
-                ability_mod = dex_mod
-            elif 'cleric' in class_name:
-                damage_dice = "1d6"  # Masse d'armes
-                ability_mod = str_mod
-            elif 'wizard' in class_name or 'sorcerer' in class_name:
-                damage_dice = "1d4"  # Dague
-                ability_mod = dex_mod
-
-        # Lancer les dés de dommages
-        dice_parts = damage_dice.split('d')
-        num_dice = int(dice_parts[0])
-        dice_size = int(dice_parts[1])
-
-        total_damage = sum(randint(1, dice_size) for _ in range(num_dice))
-        total_damage += ability_mod
+        stats = derived_stats(character)
 
         # Minimum 1 dommage
-        return max(1, total_damage)
-
+        return max(1, stats.damage.roll(self.rng) + stats.damage_modifier)
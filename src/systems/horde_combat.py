@@ -0,0 +1,302 @@
+"""
+Horde Combat - Monstres identiques regroupés en une seule horde
+Une horde = un modèle Monster + un tableau compact de HP, au lieu de N
+objets dnd_5e_core.Monster; les attaques de la horde sont résolues en bloc
+
+Règles: celles d'EnhancedCombatSystem pour les personnages (attaque seulement,
+pas de sorts ni de potions) et de dnd_5e_core pour les monstres (action de
+mêlée au hasard, pas de critique, ligne de front d'abord)
+"""
+
+from array import array
+from typing import Callable, Dict, List, Optional, Tuple
+
+from dnd_5e_core.combat import ActionType
+
+from ..core.dice import DiceExpression, parse_dice
+from ..core.rng import GameRNG, default_rng
+from .combat_events import CombatEventStream, CombatEventType
+from .combat_roster import CombatRoster
+from .conditions import ConditionEngine
+from .enhanced_combat import EnhancedCombatSystem
+
+# Attaque compilée: (bonus d'attaque, désavantage, [(dés, bonus)], type de dommages)
+CompiledAttack = Tuple[int, bool, List[Tuple[DiceExpression, int]], str]
+
+# Distance d'attaque utilisée par dnd_5e_core pour les monstres
+MELEE_DISTANCE = 5.0
+
+FALLBACK_DICE = "1d8"
+
+
+def compile_attacks(monster) -> List[List[CompiledAttack]]:
+    """Compiler les actions de mêlée d'un monstre (une liste d'attaques par action)"""
+    actions = [a for a in getattr(monster, 'actions', None) or []
+               if getattr(a, 'type', None) in (ActionType.MELEE, ActionType.MIXED)]
+    choices = []
+    for action in actions:
+        compiled = []
+        for attack in action.multi_attack or [action]:
+            if not hasattr(attack, 'attack_bonus'):
+                continue
+            disadvantage = attack.type != ActionType.MELEE and MELEE_DISTANCE > attack.normal_range
+            damages = [(parse_dice(d.dd.dice), d.dd.bonus) for d in attack.damages or []]
+            damage_type = attack.damages[0].type.index if attack.damages else "bludgeoning"
+            compiled.append((attack.attack_bonus, disadvantage, damages, damage_type))
+        choices.append(compiled)
+    return choices
+
+
+class MonsterHorde:
+    """
+    N monstres identiques stockés comme un seul groupe
+    Les membres vivants occupent les `alive` premières cases de hit_points_array
+    """
+
+    def __init__(self, template, count: int):
+        """
+        Args:
+            template: Monstre modèle (jamais modifié)
+            count: Nombre de monstres
+        """
+        self.template = template
+        self.count = count
+        self.max_hit_points = getattr(template, 'max_hit_points', None) or template.hit_points
+        self.armor_class = getattr(template, 'armor_class', 12)
+        self.hit_points_array = array('i', [template.hit_points]) * count
+        self.alive = count
+        # Membres blessés (ciblés en priorité, comme le monstre le plus faible)
+        self._wounded: Dict[int, None] = {}
+        self.choices = compile_attacks(template)
+
+    def __repr__(self):
+        return f"MonsterHorde({self.template.name!r}, {self.alive}/{self.count})"
+
+    @property
+    def name(self) -> str:
+        return f"{self.template.name} x{self.count}"
+
+    @property
+    def xp(self) -> int:
+        return self.template.xp * self.count
+
+    @property
+    def hit_points(self) -> int:
+        """HP cumulés des membres vivants"""
+        return sum(self.hit_points_array[:self.alive])
+
+    @property
+    def abilities(self):
+        """Caractéristiques du modèle (initiative de groupe)"""
+        return getattr(self.template, 'abilities', None)
+
+    # Membres
+
+    def weakest(self) -> Optional[int]:
+        """Index du membre vivant ayant le moins de HP"""
+        if not self.alive:
+            return None
+        if self._wounded:
+            return min(self._wounded, key=self.hit_points_array.__getitem__)
+        return 0
+
+    def take_damage(self, index: int, amount: int) -> bool:
+        """
+        Infliger des dommages à un membre
+
+        Returns:
+            True si le membre est mort
+        """
+        hp = self.hit_points_array
+        hp[index] -= amount
+        if hp[index] > 0:
+            self._wounded[index] = None
+            return False
+
+        # Mort: échanger avec le dernier membre vivant (O(1))
+        self._wounded.pop(index, None)
+        last = self.alive - 1
+        if index != last:
+            hp[index], hp[last] = hp[last], hp[index]
+            if last in self._wounded:
+                del self._wounded[last]
+                self._wounded[index] = None
+        self.alive = last
+        return True
+
+    # Attaques de la horde
+
+    def attack(self, roster: CombatRoster, rng: GameRNG, combat_system=None):
+        """Résoudre en bloc les attaques de tous les membres vivants contre le groupe"""
+        members = self.alive
+        if not members:
+            return
+
+        events = getattr(combat_system, 'events', None)
+
+        if not self.choices:
+            # Attaque de secours de dnd_5e_core: 1d8 sans jet d'attaque
+            for damage in parse_dice(FALLBACK_DICE).roll_many(members, rng):
+                targets = roster.accessible_characters
+                if not targets:
+                    return
+                self._hit(rng.choice(targets[:3]), damage, "bludgeoning", roster, events)
+            return
+
+        # Choix d'action de chaque membre, puis jets pré-générés par action
+        picks = rng.rolls(len(self.choices), members) if len(self.choices) > 1 else [1] * members
+        planned = {}
+        for choice in set(picks):
+            size = picks.count(choice)
+            rolls = []
+            for attack_bonus, disadvantage, damages, damage_type in self.choices[choice - 1]:
+                d20 = rng.rolls(20, size)
+                if disadvantage:
+                    d20 = [min(a, b) for a, b in zip(d20, rng.rolls(20, size))]
+                totals = [0] * size
+                for dice, bonus in damages:
+                    for i, rolled in enumerate(dice.roll_many(size, rng)):
+                        totals[i] += max(0, rolled + bonus)
+                rolls.append((attack_bonus, d20, totals, damage_type))
+            planned[choice] = [rolls, 0]
+
+        for choice in picks:
+            targets = roster.accessible_characters
+            if not targets:
+                return
+            target = rng.choice(targets[:3])
+            rolls, cursor = planned[choice]
+            planned[choice][1] += 1
+            if events is not None:
+                events.emit(CombatEventType.ATTACK, self.template, target)
+
+            total = 0
+            damage_type = "bludgeoning"
+            for attack_bonus, d20, totals, attack_type in rolls:
+                hit = d20[cursor] + attack_bonus >= target.armor_class
+                if hit:
+                    total += totals[cursor]
+                    damage_type = attack_type
+                if events is not None:
+                    events.emit(CombatEventType.HIT if hit else CombatEventType.MISS, self.template, target,
+                                0, d20[cursor], attack_bonus, target.armor_class)
+            if total > 0:
+                self._hit(target, total, damage_type, roster, events)
+
+    def _hit(self, target, damage: int, damage_type: str, roster: CombatRoster,
+             events: Optional[CombatEventStream]):
+        # take_damage applique résistances et immunités
+        actual = target.take_damage(damage, damage_type)
+        if events is not None:
+            events.emit(CombatEventType.DAMAGE, self.template, target, actual)
+        if target.hit_points <= 0:
+            roster.kill(target)
+            target.status = "DEAD"
+            if events is not None:
+                events.emit(CombatEventType.DEATH, self.template, target)
+
+
+def as_hordes(enemies: List) -> List[MonsterHorde]:
+    """Convertir une liste d'ennemis (hordes ou monstres isolés) en hordes"""
+    return [e if isinstance(e, MonsterHorde) else MonsterHorde(e, 1) for e in enemies]
+
+
+def run_horde_combat(combat_system,
+                     party: List,
+                     enemies: List,
+                     weapons: Optional[List] = None,
+                     armors: Optional[List] = None,
+                     equipments: Optional[List] = None,
+                     potions: Optional[List] = None,
+                     max_rounds: int = 50,
+                     on_round: Optional[Callable[[int], None]] = None,
+                     initiative: bool = False,
+                     reinforcements: Optional[Dict[int, List]] = None,
+                     conditions: Optional[ConditionEngine] = None):
+    """
+    Boucle de combat contre des hordes (même interface que run_combat_loop)
+    Initiative: un jet par horde (initiative de groupe); renforts: monstres isolés
+    ou hordes; conditions: suivies sur les personnages (les hordes n'en posent pas)
+
+    Returns:
+        FightResult (alive_monsters = hordes encore debout)
+    """
+    from .combat_simulator import FightResult, play_turns
+
+    rng = getattr(combat_system, 'rng', None) or default_rng
+    events = getattr(combat_system, 'events', None)
+    hordes = as_hordes(enemies)
+    roster = CombatRoster(party, hordes)
+    profiles = {}
+    if conditions is not None:
+        for char in party:
+            conditions.observe(char)
+
+    def character_turn(char):
+        """Attaque du monstre le plus faible"""
+        if id(char) not in profiles:
+            attack_bonus, damage_dice, ability_mod = EnhancedCombatSystem.get_attack_profile(char)
+            profiles[id(char)] = (attack_bonus, parse_dice(damage_dice), ability_mod)
+        attack_bonus, dice, ability_mod = profiles[id(char)]
+
+        horde = min((h for h in hordes if h.alive), key=lambda h: h.hit_points_array[h.weakest()])
+        index = horde.weakest()
+
+        # Comme EnhancedCombatSystem: dommages tirés avant le d20, total doublé sur un 20
+        damage = max(1, dice.roll(rng) + ability_mod)
+        attack_roll = rng.d20()
+        hit = attack_roll == 20 or (attack_roll != 1 and attack_roll + attack_bonus >= horde.armor_class)
+        if events is not None:
+            event_type = CombatEventType.CRIT if attack_roll == 20 else (
+                CombatEventType.HIT if hit else CombatEventType.MISS)
+            events.emit(CombatEventType.ATTACK, char, horde.template)
+            events.emit(event_type, char, horde.template, 0, attack_roll, attack_bonus, horde.armor_class)
+        if not hit:
+            return
+
+        if attack_roll == 20:
+            damage *= 2
+        if events is not None:
+            events.emit(CombatEventType.DAMAGE, char, horde.template, damage)
+        if horde.take_damage(index, damage):
+            if not horde.alive:
+                roster.kill(horde)
+            if events is not None:
+                events.emit(CombatEventType.DEATH, char, horde.template)
+            if combat_system:
+                combat_system._handle_victory(char, horde.template, weapons, armors, equipments, potions)
+
+    def take_turn(combatant, round_num: int):
+        if isinstance(combatant, MonsterHorde):
+            combatant.attack(roster, rng, combat_system)
+        else:
+            character_turn(combatant)
+        if conditions is not None:
+            conditions.track_pending(source=combatant)
+
+    def begin_round(round_num: int):
+        if conditions is not None and round_num > 1:
+            conditions.advance(1)
+        if events is not None:
+            events.begin_round(round_num)
+        if on_round:
+            on_round(round_num)
+
+    def join(monster) -> MonsterHorde:
+        horde, = as_hordes([monster])
+        hordes.append(horde)
+        roster.add_monster(horde)
+        return horde
+
+    rounds = play_turns(roster, party, list(hordes), take_turn, begin_round, join, max_rounds,
+                        initiative, reinforcements, rng)
+
+    if conditions is not None:
+        for char in party:
+            conditions.release(char)
+    return FightResult(
+        victory=roster.has_characters,
+        rounds=rounds,
+        alive_chars=list(roster.characters),
+        alive_monsters=[h for h in hordes if h.alive]
+    )
@@ -0,0 +1,178 @@
+"""
+Initiative - Ordonnanceur des tours de combat par initiative (tas binaire)
+Chaque combattant a une entrée (round, -initiative, -DEX, ordre d'arrivée) dans
+un tas: le prochain tour coûte O(log n), sans recopier les listes de combattants
+Les morts sont retirés paresseusement (ignorés quand leur entrée sort du tas)
+
+Gère l'initiative D&D 5e (d20 + modificateur de DEX), les actions retardées,
+les actions préparées (déclenchées par le tour d'un autre combattant) et
+l'arrivée de renforts en cours de combat
+"""
+
+import heapq
+from itertools import count
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from ..core.rng import GameRNG, default_rng
+
+
+class Turn(NamedTuple):
+    """Tour de jeu d'un combattant"""
+    combatant: object
+    round_num: int
+    initiative: int
+    readied: bool = False  # Action préparée déclenchée (hors ordre d'initiative)
+
+
+def dex_modifier(combatant) -> int:
+    abilities = getattr(combatant, 'abilities', None)
+    return (getattr(abilities, 'dex', 10) - 10) // 2
+
+
+class InitiativeScheduler:
+    """
+    File de priorité des tours
+    Ordre dans un round: initiative décroissante, puis DEX, puis ordre d'arrivée
+    """
+
+    def __init__(self, rng: Optional[GameRNG] = None):
+        self.rng = rng or default_rng
+        self.round_num = 1
+        self._heap: List[list] = []
+        self._entries: Dict[int, list] = {}        # id -> entrée active dans le tas
+        self._initiatives: Dict[int, int] = {}
+        self._readied: Dict[int, tuple] = {}       # id -> (combattant, déclencheur)
+        self._sequence = count()
+        self._current: Optional[list] = None       # Entrée du tour en cours
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, combatant) -> bool:
+        return id(combatant) in self._entries
+
+    def initiative_of(self, combatant) -> Optional[int]:
+        return self._initiatives.get(id(combatant))
+
+    # Entrées du tas
+
+    def _push(self, combatant, round_num: int, initiative: int):
+        key = id(combatant)
+        previous = self._entries.get(key)
+        if previous is not None:
+            previous[-1] = None  # Entrée périmée, ignorée à sa sortie du tas
+        entry = [round_num, -initiative, -dex_modifier(combatant), next(self._sequence), combatant]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+
+    def roll_initiative(self, combatant) -> int:
+        """d20 + modificateur de DEX"""
+        return self.rng.d20() + dex_modifier(combatant)
+
+    def add(self, combatant, initiative: Optional[int] = None) -> int:
+        """
+        Ajouter un combattant (début de combat ou renfort)
+        Un renfort agit dès ce round si son initiative vient après le tour en cours,
+        sinon au round suivant
+
+        Returns:
+            Initiative du combattant
+        """
+        if initiative is None:
+            initiative = self.roll_initiative(combatant)
+        self._initiatives[id(combatant)] = initiative
+        round_num = self.round_num
+        if self._current is not None and (-initiative, -dex_modifier(combatant)) <= tuple(self._current[1:3]):
+            round_num += 1
+        self._push(combatant, round_num, initiative)
+        return initiative
+
+    def add_all(self, combatants) -> None:
+        for combatant in combatants:
+            self.add(combatant)
+
+    def remove(self, combatant):
+        """Retirer un combattant (mort, fuite)"""
+        key = id(combatant)
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry[-1] = None
+        self._readied.pop(key, None)
+
+    # Déroulement
+
+    def next_turn(self, is_alive: Optional[Callable[[object], bool]] = None) -> Optional[Turn]:
+        """
+        Tour suivant (None quand plus personne ne peut agir)
+        Le combattant est replacé au round suivant, avec la même initiative
+
+        Args:
+            is_alive: Prédicat; les combattants morts sont retirés à leur sortie du tas
+        """
+        heap = self._heap
+        while heap:
+            entry = heapq.heappop(heap)
+            combatant = entry[-1]
+            if combatant is None:
+                continue
+            key = id(combatant)
+            if is_alive is not None and not is_alive(combatant):
+                del self._entries[key]
+                self._readied.pop(key, None)
+                continue
+
+            # Action préparée non déclenchée: perdue au début de son tour suivant
+            self._readied.pop(key, None)
+            self.round_num = entry[0]
+            self._current = entry
+            del self._entries[key]
+            self._push(combatant, entry[0] + 1, self._initiatives[key])
+            return Turn(combatant, entry[0], -entry[1])
+        self._current = None
+        return None
+
+    def delay(self, combatant, initiative: int) -> bool:
+        """
+        Retarder le tour en cours: le combattant rejoue plus tard dans ce round,
+        avec cette nouvelle initiative (conservée pour les rounds suivants)
+
+        Returns:
+            False si l'initiative demandée ne vient pas après le tour en cours
+        """
+        current = self._current
+        if current is None or current[-1] is not combatant:
+            return False
+        if -initiative < current[1]:
+            return False
+        # Placé après les tours de même initiative (ordre d'arrivée)
+        self._initiatives[id(combatant)] = initiative
+        self._push(combatant, current[0], initiative)
+        return True
+
+    def ready(self, combatant, trigger: Callable[[object], bool]) -> bool:
+        """
+        Préparer une action: le combattant renonce à son tour et agit dès qu'un
+        autre combattant termine un tour satisfaisant `trigger(acteur)`
+        (avant son propre tour suivant, sinon l'action est perdue)
+        """
+        if id(combatant) not in self._entries:
+            return False
+        self._readied[id(combatant)] = (combatant, trigger)
+        return True
+
+    def triggered(self, actor, is_alive: Optional[Callable[[object], bool]] = None) -> List[Turn]:
+        """Actions préparées déclenchées par le tour de `actor` (consommées)"""
+        if not self._readied:
+            return []
+        turns = []
+        for key, (combatant, trigger) in list(self._readied.items()):
+            if combatant is actor or (is_alive is not None and not is_alive(combatant)):
+                continue
+            if trigger(actor):
+                del self._readied[key]
+                turns.append(Turn(combatant, self.round_num, self._initiatives[key], readied=True))
+        return turns
+
+    def order(self) -> List[object]:
+        """Ordre des tours à venir (inspection, O(n log n))"""
+        return [entry[-1] for entry in sorted(self._heap) if entry[-1] is not None]
@@ -96,9 +96,20 @@ class MerchantSystem:
     # Predefined merchant stocks
     MERCHANTS: Dict[str, MerchantStock] = {}
 
+    # Marchands servis par la boutique du village
+    VILLAGE_MERCHANT_IDS = ("village", "desert_merchant")
+
     @classmethod
     def create_village_merchant(cls, weapons=None, armors=None) -> MerchantStock:
-        """Create default village merchant with weapons and armors from game"""
+        """Create default village merchant and register it in MERCHANTS"""
+        merchant = cls.build_village_merchant(weapons, armors)
+        for merchant_id in cls.VILLAGE_MERCHANT_IDS:
+            cls.MERCHANTS[merchant_id] = merchant  # Réutiliser pour le désert
+        return merchant
+
+    @staticmethod
+    def build_village_merchant(weapons=None, armors=None) -> MerchantStock:
+        """Build default village merchant with weapons and armors from game (not registered)"""
         merchant = MerchantStock("Boutique du Village")
 
         # Potions
@@ -236,26 +247,24 @@ class MerchantSystem:
                       armor_class=2, armor_type="shield"),
                 quantity=3, price=10)
 
-        cls.MERCHANTS["village"] = merchant
-        cls.MERCHANTS["desert_merchant"] = merchant  # Réutiliser pour le désert
         return merchant
 
-    @classmethod
-    def get_merchant(cls, merchant_id: str, weapons=None, armors=None) -> Optional[MerchantStock]:
-        """Get merchant by ID"""
+    def get_merchant(self, merchant_id: str, weapons=None, armors=None) -> Optional[MerchantStock]:
+        """Get merchant by ID (stocks owned by this MerchantSystem, i.e. by one game)"""
         # Si weapons ou armors sont fournis, recréer le marchand
-        if merchant_id in ["village", "desert_merchant"]:
-            if weapons is not None or armors is not None:
-                # Recréer avec les nouvelles armes/armures
-                return cls.create_village_merchant(weapons, armors)
-            elif merchant_id not in cls.MERCHANTS:
-                # Créer pour la première fois
-                return cls.create_village_merchant(None, None)
+        if merchant_id in self.VILLAGE_MERCHANT_IDS:
+            if weapons is not None or armors is not None or merchant_id not in self.merchants:
+                # Recréer avec les nouvelles armes/armures (ou créer pour la première fois)
+                merchant = self.build_village_merchant(weapons, armors)
+                for village_id in self.VILLAGE_MERCHANT_IDS:
+                    self.merchants[village_id] = merchant
 
-        return cls.MERCHANTS.get(merchant_id)
+        return self.merchants.get(merchant_id)
 
     def __init__(self):
         self.transaction_log: List[Dict] = []
+        # Stocks de cette partie (jamais partagés entre parties hébergées)
+        self.merchants: Dict[str, MerchantStock] = {}
 
     def buy_item(self, character, merchant: MerchantStock, item_id: str,
                  quantity: int = 1) -> bool:
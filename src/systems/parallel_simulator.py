@@ -0,0 +1,148 @@
+"""
+Parallel Combat Simulator - Répartit les simulations Monte Carlo sur tous les cœurs
+Chaque lot de combats est joué dans un processus séparé avec sa propre graine
+Les catalogues (monstres, règles) sont préparés par le processus parent avant
+la création du pool; les workers les ouvrent en mmap (pages partagées, aucune copie)
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from ..core.rng import GameRNG
+from .combat_simulator import CombatSimulator, SimulationStats
+
+
+# État propre à chaque processus worker (initialisé une seule fois par processus)
+_worker_monster_factory = None
+
+
+def _default_monster_factory():
+    """Factory par défaut: monstres locaux + dnd_5e_core"""
+    from ..scenarios.base_scenario import MonsterFactoryWrapper
+    return MonsterFactoryWrapper()
+
+
+def prepare_shared_catalogs() -> Dict[str, Optional[str]]:
+    """
+    Compiler si besoin et ouvrir les catalogues partagés dans le processus courant
+    (à appeler avant de créer les workers: fork les hérite, spawn les rouvre sans recompiler)
+
+    Returns:
+        Chemins des catalogues disponibles ('monsters', 'rules')
+    """
+    from ..utils.monster_catalog import open_default_catalog
+    from ..utils.rules_catalog import open_rules_catalog
+
+    monsters = open_default_catalog()
+    rules = open_rules_catalog()
+    return {
+        'monsters': str(monsters.path) if monsters is not None else None,
+        'rules': str(rules.path) if rules is not None else None,
+    }
+
+
+def _attach_shared_catalogs(catalog_paths: Dict[str, Optional[str]]):
+    """Ouvrir dans le worker les catalogues préparés par le parent (jamais de compilation)"""
+    from ..utils.monster_catalog import open_default_catalog
+    from ..utils.rules_catalog import open_rules_catalog
+
+    if catalog_paths.get('monsters'):
+        open_default_catalog(path=catalog_paths['monsters'], build=False)
+    if catalog_paths.get('rules'):
+        open_rules_catalog(catalog_paths['rules'], build=False)
+
+
+def _init_worker(monster_factory_builder: Callable, catalog_paths: Optional[Dict[str, Optional[str]]] = None):
+    """Initialiser le worker: attacher les catalogues, construire la factory de monstres une seule fois"""
+    global _worker_monster_factory
+    if catalog_paths:
+        _attach_shared_catalogs(catalog_paths)
+    _worker_monster_factory = monster_factory_builder()
+
+
+def _simulate_chunk(party: List, scene_data: Dict, trials: int, seed: int,
+                    max_rounds: int) -> SimulationStats:
+    """Jouer un lot de combats dans le worker courant"""
+    from ..scenes.scene_factory import SceneFactory
+
+    # Flux aléatoire indépendant pour ce lot
+    # (le module random reste utilisé par les monstres de dnd_5e_core)
+    random.seed(seed)
+
+    scene = SceneFactory.create_scene_from_dict(scene_data, _worker_monster_factory)
+    simulator = CombatSimulator(party, _worker_monster_factory, max_rounds=max_rounds,
+                                rng=GameRNG(seed))
+    return simulator.simulate_scene(scene, trials)
+
+
+class ParallelCombatSimulator:
+    """
+    Simulateur Monte Carlo multi-processus
+    Les scènes sont transmises sous forme de dict JSON (reconstruites dans les workers)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None,
+                 monster_factory_builder: Optional[Callable] = None,
+                 max_rounds: int = 50,
+                 chunk_size: int = 250,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            max_workers: Nombre de processus (défaut: nombre de cœurs)
+            monster_factory_builder: Callable picklable retournant une factory de monstres
+            max_rounds: Nombre maximum de rounds par combat
+            chunk_size: Nombre de combats par lot envoyé à un worker
+            seed: Graine maîtresse (résultats reproductibles si fournie)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.monster_factory_builder = monster_factory_builder or _default_monster_factory
+        self.max_rounds = max_rounds
+        self.chunk_size = max(1, chunk_size)
+        self.seed = seed
+
+    def _split(self, trials: int) -> List[int]:
+        """Découper `trials` en lots de taille chunk_size"""
+        chunks = [self.chunk_size] * (trials // self.chunk_size)
+        if trials % self.chunk_size:
+            chunks.append(trials % self.chunk_size)
+        return chunks
+
+    def simulate_many(self, jobs: List[Tuple[Hashable, List, Dict]],
+                      trials: int = 10000) -> Dict[Hashable, SimulationStats]:
+        """
+        Simuler plusieurs scènes en parallèle
+
+        Args:
+            jobs: Liste de (clé, groupe, scene_data) - scene_data au format data/scenes/*.json
+            trials: Nombre de combats par scène
+
+        Returns:
+            Dict clé -> SimulationStats fusionnées
+        """
+        # Une graine par lot, dérivée de la graine maîtresse
+        seeder = random.Random(self.seed)
+        results = {key: SimulationStats() for key, _, _ in jobs}
+        catalog_paths = prepare_shared_catalogs()
+
+        with ProcessPoolExecutor(max_workers=self.max_workers,
+                                 initializer=_init_worker,
+                                 initargs=(self.monster_factory_builder, catalog_paths)) as executor:
+            futures = {}
+            for key, party, scene_data in jobs:
+                for chunk in self._split(trials):
+                    future = executor.submit(_simulate_chunk, party, scene_data, chunk,
+                                             seeder.getrandbits(64), self.max_rounds)
+                    futures[future] = key
+
+            for future in as_completed(futures):
+                results[futures[future]].merge(future.result())
+
+        return results
+
+    def simulate_scene_data(self, party: List, scene_data: Dict,
+                            trials: int = 10000) -> SimulationStats:
+        """Simuler une seule scène de combat en parallèle"""
+        key = scene_data.get('id')
+        return self.simulate_many([(key, party, scene_data)], trials)[key]
@@ -0,0 +1,288 @@
+"""
+Scenario Explorer - Exploration exhaustive des embranchements d'un scénario JSON
+Chaque état est (scène, compteurs de game_state, tranche de HP du groupe);
+un état déjà rencontré n'est jamais réexploré (mémoïsation), ce qui borne le
+travail au nombre d'états distincts au lieu du nombre de chemins
+
+Les choix sont supposés équiprobables (politique aléatoire de ScriptedRenderer);
+les issues des combats sont échantillonnées avec le simulateur headless, une
+fois par (scène de combat, tranche de HP)
+"""
+
+import json
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from ..core.rng import GameRNG
+from ..scenes.scene_factory import SceneFactory
+from ..scenes.scene_graph import TERMINAL_TARGETS
+from .combat_simulator import CombatSimulator, run_combat_loop
+
+# Issues terminales
+OUTCOME_ENDING = 'ending'          # Scène sans suite: fin du scénario
+OUTCOME_GAME_OVER = 'game_over'    # Défaite en combat ou cible 'game_over'
+OUTCOME_DEAD_END = 'dead_end'      # Lien cassé, scène inconnue, choix vide
+OUTCOME_TRUNCATED = 'truncated'    # Limite d'états atteinte
+
+# En dessous de ce seuil, la masse de probabilité restante est considérée piégée
+EPSILON = 1e-12
+
+
+class Outcome(NamedTuple):
+    """Issue terminale d'une partie"""
+    kind: str
+    scene_id: str
+
+
+@dataclass
+class ExplorationReport:
+    """Résultat de l'exploration d'un scénario"""
+    scenario: str
+    states: int = 0
+    transitions: int = 0
+    endings: Dict[str, float] = field(default_factory=dict)     # Scène finale -> probabilité
+    dead_ends: Dict[str, float] = field(default_factory=dict)   # Scène bloquante -> probabilité
+    game_over: float = 0.0
+    trapped: float = 0.0                                        # Cycles sans issue
+    truncated: float = 0.0                                      # États non explorés (limite)
+    combat_win_rates: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def reachable_endings(self) -> List[str]:
+        return sorted(self.endings)
+
+    def summary(self) -> str:
+        """Résumé lisible de l'exploration"""
+        lines = [
+            f"Scénario: {self.scenario} | États: {self.states} | Transitions: {self.transitions} | "
+            f"Game over: {self.game_over:.1%}"
+        ]
+        for scene_id, probability in sorted(self.endings.items(), key=lambda item: -item[1]):
+            lines.append(f"  🏁 {scene_id}: {probability:.1%}")
+        for scene_id, probability in sorted(self.dead_ends.items(), key=lambda item: -item[1]):
+            lines.append(f"  ⛔ {scene_id}: {probability:.1%} (impasse)")
+        if self.trapped > EPSILON:
+            lines.append(f"  🔁 Cycles sans issue: {self.trapped:.1%}")
+        if self.truncated > EPSILON:
+            lines.append(f"  ✂️  Non exploré (limite d'états): {self.truncated:.1%}")
+        for scene_id, rate in self.combat_win_rates.items():
+            lines.append(f"  ⚔️  {scene_id}: {rate:.1%} de victoires")
+        return '\n'.join(lines)
+
+
+# Cible d'une transition: numéro d'état ou issue terminale
+Target = Union[int, Outcome]
+
+
+class ScenarioExplorer:
+    """
+    Explorateur de scénario
+    Construit le graphe des états accessibles depuis la scène de départ, puis
+    propage les probabilités jusqu'aux issues terminales
+    """
+
+    def __init__(self, scenario_data: Dict, party: List, monster_factory=None,
+                 samples: int = 20, hp_buckets: int = 4, counters: Optional[Iterable[str]] = None,
+                 counter_limit: int = 3, max_states: int = 100_000, max_rounds: int = 50, rng: Optional[GameRNG] = None):
+        """
+        Args:
+            scenario_data: Données JSON du scénario (clé 'scenes')
+            party: Groupe de référence (copié pour chaque combat)
+            monster_factory: Factory des monstres des scènes de combat
+            samples: Combats simulés par (scène de combat, tranche de HP)
+            hp_buckets: Nombre de tranches de HP du groupe
+            counters: Compteurs de game_state distinguant les états
+                      (défaut: tous ceux modifiés par les effets des choix)
+            counter_limit: Valeur absolue maximale des compteurs (saturés au-delà:
+                           une boucle de choix n'engendre pas d'états sans fin)
+            max_states: Limite d'états explorés (compteurs non bornés dans un cycle)
+            max_rounds: Nombre maximum de rounds par combat
+            rng: Générateur des combats (exploration reproductible)
+        """
+        self.scenario_name = scenario_data.get('name') or scenario_data.get('scenario_id', '?')
+        self.manager = SceneFactory.build_scene_manager_from_json(scenario_data, monster_factory)
+        self.graph = self.manager.graph
+        self.scenes_data = {scene_data['id']: scene_data
+                            for scene_data in scenario_data.get('scenes', []) if scene_data.get('id')}
+        self.simulator = CombatSimulator(party, monster_factory, max_rounds=max_rounds, rng=rng)
+        self.samples = samples
+        self.hp_buckets = hp_buckets
+        self.max_states = max_states
+        if counters is None:
+            counters = sorted({key for scene_data in self.scenes_data.values()
+                               for choice in scene_data.get('choices', []) or []
+                               for key in (choice.get('effects') or {})})
+        self.counters = tuple(counters)
+        self.counter_limit = counter_limit
+        self._combat_cache: Dict[Tuple[int, int], List[Tuple[float, bool, int]]] = {}
+
+    @classmethod
+    def from_file(cls, json_file_path: str, party: List, monster_factory=None, **kwargs) -> 'ScenarioExplorer':
+        """Explorateur d'un fichier data/scenes/*.json"""
+        with open(Path(json_file_path), 'r', encoding='utf-8') as f:
+            return cls(json.load(f), party, monster_factory, **kwargs)
+
+    # Combats
+
+    def _party_bucket(self, party: List) -> int:
+        """Tranche de HP d'un groupe (1..hp_buckets tant qu'un membre est debout)"""
+        max_hp = sum(char.max_hit_points for char in party)
+        hp = sum(max(0, char.hit_points) for char in party)
+        if hp <= 0 or max_hp <= 0:
+            return 0
+        return max(1, math.ceil(hp * self.hp_buckets / max_hp))
+
+    def _combat_outcomes(self, scene_number: int, bucket: int) -> List[Tuple[float, bool, int]]:
+        """
+        Issues échantillonnées d'un combat pour une tranche de HP
+
+        Returns:
+            [(probabilité, victoire, tranche de HP après le combat)]
+        """
+        key = (scene_number, bucket)
+        cached = self._combat_cache.get(key)
+        if cached is not None:
+            return cached
+
+        scene = self.manager.scenes[self.graph.ids[scene_number]]
+        simulator = self.simulator
+        counts: Dict[Tuple[bool, int], int] = {}
+        for _ in range(self.samples):
+            party = simulator.copy_party()
+            # Approximation: HP de la tranche répartis uniformément sur le groupe
+            for char in party:
+                char.hit_points = max(1, math.ceil(char.max_hit_points * bucket / self.hp_buckets))
+            enemies = scene.enemies_factory(simulator.game_context)
+            result = run_combat_loop(simulator.combat_system, party, enemies,
+                                     max_rounds=simulator.max_rounds, compact=simulator.compact)
+            outcome = (result.victory, self._party_bucket(party))
+            counts[outcome] = counts.get(outcome, 0) + 1
+
+        outcomes = [(count / self.samples, victory, after) for (victory, after), count in counts.items()]
+        self._combat_cache[key] = outcomes
+        return outcomes
+
+    # Transitions
+
+    def _successors(self, state: Tuple[int, Tuple[int, ...], int]) -> List[Tuple[float, object]]:
+        """Successeurs d'un état: [(probabilité, état ou Outcome)]"""
+        scene_number, counters, bucket = state
+        scene_id = self.graph.ids[scene_number]
+        scene_data = self.scenes_data[scene_id]
+        scene_type = scene_data.get('type')
+
+        def go(target_id: Optional[str], counters=counters, bucket=bucket):
+            if not target_id:
+                return Outcome(OUTCOME_ENDING, scene_id)
+            target = self.graph.number(target_id)
+            if target >= 0 and self.graph.ids[target] in self.manager.scenes:
+                return target, counters, bucket
+            if target_id in TERMINAL_TARGETS:
+                return Outcome(OUTCOME_GAME_OVER, scene_id)
+            return Outcome(OUTCOME_DEAD_END, scene_id)
+
+        if scene_id not in self.manager.scenes:
+            return [(1.0, Outcome(OUTCOME_DEAD_END, scene_id))]
+
+        if scene_type == 'choice':
+            choices = scene_data.get('choices', []) or []
+            if not choices:
+                return [(1.0, Outcome(OUTCOME_DEAD_END, scene_id))]
+            successors = []
+            for choice in choices:
+                values = counters
+                effects = choice.get('effects') or {}
+                if effects:
+                    limit = self.counter_limit
+                    values = tuple(max(-limit, min(limit, value + effects.get(name, 0)))
+                                   for name, value in zip(self.counters, counters))
+                successors.append((1.0 / len(choices), go(choice.get('next_scene'), values)))
+            return successors
+
+        if scene_type == 'combat':
+            successors = []
+            for probability, victory, after in self._combat_outcomes(scene_number, bucket):
+                if victory:
+                    target = go(scene_data.get('on_victory'), bucket=after)
+                else:
+                    # Défaite (groupe tombé ou limite de rounds): on_defeat, game_over par défaut
+                    target = go(scene_data.get('on_defeat') or 'game_over', bucket=after)
+                successors.append((probability, target))
+            return successors
+
+        if scene_type == 'rest' and scene_data.get('rest_type', 'long') == 'long':
+            return [(1.0, go(scene_data.get('next_scene'), bucket=self.hp_buckets))]
+
+        return [(1.0, go(scene_data.get('next_scene')))]
+
+    # Exploration
+
+    def explore(self) -> ExplorationReport:
+        """Explorer tous les états accessibles et calculer les probabilités des issues"""
+        report = ExplorationReport(self.scenario_name)
+        if self.graph is None or self.graph.start < 0:
+            return report
+
+        start = (self.graph.start, (0,) * len(self.counters), self.hp_buckets)
+        index: Dict[tuple, int] = {start: 0}
+        states = [start]
+        transitions: List[List[Tuple[float, Target]]] = []
+
+        # Parcours en largeur: chaque état distinct n'est développé qu'une fois
+        position = 0
+        while position < len(states):
+            edges = []
+            for probability, successor in self._successors(states[position]):
+                if not isinstance(successor, Outcome):
+                    number = index.get(successor)
+                    if number is None:
+                        if len(states) >= self.max_states:
+                            successor = Outcome(OUTCOME_TRUNCATED, self.graph.ids[successor[0]])
+                        else:
+                            number = index[successor] = len(states)
+                            states.append(successor)
+                    if number is not None:
+                        successor = number
+                edges.append((probability, successor))
+            transitions.append(edges)
+            position += 1
+
+        report.states = len(states)
+        report.transitions = sum(len(edges) for edges in transitions)
+        self._propagate(transitions, report)
+        report.combat_win_rates = self._combat_win_rates()
+        return report
+
+    def _propagate(self, transitions: List[List[Tuple[float, Target]]], report: ExplorationReport,
+                   max_steps: int = 100_000):
+        """Propager la masse de probabilité depuis l'état initial jusqu'aux issues"""
+        mass = {0: 1.0}
+        for _ in range(max_steps):
+            if sum(mass.values()) < EPSILON:
+                break
+            flowing: Dict[int, float] = {}
+            for number, weight in mass.items():
+                for probability, target in transitions[number]:
+                    share = weight * probability
+                    if not isinstance(target, Outcome):
+                        flowing[target] = flowing.get(target, 0.0) + share
+                    elif target.kind == OUTCOME_ENDING:
+                        report.endings[target.scene_id] = report.endings.get(target.scene_id, 0.0) + share
+                    elif target.kind == OUTCOME_GAME_OVER:
+                        report.game_over += share
+                    elif target.kind == OUTCOME_DEAD_END:
+                        report.dead_ends[target.scene_id] = report.dead_ends.get(target.scene_id, 0.0) + share
+                    else:
+                        report.truncated += share
+            mass = flowing
+        report.trapped = sum(mass.values())
+
+    def _combat_win_rates(self) -> Dict[str, float]:
+        """Taux de victoire à pleine santé des combats échantillonnés"""
+        rates = {}
+        for (scene_number, bucket), outcomes in sorted(self._combat_cache.items()):
+            if bucket == self.hp_buckets:
+                rates[self.graph.ids[scene_number]] = sum(p for p, victory, _ in outcomes if victory)
+        return rates
@@ -4,7 +4,10 @@ Spellcasting system for managing spells and spell slots
 
 from typing import Dict, List, Optional
 from dataclasses import dataclass
-import random
+
+from ..core.dice import parse_dice
+from ..core.rng import GameRNG, default_rng
+from .conditions import ConditionEngine
 
 
 @dataclass
@@ -23,41 +26,22 @@ class Spell:
     save_type: Optional[str] = None  # DEX, CON, etc.
     save_dc: int = 13  # Default DC
 
-    def roll_damage(self) -> int:
+    def roll_damage(self, rng: Optional[GameRNG] = None) -> int:
         """Roll spell damage"""
         if not self.damage_dice:
             return 0
-        return self._roll_dice(self.damage_dice)
+        return self._roll_dice(self.damage_dice, rng)
 
-    def roll_healing(self) -> int:
+    def roll_healing(self, rng: Optional[GameRNG] = None) -> int:
         """Roll spell healing"""
         if not self.healing_dice:
             return 0
-        return self._roll_dice(self.healing_dice)
+        return self._roll_dice(self.healing_dice, rng)
 
     @staticmethod
-    def _roll_dice(dice_str: str) -> int:
-        """Parse and roll dice (e.g., '3d8+5')"""
-        total = 0
-
-        # Handle bonus
-        if '+' in dice_str:
-            dice_part, bonus = dice_str.split('+')
-            total += int(bonus)
-        elif '-' in dice_str:
-            dice_part, penalty = dice_str.split('-')
-            total -= int(penalty)
-        else:
-            dice_part = dice_str
-
-        # Roll dice
-        if 'd' in dice_part:
-            num, sides = map(int, dice_part.split('d'))
-            total += sum(random.randint(1, sides) for _ in range(num))
-        else:
-            total += int(dice_part)
-
-        return max(0, total)
+    def _roll_dice(dice_str: str, rng: Optional[GameRNG] = None) -> int:
+        """Roll dice (e.g., '3d8+5'), expression compiled once and cached"""
+        return max(0, parse_dice(dice_str).roll(rng))
 
 
 class SpellcastingSystem:
@@ -160,8 +144,9 @@ class SpellcastingSystem:
         )
     }
 
-    def __init__(self):
-        self.active_effects: Dict[str, List] = {}  # character_name: [effects]
+    def __init__(self, conditions: Optional[ConditionEngine] = None):
+        # Effets actifs (durées en rounds), partagés avec la boucle de combat
+        self.conditions = conditions if conditions is not None else ConditionEngine()
 
     def get_spell(self, spell_id: str) -> Optional[Spell]:
         """Get spell from library"""
@@ -176,7 +161,8 @@ class SpellcastingSystem:
         # Check spell slots
         return character.can_cast_spell(spell.level)
 
-    def cast_healing_spell(self, character, spell: Spell, target) -> Optional[int]:
+    def cast_healing_spell(self, character, spell: Spell, target,
+                           rng: Optional[GameRNG] = None) -> Optional[int]:
         """Cast a healing spell"""
         if not self.can_cast(character, spell):
             return None
@@ -186,7 +172,7 @@ class SpellcastingSystem:
             character.cast_spell(spell.level)
 
         # Roll healing
-        healing = spell.roll_healing()
+        healing = spell.roll_healing(rng)
 
         # Apply healing
         old_hp = target.hit_points
@@ -195,11 +181,14 @@ class SpellcastingSystem:
 
         return actual_healing
 
-    def cast_damage_spell(self, character, spell: Spell, target) -> Optional[Dict]:
+    def cast_damage_spell(self, character, spell: Spell, target,
+                          rng: Optional[GameRNG] = None) -> Optional[Dict]:
         """Cast a damage spell"""
         if not self.can_cast(character, spell):
             return None
 
+        rng = rng or default_rng
+
         # Use spell slot
         if spell.level > 0:
             character.cast_spell(spell.level)
@@ -213,14 +202,14 @@ class SpellcastingSystem:
         # Check if spell requires save
         if spell.save_type:
             # Target makes saving throw
-            save_roll = random.randint(1, 20)
+            save_roll = rng.d20()
             save_modifier = getattr(target.abilities, spell.save_type.lower(), 10) // 2 - 5
             save_total = save_roll + save_modifier
 
             result['save_success'] = save_total >= spell.save_dc
 
             # Half damage on successful save for some spells
-            damage = spell.roll_damage()
+            damage = spell.roll_damage(rng)
             if result['save_success']:
                 damage = damage // 2
 
@@ -228,12 +217,12 @@ class SpellcastingSystem:
             result['damage'] = damage
         else:
             # Spell attack roll
-            attack_roll = random.randint(1, 20)
+            attack_roll = rng.d20()
             spell_attack_bonus = character.get_attack_bonus()  # Intelligence modifier + proficiency
 
             if attack_roll + spell_attack_bonus >= target.armor_class:
                 result['hit'] = True
-                result['damage'] = spell.roll_damage()
+                result['damage'] = spell.roll_damage(rng)
 
         # Apply damage
         if result['hit']:
@@ -250,10 +239,9 @@ class SpellcastingSystem:
         if spell.level > 0:
             character.cast_spell(spell.level)
 
-        # Apply effect (simplified)
+        # Apply effect: +5 CA jusqu'au début du prochain tour du lanceur
         if spell.name == "Bouclier":
-            target.armor_class += 5
-            # TODO: Add effect tracking with duration
+            self.conditions.apply(target, 'shield', rounds=1, modifiers={'armor_class': 5}, source=character)
 
         return True
 
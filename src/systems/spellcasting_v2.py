@@ -7,7 +7,10 @@ from typing import Dict, Optional, List
 from dnd_5e_core.spells import Spell
 from dnd_5e_core import Character
 from dnd_5e_core.data import load_spell
-import random
+
+from ..core.dice import parse_dice
+from ..core.rng import GameRNG, default_rng
+from ..utils.rules_catalog import open_rules_catalog
 
 
 class SpellcastingManager:
@@ -28,7 +31,10 @@ class SpellcastingManager:
             return cls._spell_cache[spell_name]
 
         try:
-            spell = load_spell(spell_name)
+            rules = open_rules_catalog()
+            spell = rules.spell(spell_name) if rules is not None else None
+            if spell is None:
+                spell = load_spell(spell_name)
             if spell:
                 cls._spell_cache[spell_name] = spell
             return spell
@@ -85,7 +91,8 @@ class SpellcastingManager:
         return CharacterExtensions.can_cast_spell(character, spell.level)
 
     @staticmethod
-    def cast_healing_spell(character: Character, spell: Spell, target: Character) -> Optional[int]:
+    def cast_healing_spell(character: Character, spell: Spell, target: Character,
+                           rng: Optional[GameRNG] = None) -> Optional[int]:
         """
         Lancer sort de soin
         Retourne montant de soin ou None si échec
@@ -107,7 +114,7 @@ class SpellcastingManager:
             # Fallback simplifié
             heal_dice = "1d8+3" if spell.level == 1 else "2d8+3"
 
-        healing = SpellcastingManager._roll_dice(heal_dice)
+        healing = SpellcastingManager._roll_dice(heal_dice, rng)
 
         # Appliquer
         old_hp = target.hit_points
@@ -117,7 +124,8 @@ class SpellcastingManager:
         return actual_healing
 
     @staticmethod
-    def cast_damage_spell(character: Character, spell: Spell, target) -> Optional[Dict]:
+    def cast_damage_spell(character: Character, spell: Spell, target,
+                          rng: Optional[GameRNG] = None) -> Optional[Dict]:
         """
         Lancer sort de dégâts
         Retourne dict avec résultats ou None si échec
@@ -127,6 +135,8 @@ class SpellcastingManager:
         if not SpellcastingManager.can_cast(character, spell):
             return None
 
+        rng = rng or default_rng
+
         # Utiliser emplacement
         if spell.level > 0:
             CharacterExtensions.cast_spell(character, spell.level)
@@ -148,12 +158,12 @@ class SpellcastingManager:
         # Vérifier save ou attaque
         if hasattr(spell, 'dc'):
             # Sort avec jet de sauvegarde
-            save_roll = random.randint(1, 20)
+            save_roll = rng.d20()
             save_modifier = getattr(target.abilities, spell.dc.dc_type.name.lower(), 10) // 2 - 5
             save_total = save_roll + save_modifier
 
             result['save_success'] = save_total >= spell.dc.dc_value
-            damage = SpellcastingManager._roll_dice(damage_dice)
+            damage = SpellcastingManager._roll_dice(damage_dice, rng)
 
             if result['save_success']:
                 damage = damage // 2  # Demi-dégâts si save
@@ -162,12 +172,12 @@ class SpellcastingManager:
             result['damage'] = damage
         else:
             # Sort d'attaque
-            attack_roll = random.randint(1, 20)
+            attack_roll = rng.d20()
             spell_attack_bonus = (character.abilities.int // 2 - 5) + (character.level // 2)
 
             if attack_roll + spell_attack_bonus >= target.armor_class:
                 result['hit'] = True
-                result['damage'] = SpellcastingManager._roll_dice(damage_dice)
+                result['damage'] = SpellcastingManager._roll_dice(damage_dice, rng)
 
         # Appliquer dégâts
         if result['hit']:
@@ -176,26 +186,9 @@ class SpellcastingManager:
         return result
 
     @staticmethod
-    def _roll_dice(dice_str: str) -> int:
-        """Parser et lancer dés (ex: '2d8+3')"""
-        total = 0
-
-        if '+' in dice_str:
-            dice_part, bonus = dice_str.split('+')
-            total += int(bonus)
-        elif '-' in dice_str:
-            dice_part, penalty = dice_str.split('-')
-            total -= int(penalty)
-        else:
-            dice_part = dice_str
-
-        if 'd' in dice_part:
-            num, sides = map(int, dice_part.split('d'))
-            total += sum(random.randint(1, sides) for _ in range(num))
-        else:
-            total += int(dice_part)
-
-        return max(0, total)
+    def _roll_dice(dice_str: str, rng: Optional[GameRNG] = None, critical: bool = False) -> int:
+        """Lancer dés (ex: '2d8+3'), expression compilée une seule fois"""
+        return max(0, parse_dice(dice_str).roll(rng, critical))
 
     @staticmethod
     def format_spell_slots(character: Character) -> str:
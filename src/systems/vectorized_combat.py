@@ -0,0 +1,197 @@
+"""
+Vectorized Combat - Résolution NumPy de milliers de combats indépendants
+Reprend les règles d'EnhancedCombatSystem (jet d'attaque, critique, CA, dommages)
+mais résout un round pour tous les combats à la fois avec des tableaux NumPy
+
+Dépendance optionnelle: pip install numpy
+Limites: pas de sorts, potions ni attaques spéciales (comme les groupes de base
+des scénarios, qui n'en ont pas)
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from dnd_5e_core.combat import ActionType
+
+from ..core.dice import parse_dice
+from .combat_simulator import SimulationStats
+from .enhanced_combat import EnhancedCombatSystem
+
+# Dés compilés: (((nombre de dés, faces), ...), bonus fixe)
+CompiledDice = Tuple[Tuple[Tuple[int, int], ...], int]
+
+
+def _compile_dice(dice: str, bonus: int = 0) -> CompiledDice:
+    """Compiler "2d6+3" (+ bonus supplémentaire) via le moteur de dés"""
+    expression = parse_dice(dice)
+    return expression.terms, expression.bonus + bonus
+
+
+def _roll(rng: np.random.Generator, dice: CompiledDice, size: int) -> np.ndarray:
+    """Lancer des dés compilés pour `size` combats"""
+    terms, bonus = dice
+    total = np.full(size, bonus, dtype=np.int64)
+    for count, sides in terms:
+        rolled = rng.integers(1, sides + 1, size=(size, abs(count))).sum(axis=1)
+        total += rolled if count > 0 else -rolled
+    return total
+
+
+class VectorizedCombat:
+    """
+    N combats identiques (même groupe, mêmes monstres) résolus en parallèle
+    Axe 0 = combat, axe 1 = combattant (ordre du groupe / ordre des monstres)
+    """
+
+    def __init__(self, party: List, monsters: List, n_fights: int,
+                 rng: Optional[np.random.Generator] = None):
+        self.n_fights = n_fights
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.party = party
+        self.monsters = monsters
+
+        # Personnages: profil d'attaque d'EnhancedCombatSystem
+        profiles = [EnhancedCombatSystem.get_attack_profile(c) for c in party]
+        self.char_attack_bonus = [p[0] for p in profiles]
+        self.char_damage = [_compile_dice(p[1], p[2]) for p in profiles]
+        self.char_ac = np.array([c.armor_class for c in party], dtype=np.int64)
+        self.char_front = np.arange(len(party)) < 3
+
+        # Monstres: choix d'actions de mêlée (chaque choix = liste d'attaques)
+        self.monster_ac = np.array([getattr(m, 'armor_class', 12) for m in monsters], dtype=np.int64)
+        self.monster_xp = [m.xp for m in monsters]
+        self.monster_choices = [self._compile_monster_actions(m) for m in monsters]
+
+        # État mutable
+        self.char_hp = np.tile(np.array([c.hit_points for c in party], dtype=np.int64), (n_fights, 1))
+        self.monster_hp = np.tile(np.array([m.hit_points for m in monsters], dtype=np.int64), (n_fights, 1))
+        self.rounds = np.zeros(n_fights, dtype=np.int64)
+        self.round_num = 0
+
+    @staticmethod
+    def _compile_monster_actions(monster) -> List[List[Tuple[int, bool, List[CompiledDice]]]]:
+        """
+        Compiler les actions de mêlée d'un monstre
+        Retourne une liste de choix; chaque choix est une liste
+        d'attaques (bonus, désavantage, [dés compilés, ...])
+        """
+        actions = [a for a in getattr(monster, 'actions', None) or []
+                   if getattr(a, 'type', None) in (ActionType.MELEE, ActionType.MIXED)]
+
+        choices = []
+        for action in actions:
+            attacks = action.multi_attack if action.multi_attack else [action]
+            compiled = []
+            for attack in attacks:
+                if not hasattr(attack, 'attack_bonus'):
+                    continue
+                disadvantage = attack.type != ActionType.MELEE and 5.0 > attack.normal_range
+                groups = [_compile_dice(d.dd.dice, d.dd.bonus) for d in attack.damages or []]
+                compiled.append((attack.attack_bonus, disadvantage, groups))
+            choices.append(compiled)
+        return choices
+
+    @property
+    def active(self) -> np.ndarray:
+        """Combats encore en cours"""
+        return (self.char_hp > 0).any(axis=1) & (self.monster_hp > 0).any(axis=1)
+
+    def resolve_round(self):
+        """Résoudre un round (personnages puis monstres) pour tous les combats actifs"""
+        rng = self.rng
+        n = self.n_fights
+        rows = np.arange(n)
+        active = self.active
+        self.round_num += 1
+        self.rounds[active] = self.round_num
+
+        # Tours personnages: cible = monstre vivant avec le moins de HP
+        for i, dice in enumerate(self.char_damage):
+            acting = active & (self.char_hp[:, i] > 0) & (self.monster_hp > 0).any(axis=1)
+            if not acting.any():
+                continue
+
+            target = np.where(self.monster_hp > 0, self.monster_hp, np.iinfo(np.int64).max).argmin(axis=1)
+            damage = np.maximum(1, _roll(rng, dice, n))
+            attack_roll = rng.integers(1, 21, size=n)
+
+            crit = attack_roll == 20
+            hit = crit | ((attack_roll != 1) & (attack_roll + self.char_attack_bonus[i] >= self.monster_ac[target]))
+            damage = np.where(crit, damage * 2, damage)
+
+            applied = acting & hit
+            self.monster_hp[rows[applied], target[applied]] -= damage[applied]
+
+        # Tours monstres: cible aléatoire parmi la ligne de front accessible
+        for j, choices in enumerate(self.monster_choices):
+            alive_chars = self.char_hp > 0
+            acting = active & (self.monster_hp[:, j] > 0) & alive_chars.any(axis=1)
+            if not acting.any():
+                continue
+
+            front = alive_chars & self.char_front
+            back = alive_chars & ~self.char_front
+            back &= np.cumsum(back, axis=1) <= 3
+            candidates = np.where(front.any(axis=1)[:, None], front, back)
+            keys = np.where(candidates, rng.random(candidates.shape), -1.0)
+            target = keys.argmax(axis=1)
+
+            if not choices:
+                # Attaque de secours: 1d8 sans jet d'attaque
+                damage = rng.integers(1, 9, size=n)
+            else:
+                choice = rng.integers(0, len(choices), size=n)
+                damage = np.zeros(n, dtype=np.int64)
+                for c, attacks in enumerate(choices):
+                    chosen = choice == c
+                    for attack_bonus, disadvantage, groups in attacks:
+                        roll = rng.integers(1, 21, size=n)
+                        if disadvantage:
+                            roll = np.minimum(roll, rng.integers(1, 21, size=n))
+                        hit = chosen & (roll + attack_bonus >= self.char_ac[target])
+                        attack_damage = np.zeros(n, dtype=np.int64)
+                        for dice in groups:
+                            attack_damage += np.maximum(0, _roll(rng, dice, n))
+                        damage += np.where(hit, attack_damage, 0)
+
+            applied = acting & (damage > 0)
+            self.char_hp[rows[applied], target[applied]] -= damage[applied]
+
+    def run(self, max_rounds: int = 50) -> np.ndarray:
+        """
+        Jouer tous les combats jusqu'à leur fin
+
+        Returns:
+            Tableau booléen des victoires (au moins un personnage debout)
+        """
+        while self.round_num < max_rounds and self.active.any():
+            self.resolve_round()
+        return (self.char_hp > 0).any(axis=1)
+
+    def to_stats(self) -> SimulationStats:
+        """Convertir l'état final en SimulationStats (compatible avec le simulateur scalaire)"""
+        alive_chars = self.char_hp > 0
+        victory = alive_chars.any(axis=1)
+        timed_out = victory & (self.monster_hp > 0).any(axis=1)
+        rounds, counts = np.unique(self.rounds, return_counts=True)
+
+        stats = SimulationStats(
+            trials=self.n_fights,
+            wins=int(victory.sum()),
+            timeouts=int(timed_out.sum()),
+            rounds_histogram={int(r): int(c) for r, c in zip(rounds, counts)}
+        )
+        for i, char in enumerate(self.party):
+            stats.max_hp[char.name] = char.max_hit_points
+            stats.hp_remaining[char.name] = int(np.maximum(0, self.char_hp[:, i]).sum())
+            stats.deaths[char.name] = int((~alive_chars[:, i]).sum())
+        return stats
+
+    @classmethod
+    def simulate(cls, party: List, monsters: List, trials: int = 10000, max_rounds: int = 50,
+                 seed: Optional[int] = None) -> SimulationStats:
+        """Simuler `trials` combats du groupe contre les monstres donnés"""
+        combat = cls(party, monsters, trials, np.random.default_rng(seed))
+        combat.run(max_rounds)
+        return combat.to_stats()
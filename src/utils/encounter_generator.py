@@ -1,10 +1,12 @@
 """
 Générateur de rencontres aléatoires depuis tables PDF
 """
-import random
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 
+from ..core.dice import parse_dice
+from ..core.rng import GameRNG, default_rng
+
 
 @dataclass
 class EncounterTable:
@@ -17,12 +19,14 @@ class EncounterTable:
 class RandomEncounterGenerator:
     """Génère des rencontres aléatoires"""
 
-    def __init__(self, encounter_data: List[Dict]):
+    def __init__(self, encounter_data: List[Dict], rng: Optional[GameRNG] = None):
         """
         Args:
             encounter_data: Données extraites du PDF
+            rng: Générateur aléatoire de la session (défaut: générateur global)
         """
         self.tables = self._build_tables(encounter_data)
+        self.rng = rng or default_rng
 
     def _build_tables(self, data: List[Dict]) -> List[EncounterTable]:
         """Construire tables depuis données"""
@@ -81,12 +85,13 @@ class RandomEncounterGenerator:
 
     def _roll_dice(self, die_spec: str) -> int:
         """Lancer un dé (ex: "1d6" -> 1-6)"""
-        match = die_spec.split('d')
-        if len(match) == 2:
-            count = int(match[0])
-            sides = int(match[1])
-            return sum(random.randint(1, sides) for _ in range(count))
-        return 1
+        try:
+            dice = parse_dice(die_spec)
+        except ValueError:
+            return 1
+        if not dice.terms:
+            return 1
+        return dice.roll(self.rng)
 
     def _matches_roll(self, roll: int, roll_spec: str) -> bool:
         """Vérifier si le jet correspond au spec (ex: "1-2", "3", "4-6")"""
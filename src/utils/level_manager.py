@@ -2,6 +2,8 @@
 from typing import Dict, List
 from dnd_5e_core import Character
 
+from ..core.derived_stats import invalidate_derived_stats
+
 
 class LevelUpManager:
     """Gestionnaire de montée de niveau"""
@@ -30,6 +32,8 @@ class LevelUpManager:
         hp_gain = (hit_die // 2 + 1) + con_mod
         character.max_hit_points += hp_gain
         character.hit_points = character.max_hit_points
+        # Bonus de maîtrise (et profil d'attaque) à recalculer
+        invalidate_derived_stats(character)
         return True
 
     @classmethod
@@ -0,0 +1,328 @@
+"""
+Catalogue binaire précompilé des monstres (JSON local + dnd_5e_core)
+Les prototypes Monster sont sérialisés une fois dans un fichier unique;
+le fichier est ouvert en mmap et un monstre est lu via un index trié à
+enregistrements fixes, sans analyser le reste du corpus
+
+Format:
+    en-tête  MAGIC | signature (16 o) | nombre (u32) | position de l'index (u64)
+    données  prototypes picklés, bout à bout
+    index    clé (64 o, utf-8 complétée par des zéros) | position (u64) | taille (u32) | source (u8)
+             | colonnes: FP (f32) | XP (u32) | CA (u16) | HP (u32) | gabarit (u8) | type (u8)
+             | types de dommages (masque u32)
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+MAGIC = b'DMC2'
+# Version du compilateur de prototypes (incrémentée => catalogues existants périmés)
+COMPILER_VERSION = 2
+HEADER = struct.Struct('<4s16sIQ')
+ENTRY = struct.Struct('<64sQIBfIHIBBI')
+KEY_SIZE = 64
+
+# Valeurs codées des colonnes (UNKNOWN = absent)
+SIZES = ('Tiny', 'Small', 'Medium', 'Large', 'Huge', 'Gargantuan')
+CREATURE_TYPES = ('aberration', 'beast', 'celestial', 'construct', 'dragon', 'elemental', 'fey',
+                  'fiend', 'giant', 'humanoid', 'monstrosity', 'ooze', 'plant', 'undead')
+DAMAGE_TYPES = ('acid', 'bludgeoning', 'cold', 'fire', 'force', 'lightning', 'necrotic',
+                'piercing', 'poison', 'psychic', 'radiant', 'slashing', 'thunder')
+UNKNOWN = 255
+
+SOURCE_LOCAL = 0
+SOURCE_LIBRARY = 1
+
+DEFAULT_CATALOG_PATH = Path(__file__).parent.parent.parent / "data" / "monsters" / "monsters.catalog"
+LOCAL_MONSTERS_PATH = Path(__file__).parent.parent.parent / "data" / "monsters" / "all_monsters.json"
+
+
+def catalog_signature(local_path: Path = LOCAL_MONSTERS_PATH) -> bytes:
+    """Empreinte des sources (JSON local + version de dnd_5e_core): catalogue périmé si elle change"""
+    import dnd_5e_core
+
+    try:
+        stat = os.stat(local_path)
+        local = f"{stat.st_mtime_ns}:{stat.st_size}"
+    except OSError:
+        local = "-"
+    key = f"{MAGIC!r}:{COMPILER_VERSION}:{local}:{getattr(dnd_5e_core, '__version__', '?')}"
+    return hashlib.sha256(key.encode('utf-8')).digest()[:16]
+
+
+class MonsterColumns(NamedTuple):
+    """Colonnes d'un monstre catalogué (lues dans l'index, sans désérialiser le monstre)"""
+    monster_id: str
+    challenge_rating: float
+    xp: int
+    armor_class: int
+    hit_points: int
+    size: int           # index dans SIZES (UNKNOWN si absent)
+    creature_type: int  # index dans CREATURE_TYPES (UNKNOWN si absent)
+    damage_mask: int    # bit i = DAMAGE_TYPES[i]
+
+
+def encode_size(size) -> int:
+    """'M', 'Medium' ou ['M'] -> index dans SIZES"""
+    if isinstance(size, (list, tuple)):
+        size = size[0] if size else None
+    if not size:
+        return UNKNOWN
+    size = str(size).strip().capitalize()
+    for code, name in enumerate(SIZES):
+        if name == size or name[0] == size:
+            return code
+    return UNKNOWN
+
+
+def encode_creature_type(creature_type) -> int:
+    """'undead', {'type': 'fiend', 'tags': [...]} ou 'swarm of Tiny beasts' -> index dans CREATURE_TYPES"""
+    if isinstance(creature_type, dict):
+        creature_type = creature_type.get('type')
+    if not isinstance(creature_type, str):
+        return UNKNOWN
+    creature_type = creature_type.lower()
+    for code, name in enumerate(CREATURE_TYPES):
+        if creature_type.startswith(name) or creature_type.rstrip('s').endswith(name):
+            return code
+    return UNKNOWN
+
+
+def damage_mask(monster) -> int:
+    """Masque des types de dommages infligés par les actions du monstre"""
+    mask = 0
+    for action in getattr(monster, 'actions', None) or []:
+        for attack in [action] + list(getattr(action, 'multi_attack', None) or []):
+            for damage in getattr(attack, 'damages', None) or []:
+                index = getattr(getattr(damage, 'type', None), 'index', None)
+                if index in DAMAGE_TYPES:
+                    mask |= 1 << DAMAGE_TYPES.index(index)
+    return mask
+
+
+def _library_profile(monster_id: str) -> Dict:
+    """Données brutes de dnd_5e_core (gabarit et type, absents des objets Monster)"""
+    from dnd_5e_core.data.loader import load_json_file
+
+    for folder in ("monsters/official", "monsters/extended"):
+        data = load_json_file(folder, monster_id)
+        if isinstance(data, dict):
+            return data
+    return {}
+
+
+def library_monster_ids() -> List[str]:
+    """Identifiants des monstres accessibles via dnd_5e_core.data.load_monster"""
+    from dnd_5e_core.data.loader import list_json_files
+
+    ids = []
+    for folder in ("monsters/official", "monsters/extended"):
+        ids.extend(list_json_files(folder))
+    return sorted(set(ids))
+
+
+def build_monster_catalog(path, local_prototypes: Dict[str, object], include_library: bool = True,
+                          signature: bytes = b'', local_data: Optional[Dict] = None) -> int:
+    """
+    Compiler le catalogue (écriture atomique)
+
+    Args:
+        path: Fichier de sortie
+        local_prototypes: Monstres locaux compilés (prioritaires sur dnd_5e_core)
+        include_library: Ajouter les monstres de dnd_5e_core.data
+        signature: Empreinte des sources (voir catalog_signature)
+        local_data: Données JSON locales (gabarit et type des monstres locaux)
+
+    Returns:
+        Nombre de monstres catalogués
+    """
+    records = {monster_id: (monster, SOURCE_LOCAL)
+               for monster_id, monster in local_prototypes.items() if monster is not None}
+    if include_library:
+        from dnd_5e_core.data import load_monster
+
+        for monster_id in library_monster_ids():
+            if monster_id in records:
+                continue
+            try:
+                monster = load_monster(monster_id)
+            except Exception:
+                # Fichiers de dnd_5e_core qui ne décrivent pas un monstre
+                continue
+            if monster is not None:
+                records[monster_id] = (monster, SOURCE_LIBRARY)
+
+    path = Path(path)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    index = []
+    with open(temporary, 'wb') as f:
+        f.write(b'\0' * HEADER.size)
+        for monster_id in sorted(records):
+            key = monster_id.encode('utf-8')
+            if len(key) > KEY_SIZE:
+                continue
+            monster, source = records[monster_id]
+            if source == SOURCE_LOCAL:
+                profile = (local_data or {}).get(monster_id, {})
+            else:
+                profile = _library_profile(monster_id)
+            data = pickle.dumps(monster, protocol=pickle.HIGHEST_PROTOCOL)
+            index.append(ENTRY.pack(
+                key, f.tell(), len(data), source,
+                float(monster.challenge_rating or 0), int(monster.xp or 0),
+                min(int(monster.armor_class or 0), 0xFFFF), int(monster.hit_points or 0),
+                encode_size(profile.get('size')),
+                encode_creature_type(profile.get('type') or getattr(monster, 'creature_type', None)),
+                damage_mask(monster)
+            ))
+            f.write(data)
+        index_offset = f.tell()
+        f.write(b''.join(index))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, signature.ljust(16, b'\0'), len(index), index_offset))
+    os.replace(temporary, path)
+    return len(index)
+
+
+class MonsterCatalog:
+    """Lecture du catalogue en mmap: recherche dichotomique dans l'index, un seul monstre désérialisé"""
+
+    def __init__(self, path):
+        """
+        Raises:
+            ValueError: Fichier qui n'est pas un catalogue
+        """
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.signature, self.count, self._index = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"Catalogue de monstres invalide: {path}")
+
+    @classmethod
+    def open(cls, path, signature: Optional[bytes] = None) -> Optional['MonsterCatalog']:
+        """Ouvrir un catalogue; None s'il est absent, illisible ou périmé"""
+        try:
+            catalog = cls(path)
+        except (OSError, ValueError, struct.error):
+            return None
+        if signature is not None and catalog.signature != signature.ljust(16, b'\0'):
+            catalog.close()
+            return None
+        return catalog
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _key(self, position: int) -> bytes:
+        start = self._index + position * ENTRY.size
+        return self._map[start:start + KEY_SIZE].rstrip(b'\0')
+
+    def _find(self, monster_id: str) -> Optional[int]:
+        key = monster_id.encode('utf-8')
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and self._key(low) == key:
+            return low
+        return None
+
+    def __contains__(self, monster_id: str) -> bool:
+        return self._find(monster_id) is not None
+
+    def _entry(self, position: int) -> Tuple:
+        return ENTRY.unpack_from(self._map, self._index + position * ENTRY.size)
+
+    def source(self, monster_id: str) -> Optional[int]:
+        """SOURCE_LOCAL ou SOURCE_LIBRARY (None si absent)"""
+        position = self._find(monster_id)
+        if position is None:
+            return None
+        return self._entry(position)[3]
+
+    def get(self, monster_id: str):
+        """Prototype Monster désérialisé (None si absent)"""
+        position = self._find(monster_id)
+        if position is None:
+            return None
+        offset, size = self._entry(position)[1:3]
+        return pickle.loads(self._map[offset:offset + size])
+
+    def columns(self) -> Iterator[MonsterColumns]:
+        """Colonnes de tous les monstres (ordre alphabétique), lues dans l'index seulement"""
+        for key, _, _, _, *values in ENTRY.iter_unpack(
+                self._map[self._index:self._index + self.count * ENTRY.size]):
+            yield MonsterColumns(key.rstrip(b'\0').decode('utf-8'), *values)
+
+    # Interface de source de MonsterEngine
+
+    @property
+    def namespace(self) -> str:
+        return f"catalog:{self.signature.hex()}"
+
+    def load(self, monster_id: str):
+        """Prototype de monster_id (ou de sa forme normalisée "goblin_boss" -> "goblin-boss")"""
+        return self.get(monster_id) or self.get(monster_id.replace('_', '-'))
+
+    def ids(self) -> Iterator[str]:
+        """Identifiants catalogués (ordre alphabétique)"""
+        for position in range(self.count):
+            yield self._key(position).decode('utf-8')
+
+
+# Catalogue par défaut, partagé par le processus
+_default_catalog: Optional[MonsterCatalog] = None
+
+
+def open_default_catalog(local_source=None, path=DEFAULT_CATALOG_PATH, build: bool = True) -> Optional[MonsterCatalog]:
+    """
+    Ouvrir le catalogue par défaut, le (re)compiler s'il est absent ou périmé
+
+    Args:
+        local_source: LocalMonsterSource des monstres locaux (all_monsters.json par défaut)
+        path: Fichier du catalogue
+        build: Compiler le catalogue s'il manque (False dans les workers: le parent l'a préparé)
+
+    Returns:
+        Catalogue partagé, ou None s'il est indisponible
+    """
+    global _default_catalog
+    from .monster_factory import LocalMonsterSource
+
+    signature = catalog_signature()
+    path = Path(path)
+    if _default_catalog is not None and _default_catalog.path == path and _default_catalog.signature == signature:
+        return _default_catalog
+
+    catalog = MonsterCatalog.open(path, signature)
+    if catalog is None and build:
+        local_source = local_source or LocalMonsterSource(path=LOCAL_MONSTERS_PATH)
+        try:
+            local = {monster_id: local_source.load(monster_id) for monster_id in local_source.data}
+            build_monster_catalog(path, local, signature=signature, local_data=local_source.data)
+        except OSError as e:
+            print(f"⚠️ Catalogue de monstres indisponible: {e}")
+            return None
+        catalog = MonsterCatalog.open(path, signature)
+    if catalog is not None:
+        _default_catalog = catalog
+    return catalog
@@ -1,44 +1,169 @@
 """
-Factory pour créer des monstres depuis JSON
+Moteur de création de monstres
+Sources interchangeables (JSON local, dnd_5e_core, catalogue précompilé),
+résolution mise en cache (prototypes) et création en masse par copies légères
 """
-from typing import Dict, Optional
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from copy import copy
+from itertools import groupby
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
 from dnd_5e_core import Monster, Abilities
 from dnd_5e_core.combat import Action, ActionType, Damage
 from dnd_5e_core.mechanics import DamageDice
 from dnd_5e_core.equipment import DamageType
 
 
-class MonsterFactory:
-    """Factory pour créer monstres depuis données JSON"""
+def clone_monster(prototype: Monster, name: Optional[str] = None) -> Monster:
+    """
+    Copie légère d'un monstre prototype
+    Les données immuables (caractéristiques, actions, dés) sont partagées;
+    seul l'état modifié en combat est copié (HP, conditions, recharges, sorts)
 
-    def __init__(self, monsters_data: Dict):
-        """
-        Args:
-            monsters_data: Dict chargé depuis all_monsters.json
+    Args:
+        prototype: Monstre compilé (jamais modifié)
+        name: Nom personnalisé (optionnel)
+    """
+    monster = object.__new__(type(prototype))
+    state = monster.__dict__
+    state.update(prototype.__dict__)
+    if name:
+        state['name'] = name
+    state['hit_points'] = prototype.max_hit_points
+    state['attack_round'] = 0
+    if prototype.sc is not None:
+        state['sc'] = copy(prototype.sc)
+    if prototype.sa:
+        state['sa'] = [copy(ability) for ability in prototype.sa]
+    if state.get('conditions'):
+        state['conditions'] = list(state['conditions'])
+    return monster
+
+
+class MonsterResolutionCache:
+    """
+    Cache LRU borné des résolutions monster_id -> prototype, partagé par le processus
+    Les échecs (monstre introuvable) sont aussi mémorisés
+    """
+
+    _ABSENT = object()
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, key: Hashable, loader: Callable[[], Optional[Monster]]) -> Optional[Monster]:
         """
-        self.monsters_data = monsters_data
+        Prototype associé à `key`, chargé par `loader` au premier accès
 
-    def create_monster(self, monster_id: str, name: Optional[str] = None) -> Optional[Monster]:
+        Returns:
+            Prototype (jamais modifié par l'appelant) ou None si introuvable
         """
-        Créer un monstre depuis son ID
+        with self._lock:
+            prototype = self._entries.get(key, self._ABSENT)
+            if prototype is not self._ABSENT:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return prototype
+            self.misses += 1
 
-        Args:
-            monster_id: ID du monstre (ex: "goblin", "snake_king")
-            name: Nom personnalisé (optionnel)
+        prototype = loader()
+        with self._lock:
+            self._entries[key] = prototype
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return prototype
 
-        Returns:
-            Monster ou None si non trouvé
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+# Cache de résolution partagé (MonsterFactory, MonsterFactoryWrapper)
+monster_cache = MonsterResolutionCache()
+
+
+class LocalMonsterSource:
+    """
+    Source JSON locale (all_monsters.json ou dict équivalent)
+    Accepte les deux schémas d'actions: damage_dice + damage_bonus + range "30/120 ft",
+    ou damage "1d4+2" + type + range entier (+ additional_damage)
+    """
+
+    def __init__(self, monsters_data: Optional[Dict] = None, path: Optional[Path] = None):
+        """
+        Args:
+            monsters_data: Monstres déjà chargés (monster_id -> données)
+            path: Fichier JSON chargé au premier accès (si monsters_data est None)
         """
-        if monster_id not in self.monsters_data:
-            print(f"⚠️ Monstre non trouvé: {monster_id}")
+        self._data = monsters_data
+        self.path = Path(path) if path else None
+        if monsters_data is not None:
+            # Les sources construites sur les mêmes données partagent leurs entrées de cache
+            digest = hashlib.sha1(json.dumps(monsters_data, sort_keys=True, default=str).encode('utf-8'))
+            self.namespace = f"local:{digest.hexdigest()[:16]}"
+        else:
+            self.namespace = f"local:{self.path}"
+
+    @property
+    def data(self) -> Dict:
+        """Données JSON (chargées seulement si nécessaire)"""
+        if self._data is None:
+            self._data = {}
+            if self.path and self.path.exists():
+                try:
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        self._data = json.load(f)
+                except Exception as e:
+                    print(f"⚠️ Erreur chargement monstres locaux: {e}")
+        return self._data
+
+    def load(self, monster_id: str) -> Optional[Monster]:
+        if monster_id not in self.data:
+            return None
+        try:
+            return self.compile(monster_id, self.data[monster_id])
+        except Exception as e:
+            print(f"⚠️ Erreur lors de la création du monstre local {monster_id}: {e}")
             return None
 
-        data = self.monsters_data[monster_id]
+    @staticmethod
+    def _damage(dice: str, bonus: int, damage_type_name: str) -> Damage:
+        damage_type = DamageType(
+            index=damage_type_name.lower(),
+            name=damage_type_name.capitalize(),
+            desc=f"{damage_type_name} damage"
+        )
+        return Damage(type=damage_type, dd=DamageDice(dice, bonus))
 
-        # Nom
-        monster_name = name if name else data['name']
+    @staticmethod
+    def _speed(speed_data) -> int:
+        if isinstance(speed_data, dict):
+            speed_data = speed_data.get('walk', '30 ft')
+        if isinstance(speed_data, int):
+            return speed_data
+        try:
+            return int(str(speed_data).replace('ft', '').strip())
+        except ValueError:
+            return 30
 
-        # Abilities
+    @classmethod
+    def compile(cls, monster_id: str, data: Dict) -> Monster:
+        """Construire le prototype d'un monstre depuis ses données JSON"""
         abilities = Abilities(
             str=data['abilities']['str'],
             dex=data['abilities']['dex'],
@@ -48,63 +173,132 @@ class MonsterFactory:
             cha=data['abilities']['cha']
         )
 
-        # Actions
+        # Actions (les actions sans attaque, comme Multiattack, sont ignorées)
         actions = []
         for action_data in data.get('actions', []):
-            # Type de dégâts
-            damage_type = DamageType(
-                index=action_data['damage_type'],
-                name=action_data['damage_type'].capitalize(),
-                desc=f"{action_data['damage_type']} damage"
-            )
-
-            # Dégâts principaux
-            damages = [Damage(
-                type=damage_type,
-                dd=DamageDice(action_data['damage'])
-            )]
+            if 'attack_bonus' not in action_data:
+                continue
 
+            damages = [cls._damage(action_data.get('damage_dice') or action_data.get('damage', '1d6'),
+                                   action_data.get('damage_bonus', 0),
+                                   action_data.get('damage_type', 'slashing'))]
             # Dégâts additionnels (ex: nécrotique)
             if 'additional_damage' in action_data:
-                add_type = DamageType(
-                    index=action_data['additional_damage_type'],
-                    name=action_data['additional_damage_type'].capitalize(),
-                    desc=f"{action_data['additional_damage_type']} damage"
-                )
-                damages.append(Damage(
-                    type=add_type,
-                    dd=DamageDice(action_data['additional_damage'])
-                ))
-
-            # Type d'action
-            action_type = ActionType.MELEE if action_data['type'] == 'melee' else ActionType.RANGED
-
-            action = Action(
+                damages.append(cls._damage(action_data['additional_damage'], 0,
+                                           action_data.get('additional_damage_type', 'slashing')))
+
+            attack_range = action_data.get('range')
+            kind = action_data.get('type') or ('ranged' if attack_range else 'melee')
+            actions.append(Action(
                 name=action_data['name'],
                 desc=action_data.get('desc', action_data['name']),
-                type=action_type,
+                type=ActionType.MELEE if kind == 'melee' else ActionType.RANGED,
                 attack_bonus=action_data['attack_bonus'],
                 damages=damages,
-                normal_range=action_data['range']
-            )
-            actions.append(action)
-
-        # Créer le monstre
-        monster = Monster(
-            index=data['index'],
-            name=monster_name,
+                normal_range=int(str(attack_range).split('/')[0].replace('ft', '').strip()) if attack_range else 5
+            ))
+
+        return Monster(
+            index=data.get('index', monster_id),
+            name=data['name'],
             abilities=abilities,
             proficiencies=[],
             armor_class=data['armor_class'],
             hit_points=data['hit_points'],
             hit_dice=data['hit_dice'],
             xp=data['xp'],
-            speed=data['speed'],
+            speed=cls._speed(data.get('speed')),
             challenge_rating=data['challenge_rating'],
             actions=actions
         )
 
-        return monster
+
+class LibraryMonsterSource:
+    """Source dnd_5e_core.data.load_monster (identifiant normalisé "goblin_boss" -> "goblin-boss")"""
+
+    namespace = "dnd_5e_core"
+
+    def load(self, monster_id: str) -> Optional[Monster]:
+        from dnd_5e_core.data import load_monster
+
+        normalized_id = monster_id.replace('_', '-')
+        monster = load_monster(normalized_id)
+        if not monster and normalized_id != monster_id:
+            monster = load_monster(monster_id)
+        return monster or None
+
+
+# Spécification de création en masse: id, (id, nom) ou (id, nom, nombre)
+MonsterSpec = Union[str, Tuple[str, Optional[str]], Tuple[str, Optional[str], int]]
+
+
+class MonsterEngine:
+    """
+    Création de monstres depuis une liste ordonnée de sources
+    Chaque monster_id est résolu une seule fois en prototype (cache LRU du
+    processus, échecs compris); les monstres créés en sont des copies légères
+    """
+
+    def __init__(self, sources: Sequence, cache: Optional[MonsterResolutionCache] = None):
+        """
+        Args:
+            sources: Objets avec `namespace` et `load(monster_id)`, par ordre de priorité
+            cache: Cache de résolution (cache partagé du processus par défaut)
+        """
+        self.sources = list(sources)
+        self.cache = monster_cache if cache is None else cache
+        self._namespace = tuple(source.namespace for source in self.sources)
+
+    def prototype(self, monster_id: str) -> Optional[Monster]:
+        """Prototype partagé de monster_id (ne pas modifier)"""
+        return self.cache.resolve((self._namespace, monster_id), lambda: self._resolve(monster_id))
+
+    def _resolve(self, monster_id: str) -> Optional[Monster]:
+        for source in self.sources:
+            monster = source.load(monster_id)
+            if monster is not None:
+                return monster
+        print(f"⚠️ Monstre non trouvé: {monster_id}")
+        return None
+
+    def create_monster(self, monster_id: str, name: Optional[str] = None) -> Optional[Monster]:
+        """
+        Créer un monstre depuis son ID
+
+        Args:
+            monster_id: ID du monstre (ex: "goblin", "snake_king")
+            name: Nom personnalisé (optionnel)
+
+        Returns:
+            Monster ou None si non trouvé
+        """
+        prototype = self.prototype(monster_id)
+        if prototype is None:
+            return None
+        return clone_monster(prototype, name)
+
+    def create_many(self, specs: Iterable[MonsterSpec]) -> List[Monster]:
+        """
+        Créer plusieurs monstres en une fois (chaque modèle distinct n'est résolu qu'une fois)
+
+        Args:
+            specs: [(monster_id, nom, nombre), ...]; nom et nombre optionnels
+
+        Returns:
+            Liste de Monster dans l'ordre des specs (monstres introuvables omis)
+        """
+        prototypes: Dict[str, Optional[Monster]] = {}
+        monsters = []
+        for spec in specs:
+            if isinstance(spec, str):
+                spec = (spec,)
+            monster_id, name, count = (tuple(spec) + (None, 1))[:3]
+            if monster_id not in prototypes:
+                prototypes[monster_id] = self.prototype(monster_id)
+            prototype = prototypes[monster_id]
+            if prototype is not None:
+                monsters.extend(clone_monster(prototype, name) for _ in range(count))
+        return monsters
 
     def create_monsters(self, monster_ids: list) -> list:
         """
@@ -116,17 +310,31 @@ class MonsterFactory:
         Returns:
             Liste de Monster
         """
-        monsters = []
+        return self.create_many(monster_ids)
+
+    def create_horde(self, monster_id: str, count: int):
+        """Créer une horde de `count` monstres identiques (un seul objet Monster modèle)"""
+        from ..systems.horde_combat import MonsterHorde
 
-        for item in monster_ids:
-            if isinstance(item, tuple):
-                monster_id, name = item
-                monster = self.create_monster(monster_id, name)
-            else:
-                monster = self.create_monster(item)
+        template = self.create_monster(monster_id)
+        if not template:
+            return None
+        return MonsterHorde(template, count)
 
-            if monster:
-                monsters.append(monster)
 
-        return monsters
+def group_monster_ids(monster_ids: Iterable[str]) -> List[Tuple[str, None, int]]:
+    """Regrouper les identifiants consécutifs identiques en specs (id, None, nombre) pour create_many"""
+    return [(monster_id, None, len(list(run))) for monster_id, run in groupby(monster_ids)]
+
+
+class MonsterFactory(MonsterEngine):
+    """Factory pour créer monstres depuis données JSON"""
 
+    def __init__(self, monsters_data: Dict, cache: Optional[MonsterResolutionCache] = None):
+        """
+        Args:
+            monsters_data: Dict chargé depuis all_monsters.json
+            cache: Cache de résolution (cache partagé du processus par défaut)
+        """
+        self.monsters_data = monsters_data
+        super().__init__([LocalMonsterSource(monsters_data)], cache)
@@ -0,0 +1,171 @@
+"""
+Index de requêtes sur le catalogue de monstres
+Colonnes en mémoire (FP, XP, type, gabarit, CA, HP, types de dommages) lues
+dans l'index du catalogue; les intervalles de FP/XP sont résolus par
+dichotomie sur des tableaux triés, les autres critères filtrent ce sous-ensemble
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .monster_catalog import (
+    CREATURE_TYPES, DAMAGE_TYPES, SIZES, UNKNOWN, MonsterCatalog, MonsterColumns, encode_creature_type,
+    encode_size, open_default_catalog
+)
+
+# Les FP sont stockés en float32 (1/3, 2/3 arrondis)
+CR_TOLERANCE = 1e-4
+
+
+class MonsterIndex:
+    """Index colonnes + tableaux triés par FP et par XP"""
+
+    def __init__(self, columns: Iterable[MonsterColumns], signature: Optional[bytes] = None):
+        """
+        Args:
+            columns: Colonnes des monstres (MonsterCatalog.columns())
+            signature: Signature du catalogue indexé
+        """
+        self.signature = signature
+        self.rows: List[MonsterColumns] = list(columns)
+        self._positions: Dict[str, int] = {row.monster_id: i for i, row in enumerate(self.rows)}
+
+        # Vues triées: valeurs (array) + positions correspondantes dans rows
+        self._cr_order = sorted(range(len(self.rows)), key=lambda i: self.rows[i].challenge_rating)
+        self._cr_values = array('d', (self.rows[i].challenge_rating for i in self._cr_order))
+        self._xp_order = sorted(range(len(self.rows)), key=lambda i: self.rows[i].xp)
+        self._xp_values = array('q', (self.rows[i].xp for i in self._xp_order))
+
+    @classmethod
+    def from_catalog(cls, catalog: MonsterCatalog) -> 'MonsterIndex':
+        return cls(catalog.columns(), catalog.signature)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, monster_id: str) -> bool:
+        return monster_id in self._positions
+
+    def row(self, monster_id: str) -> Optional[MonsterColumns]:
+        position = self._positions.get(monster_id)
+        return None if position is None else self.rows[position]
+
+    # Requêtes
+
+    @staticmethod
+    def _range(values: array, order: List[int], low, high) -> List[int]:
+        start = 0 if low is None else bisect_left(values, low)
+        end = len(values) if high is None else bisect_right(values, high)
+        return order[start:end]
+
+    def query(self, cr_min: Optional[float] = None, cr_max: Optional[float] = None,
+              xp_min: Optional[int] = None, xp_max: Optional[int] = None,
+              creature_type: Optional[str] = None, size: Optional[str] = None,
+              ac_min: Optional[int] = None, ac_max: Optional[int] = None,
+              hp_min: Optional[int] = None, hp_max: Optional[int] = None,
+              damage_types: Optional[Sequence[str]] = None,
+              limit: Optional[int] = None) -> List[str]:
+        """
+        Identifiants des monstres satisfaisant tous les critères (triés par FP, ou par XP)
+
+        Args:
+            cr_min, cr_max: Intervalle de facteur de puissance (bornes incluses)
+            xp_min, xp_max: Intervalle d'XP
+            creature_type: 'undead', 'humanoid', ...
+            size: 'Medium', 'M', ...
+            ac_min, ac_max, hp_min, hp_max: Intervalles de CA et de HP
+            damage_types: Au moins un de ces types de dommages ('fire', 'necrotic', ...)
+            limit: Nombre maximal de résultats
+        """
+        if cr_min is not None or cr_max is not None or (xp_min is None and xp_max is None):
+            positions = self._range(self._cr_values, self._cr_order,
+                                    None if cr_min is None else cr_min - CR_TOLERANCE,
+                                    None if cr_max is None else cr_max + CR_TOLERANCE)
+        else:
+            positions = self._range(self._xp_values, self._xp_order, xp_min, xp_max)
+
+        type_code = None if creature_type is None else encode_creature_type(creature_type)
+        size_code = None if size is None else encode_size(size)
+        mask = 0
+        for damage_type in damage_types or ():
+            if damage_type in DAMAGE_TYPES:
+                mask |= 1 << DAMAGE_TYPES.index(damage_type)
+
+        rows = self.rows
+        result = []
+        for position in positions:
+            row = rows[position]
+            if xp_min is not None and row.xp < xp_min or xp_max is not None and row.xp > xp_max:
+                continue
+            if type_code is not None and row.creature_type != type_code:
+                continue
+            if size_code is not None and row.size != size_code:
+                continue
+            if ac_min is not None and row.armor_class < ac_min or ac_max is not None and row.armor_class > ac_max:
+                continue
+            if hp_min is not None and row.hit_points < hp_min or hp_max is not None and row.hit_points > hp_max:
+                continue
+            if damage_types is not None and not row.damage_mask & mask:
+                continue
+            result.append(row.monster_id)
+            if limit is not None and len(result) >= limit:
+                break
+        return result
+
+    def with_cr(self, *challenge_ratings: float, **filters) -> List[str]:
+        """Monstres d'un des FP exacts donnés (autres critères de query() acceptés)"""
+        result = []
+        for cr in sorted(set(float(cr) for cr in challenge_ratings)):
+            result.extend(self.query(cr_min=cr, cr_max=cr, **filters))
+        return result
+
+    def closest_cr(self, challenge_rating: float) -> Optional[float]:
+        """FP catalogué le plus proche"""
+        values = self._cr_values
+        if not values:
+            return None
+        position = bisect_left(values, challenge_rating)
+        neighbours = values[max(0, position - 1):position + 1]
+        return min(neighbours, key=lambda cr: abs(cr - challenge_rating))
+
+    def encounter_candidates(self, encounter_level: int, **filters) -> List[str]:
+        """
+        Monstres utilisables par la table de rencontres de dnd_5e_core pour ce niveau
+        (FP des paires et des groupes, ou FP catalogués les plus proches)
+        """
+        from dnd_5e_core.mechanics.encounter_builder import get_encounter_info
+
+        info = get_encounter_info(encounter_level)
+        crs = set(info['pair_crs'])
+        for options in info['group_options'].values():
+            crs.update(options)
+        return self.with_cr(*(self.closest_cr(float(cr)) for cr in crs), **filters)
+
+    # Décodage
+
+    @staticmethod
+    def size_name(code: int) -> Optional[str]:
+        return None if code == UNKNOWN else SIZES[code]
+
+    @staticmethod
+    def creature_type_name(code: int) -> Optional[str]:
+        return None if code == UNKNOWN else CREATURE_TYPES[code]
+
+    @staticmethod
+    def damage_type_names(mask: int) -> List[str]:
+        return [name for i, name in enumerate(DAMAGE_TYPES) if mask & (1 << i)]
+
+
+_default_index: Optional[MonsterIndex] = None
+
+
+def default_monster_index() -> Optional[MonsterIndex]:
+    """Index du catalogue par défaut (construit une fois par processus)"""
+    global _default_index
+    catalog = open_default_catalog()
+    if catalog is None:
+        return None
+    if _default_index is None or _default_index.signature != catalog.signature:
+        _default_index = MonsterIndex.from_catalog(catalog)
+    return _default_index
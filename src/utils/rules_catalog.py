@@ -0,0 +1,221 @@
+"""
+Catalogue binaire précompilé des règles (sorts, armes, armures, équipements)
+Même principe que le catalogue de monstres: objets dnd_5e_core picklés dans un
+fichier unique ouvert en mmap. Ouvert avant la création d'un pool de processus,
+il est partagé sans copie par les workers (pages du fichier communes)
+
+Format:
+    en-tête  MAGIC | signature (16 o) | nombre (u32) | position de l'index (u64)
+    données  objets picklés, bout à bout
+    index    clé "type/id" (64 o, utf-8 complétée par des zéros) | position (u64) | taille (u32)
+"""
+
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b'DRC1'
+COMPILER_VERSION = 1
+HEADER = struct.Struct('<4s16sIQ')
+ENTRY = struct.Struct('<64sQI')
+KEY_SIZE = 64
+
+DEFAULT_RULES_CATALOG_PATH = Path(__file__).parent.parent.parent / "data" / "rules.catalog"
+
+SPELL = 'spell'
+WEAPON = 'weapon'
+ARMOR = 'armor'
+EQUIPMENT = 'equipment'
+
+
+def _loaders() -> Dict[str, Tuple[Callable[[], List[str]], Callable[[str], object]]]:
+    """Type d'objet -> (liste des identifiants, chargeur) de dnd_5e_core.data"""
+    from dnd_5e_core.data import (
+        list_armors, list_equipment, list_spells, list_weapons,
+        load_armor, load_equipment, load_spell, load_weapon
+    )
+
+    return {
+        SPELL: (list_spells, load_spell),
+        WEAPON: (list_weapons, load_weapon),
+        ARMOR: (list_armors, load_armor),
+        EQUIPMENT: (list_equipment, load_equipment),
+    }
+
+
+def rules_signature() -> bytes:
+    """Empreinte des sources (version de dnd_5e_core): catalogue périmé si elle change"""
+    import dnd_5e_core
+
+    key = f"{MAGIC!r}:{COMPILER_VERSION}:{getattr(dnd_5e_core, '__version__', '?')}"
+    return hashlib.sha256(key.encode('utf-8')).digest()[:16]
+
+
+def build_rules_catalog(path, signature: bytes = b'') -> int:
+    """
+    Compiler le catalogue des règles de dnd_5e_core (écriture atomique)
+
+    Returns:
+        Nombre d'objets catalogués
+    """
+    records = {}
+    for kind, (list_ids, load) in _loaders().items():
+        for item_id in list_ids():
+            try:
+                item = load(item_id)
+            except Exception:
+                continue
+            if item is not None:
+                records[f"{kind}/{item_id}"] = item
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    index = []
+    with open(temporary, 'wb') as f:
+        f.write(b'\0' * HEADER.size)
+        for key in sorted(records):
+            encoded = key.encode('utf-8')
+            if len(encoded) > KEY_SIZE:
+                continue
+            data = pickle.dumps(records[key], protocol=pickle.HIGHEST_PROTOCOL)
+            index.append(ENTRY.pack(encoded, f.tell(), len(data)))
+            f.write(data)
+        index_offset = f.tell()
+        f.write(b''.join(index))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, signature.ljust(16, b'\0'), len(index), index_offset))
+    os.replace(temporary, path)
+    return len(index)
+
+
+class RulesCatalog:
+    """Lecture du catalogue en mmap: recherche dichotomique, un seul objet désérialisé (puis mémorisé)"""
+
+    def __init__(self, path):
+        """
+        Raises:
+            ValueError: Fichier qui n'est pas un catalogue de règles
+        """
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.signature, self.count, self._index = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"Catalogue de règles invalide: {path}")
+        self._objects: Dict[str, object] = {}
+
+    @classmethod
+    def open(cls, path, signature: Optional[bytes] = None) -> Optional['RulesCatalog']:
+        """Ouvrir un catalogue; None s'il est absent, illisible ou périmé"""
+        try:
+            catalog = cls(path)
+        except (OSError, ValueError, struct.error):
+            return None
+        if signature is not None and catalog.signature != signature.ljust(16, b'\0'):
+            catalog.close()
+            return None
+        return catalog
+
+    def close(self):
+        self._map.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _key(self, position: int) -> bytes:
+        start = self._index + position * ENTRY.size
+        return self._map[start:start + KEY_SIZE].rstrip(b'\0')
+
+    def _find(self, key: str) -> Optional[int]:
+        encoded = key.encode('utf-8')
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count and self._key(low) == encoded:
+            return low
+        return None
+
+    def get(self, kind: str, item_id: str):
+        """Objet dnd_5e_core (None si absent); ne pas modifier, il est partagé"""
+        key = f"{kind}/{item_id}"
+        if key in self._objects:
+            return self._objects[key]
+        position = self._find(key)
+        item = None
+        if position is not None:
+            offset, size = ENTRY.unpack_from(self._map, self._index + position * ENTRY.size)[1:]
+            item = pickle.loads(self._map[offset:offset + size])
+        self._objects[key] = item
+        return item
+
+    def ids(self, kind: str) -> Iterator[str]:
+        """Identifiants d'un type d'objet (ordre alphabétique)"""
+        prefix = f"{kind}/".encode('utf-8')
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < prefix:
+                low = middle + 1
+            else:
+                high = middle
+        for position in range(low, self.count):
+            key = self._key(position)
+            if not key.startswith(prefix):
+                break
+            yield key[len(prefix):].decode('utf-8')
+
+    def spell(self, spell_id: str):
+        return self.get(SPELL, spell_id)
+
+    def weapon(self, weapon_id: str):
+        return self.get(WEAPON, weapon_id)
+
+    def armor(self, armor_id: str):
+        return self.get(ARMOR, armor_id)
+
+    def equipment(self, equipment_id: str):
+        return self.get(EQUIPMENT, equipment_id)
+
+
+# Catalogue par défaut, partagé par le processus (et hérité par les workers)
+_default_rules: Optional[RulesCatalog] = None
+
+
+def open_rules_catalog(path=DEFAULT_RULES_CATALOG_PATH, build: bool = True) -> Optional[RulesCatalog]:
+    """
+    Ouvrir le catalogue des règles, le (re)compiler s'il est absent ou périmé
+
+    Args:
+        path: Fichier du catalogue
+        build: Compiler le catalogue s'il manque (False dans les workers: le parent l'a préparé)
+
+    Returns:
+        Catalogue partagé, ou None s'il est indisponible
+    """
+    global _default_rules
+    signature = rules_signature()
+    path = Path(path)
+    if _default_rules is not None and _default_rules.path == path and _default_rules.signature == signature:
+        return _default_rules
+
+    catalog = RulesCatalog.open(path, signature)
+    if catalog is None and build:
+        try:
+            build_rules_catalog(path, signature)
+        except OSError as e:
+            print(f"⚠️ Catalogue de règles indisponible: {e}")
+            return None
+        catalog = RulesCatalog.open(path, signature)
+    if catalog is not None:
+        _default_rules = catalog
+    return catalog
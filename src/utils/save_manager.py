@@ -8,6 +8,8 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from pathlib import Path
 
+from ..core.derived_stats import invalidate_derived_stats
+
 
 class SaveGameManager:
     """Gestionnaire de sauvegardes de parties"""
@@ -84,6 +86,9 @@ class SaveGameManager:
             # Charger party
             with open(party_file, 'rb') as f:
                 party = pickle.load(f)
+            # Statistiques dérivées recalculées avec les règles courantes
+            for character in party:
+                invalidate_derived_stats(character)
 
             save_data['party'] = party
 
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test de l'analyse exacte des combats (convolution des dés)
+Compare les valeurs analytiques aux jets d'EnhancedCombatSystem
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.core.dice_distribution import Distribution, dice_distribution
+from src.core.rng import GameRNG
+from src.systems.combat_analysis import (
+    hit_chances, hit_probability, character_attack_distribution,
+    monster_round_distribution, expected_rounds_to_kill, analyze_encounter
+)
+from src.systems.enhanced_combat import EnhancedCombatSystem
+
+
+
+def close(a, b):
+    return abs(a - b) < 1e-9
+
+
+print("=" * 70)
+print("🧪 TEST - Analyse exacte des combats")
+print("=" * 70)
+
+# 1. Distributions exactes
+two_d6 = dice_distribution("2d6")
+assert close(two_d6.probability(7), 6 / 36) and close(two_d6.probability(2), 1 / 36)
+assert (two_d6.minimum, two_d6.maximum) == (2, 12) and close(two_d6.mean, 7.0)
+assert close(sum(two_d6.probabilities), 1)
+assert dice_distribution("1d8", 3, critical=True).minimum == 5
+assert dice_distribution("1d8", 3, critical=True).maximum == 19
+assert close(dice_distribution("1d4-2").clamp_min(0).probability(0), 0.5)
+doubled = dice_distribution("1d8", 3).scale(2)
+assert (doubled.minimum, doubled.maximum) == (8, 22) and doubled.probability(9) == 0
+assert close(doubled.probability(10), 1 / 8) and close(doubled.mean, 15.0)
+assert dice_distribution("2d6") is two_d6, "Distribution non mise en cache"
+print("\n✅ Distributions exactes par convolution")
+
+# 2. Probabilités de toucher
+assert all(map(close, hit_chances(5, 15), (0.5, 0.05)))
+assert all(map(close, hit_chances(20, 10), (0.9, 0.05))), "Le 1 naturel rate toujours"
+assert all(map(close, hit_chances(0, 30), (0.0, 0.05))), "Le 20 naturel touche toujours"
+assert close(hit_probability(4, 13, natural_rolls=False), 0.6)
+assert close(hit_probability(4, 13, natural_rolls=False, disadvantage=True), 0.36)
+print("✅ Probabilités de toucher (critiques, avantage/désavantage)")
+
+# 3. Cohérence avec les jets d'EnhancedCombatSystem
+scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+party = scenario.create_party()
+fighter = party[0]
+combat = EnhancedCombatSystem(verbose=False, rng=GameRNG(3))
+attack_bonus, _, _ = combat.get_attack_profile(fighter)
+total = 0
+trials = 100000
+for _ in range(trials):
+    damage = combat._calculate_character_damage(fighter)
+    roll = combat.rng.d20()
+    if roll == 20 or (roll != 1 and roll + attack_bonus >= 15):
+        total += damage * 2 if roll == 20 else damage
+analytic = character_attack_distribution(fighter, 15).mean
+print(f"   Analytique: {analytic:.3f}  Simulé: {total / trials:.3f}")
+assert abs(analytic - total / trials) < 0.05
+print("✅ Dommages moyens conformes à la simulation")
+
+# 4. Rounds pour tuer
+assert close(expected_rounds_to_kill(Distribution.constant(5), 10), 2.0)
+coin_flip = Distribution.mixture([(0.5, Distribution.constant(0)), (0.5, Distribution.constant(10))])
+assert abs(expected_rounds_to_kill(coin_flip, 10) - 2.0) < 1e-6
+print("✅ Espérance du nombre de rounds pour tuer")
+
+# 5. Analyse d'une rencontre
+goblins = [scenario.monster_factory.create_monster('goblin') for _ in range(3)]
+analysis = analyze_encounter(party, goblins)
+assert len(analysis.rounds_to_kill) == 3 and analysis.rounds_to_clear > 1
+assert monster_round_distribution(goblins[0], 16).mean > 0
+print(analysis.summary())
+print("✅ Analyse de rencontre")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Analyse exacte opérationnelle")
+print("=" * 70)
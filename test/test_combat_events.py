@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test du flux d'événements de combat (tampon circulaire + formatage paresseux)
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.core.rng import GameRNG
+from src.systems.combat_events import (
+    CombatEventStream, CombatEventType, ConsoleSink, format_event, FORMATTERS
+)
+from src.systems.combat_simulator import run_combat_loop
+from src.systems.enhanced_combat import EnhancedCombatSystem
+
+print("=" * 70)
+print("🧪 TEST - Flux d'événements de combat")
+print("=" * 70)
+
+scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+
+
+def fight(combat_system):
+    party = scenario.create_party()
+    goblins = [scenario.monster_factory.create_monster('goblin') for _ in range(3)]
+    return run_combat_loop(combat_system, party, goblins), party
+
+
+# 1. Headless: aucun sink, aucun texte produit
+formatted = []
+original = dict(FORMATTERS)
+for event_type, formatter in original.items():
+    FORMATTERS[event_type] = lambda e, f=formatter: formatted.append(e) or f(e)
+silent = EnhancedCombatSystem(verbose=False, rng=GameRNG(5))
+result, party = fight(silent)
+FORMATTERS.update(original)
+assert not silent.events.has_sinks
+assert not formatted, "Aucun formatage ne doit avoir lieu sans sink"
+counts = silent.events.counts()
+assert counts[CombatEventType.ROUND] == result.rounds
+assert counts[CombatEventType.ATTACK] > 0 and counts[CombatEventType.DEATH] >= 1
+print(f"\n✅ Combat headless: {len(silent.events)} événements, aucun texte formaté")
+
+# 2. Analytique directe sur les événements
+damage = silent.events.total(CombatEventType.DAMAGE, actor=party[0])
+assert damage > 0
+assert all(e.value > 0 for e in silent.events.of_type(CombatEventType.DAMAGE))
+print(f"✅ Dommages de {party[0].name}: {damage}")
+
+# 3. Tampon circulaire borné
+stream = CombatEventStream(capacity=10)
+for i in range(25):
+    stream.emit(CombatEventType.DAMAGE, value=i)
+assert len(stream) == 10 and [e.value for e in stream][0] == 15
+assert len(CombatEventStream(capacity=0)) == 0
+print("✅ Tampon borné (les plus anciens événements sont écrasés)")
+
+# 4. Sink console: texte identique à l'ancien affichage
+lines = []
+verbose = EnhancedCombatSystem(verbose=False, message_callback=lines.append, rng=GameRNG(5))
+fight(verbose)
+assert any(line.startswith("⚔️") and "attaque" in line for line in lines)
+assert any(line.startswith("💥") for line in lines)
+assert any("TOUR 1" in line for line in lines)
+print(f"✅ Sink texte: {len(lines)} lignes, ex: {lines[1]!r}")
+
+# 5. Formatage à la demande d'un événement isolé
+stream = CombatEventStream()
+captured = []
+stream.attach(ConsoleSink(captured.append, skip=(CombatEventType.ROUND,)))
+stream.begin_round(1)
+stream.emit(CombatEventType.MISS, party[0], party[1], 0, 7, 3, 15)
+assert captured == ["❌ Raté! (jet: 7+3=10 vs CA 15)"]
+assert format_event(stream.of_type(CombatEventType.ROUND)[0]).strip().startswith("─")
+print("✅ Formatage paresseux")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Flux d'événements opérationnel")
+print("=" * 70)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test de l'enregistrement binaire et de la relecture des combats
+"""
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.core.rng import GameRNG
+from src.systems.combat_events import CombatEventType
+from src.systems.combat_replay import (
+    CombatReplay, ReplayError, library_random, read_replays, record_fight, write_replays
+)
+from src.systems.combat_simulator import run_combat_loop
+from src.systems.conditions import ConditionEngine
+from src.systems.enhanced_combat import EnhancedCombatSystem
+
+print("=" * 70)
+print("🧪 TEST - Enregistrement et relecture des combats")
+print("=" * 70)
+
+scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+
+
+def setup(count=3, monster='goblin'):
+    party = scenario.create_party()
+    monsters = [scenario.monster_factory.create_monster(monster) for _ in range(count)]
+    return party, monsters
+
+
+def snapshot(party, monsters, result):
+    return (result.victory, result.rounds,
+            [c.hit_points for c in party], [m.hit_points for m in monsters])
+
+
+# 1. Enregistrer puis rejouer: issue identique
+logs = []
+for seed in range(20):
+    party, monsters = setup(4, 'orc' if seed % 2 else 'goblin')
+    result, data = record_fight(EnhancedCombatSystem(verbose=False, rng=GameRNG(seed)), party, monsters)
+    expected = snapshot(party, monsters, result)
+
+    party, monsters = setup(4, 'orc' if seed % 2 else 'goblin')
+    replayed = CombatReplay(data).play(party, monsters)
+    assert snapshot(party, monsters, replayed) == expected, f"Seed {seed}: relecture différente"
+    logs.append(data)
+print(f"\n✅ 20 combats rejoués à l'identique (vérification des événements comprise)")
+
+# 2. Taille du journal
+average = sum(len(d) for d in logs) / len(logs)
+print(f"✅ Journal compact: {average:.0f} octets par combat en moyenne")
+assert average < 1024
+
+# 3. Résumé sans rejouer
+party, monsters = setup()
+system = EnhancedCombatSystem(verbose=False, rng=GameRNG(7))
+result, data = record_fight(system, party, monsters)
+summary = CombatReplay(data).summary()
+assert summary['rounds'] == result.rounds
+assert summary['victory'] == result.victory
+damage = system.events.total(CombatEventType.DAMAGE, actor=party[0])
+assert summary['damage'].get(0, 0) == damage
+print(f"✅ Résumé: {summary['rounds']} rounds, victoire={summary['victory']}, "
+      f"dommages de {party[0].name}: {damage}")
+
+# 4. Hordes
+party, _ = setup()
+horde = scenario.monster_factory.create_horde('goblin', 12)
+result, data = record_fight(EnhancedCombatSystem(verbose=False, rng=GameRNG(3)), party, [horde])
+expected = snapshot(party, [], result)
+party, _ = setup()
+horde = scenario.monster_factory.create_horde('goblin', 12)
+assert snapshot(party, [], CombatReplay(data).play(party, [horde])) == expected
+print("✅ Combat de horde rejoué")
+
+# 5. Désynchronisation détectée
+party, monsters = setup(2, 'orc')
+try:
+    CombatReplay(logs[0]).play(party, monsters)
+    raise AssertionError("La désynchronisation aurait dû être détectée")
+except ReplayError as e:
+    print(f"✅ Désynchronisation détectée: {e}")
+
+# 6. Options du combat (initiative, trésors, conditions) reprises de l'en-tête
+weapons, armors, equipments, potions = scenario._load_equipment()
+treasure = dict(weapons=weapons, armors=armors, equipments=equipments, potions=potions)
+party, monsters = setup(4, 'orc')
+result, data = record_fight(EnhancedCombatSystem(verbose=False, rng=GameRNG(11)), party, monsters,
+                            initiative=True, conditions=ConditionEngine(), **treasure)
+expected = snapshot(party, monsters, result)
+replay = CombatReplay(data)
+assert replay.initiative and replay.has_treasure and replay.has_conditions
+party, monsters = setup(4, 'orc')
+assert snapshot(party, monsters, replay.play(party, monsters, **treasure)) == expected
+try:
+    replay.play(*setup(4, 'orc'))
+    raise AssertionError("Trésors manquants: ReplayError attendue")
+except ReplayError:
+    pass
+print("✅ Initiative, trésors et conditions rejoués depuis l'en-tête")
+
+# 7. Victoire au sens de FightResult (un personnage debout), limite de rounds comprise
+party, monsters = setup(6, 'orc')
+result, data = record_fight(EnhancedCombatSystem(verbose=False, rng=GameRNG(2)), party, monsters, max_rounds=1)
+assert result.timed_out and CombatReplay(data).summary()['victory'] == result.victory
+print(f"✅ Issue enregistrée: victoire={result.victory} après la limite de rounds")
+
+# 8. Redirection de random limitée au thread qui enregistre
+def draw(out):
+    random.seed(1)
+    out.append(random.randint(1, 10 ** 9))
+
+
+expected, seen = [], []
+draw(expected)
+with library_random(GameRNG(5)) as rng:
+    worker = threading.Thread(target=draw, args=(seen,))
+    worker.start()
+    worker.join()
+    redirected = random.randint(1, 10 ** 9)
+assert seen == expected, "Les autres threads gardent le module random d'origine"
+assert redirected == GameRNG(5).randint(1, 10 ** 9)
+start = time.perf_counter()
+for _ in range(1000):
+    with library_random(rng):
+        pass
+print(f"✅ random redirigé pour le thread courant seulement "
+      f"({(time.perf_counter() - start) * 1000:.1f} µs par entrée dans le contexte)")
+
+# 9. Archive de journaux
+path = os.path.join(tempfile.mkdtemp(), "combats.replay")
+assert write_replays(path, logs) == len(logs)
+assert [r.data for r in read_replays(path)] == logs
+print(f"✅ Archive: {len(logs)} journaux, {os.path.getsize(path)} octets")
+
+# 10. Résumé plus rapide qu'une re-simulation
+start = time.perf_counter()
+for data in logs:
+    CombatReplay(data).summary()
+decode = time.perf_counter() - start
+start = time.perf_counter()
+for seed in range(len(logs)):
+    party, monsters = setup(4, 'orc' if seed % 2 else 'goblin')
+    run_combat_loop(EnhancedCombatSystem(verbose=False, rng=GameRNG(seed)), party, monsters)
+simulate = time.perf_counter() - start
+print(f"✅ Résumé: {decode * 1000:.1f}ms vs re-simulation: {simulate * 1000:.1f}ms")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Relecture de combats opérationnelle")
+print("=" * 70)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test du roster de combat (vivants + formation en O(1))
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.systems.combat_roster import CombatRoster
+from src.systems.combat_simulator import run_combat_loop
+from src.systems.enhanced_combat import EnhancedCombatSystem
+from src.core.rng import GameRNG
+
+print("=" * 70)
+print("🧪 TEST - Roster de combat")
+print("=" * 70)
+
+scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+party = [scenario.create_basic_fighter(f"Guerrier {i}", level=3) for i in range(5)]
+goblins = [scenario.monster_factory.create_monster('goblin') for _ in range(4)]
+
+# 1. Formation: les 3 premiers du groupe forment la ligne de front
+roster = CombatRoster(party, goblins)
+assert list(roster.front_line) == party[:3] and list(roster.back_line) == party[3:]
+assert roster.accessible_characters == party[:3]
+print("\n✅ Ligne de front / ligne arrière")
+
+# 2. Retraits faits par CombatSystem (list.remove) répercutés au roster
+roster.characters.remove(party[0])
+assert not roster.is_alive(party[0]) and party[0] not in roster.front_line
+monsters = roster.monsters
+roster.monsters.remove(goblins[1])
+assert sorted(map(id, roster.monsters)) == sorted(map(id, [goblins[0], goblins[2], goblins[3]]))
+assert roster.monsters is monsters and goblins[1] not in monsters, "Vue mise à jour sur place"
+try:
+    monsters.remove(goblins[1])
+    raise AssertionError("Retrait d'un absent: ValueError attendue")
+except ValueError:
+    pass
+print("✅ Retraits synchronisés")
+
+# 3. Ligne arrière accessible quand la ligne de front est tombée
+roster.kill(party[1])
+roster.kill(party[2])
+roster.kill(party[2])  # Sans effet
+assert roster.accessible_characters == party[3:]
+assert sorted(map(id, roster.characters)) == sorted(map(id, party[3:]))
+reinforcement = scenario.monster_factory.create_monster('goblin')
+roster.add_monster(reinforcement)
+assert reinforcement in monsters and len(monsters) == 4
+print("✅ Ligne arrière exposée après la chute du front")
+
+# 4. Personnages déjà morts exclus au départ
+party[4].hit_points = 0
+assert list(CombatRoster(party, []).characters) == party[:4]
+party[4].hit_points = party[4].max_hit_points
+print("✅ Personnages KO exclus")
+
+# 5. Ordre des tours conservé après un décès (ordre du groupe, pas celui des vues)
+class OrderSystem:
+    def __init__(self):
+        self.turns = []
+
+    def character_turn(self, character, alive_chars, **kwargs):
+        self.turns.append(character)
+        if len(self.turns) == 1:
+            party[1].hit_points = 0
+            alive_chars.remove(party[1])
+
+    def monster_turn(self, **kwargs):
+        pass
+
+
+system = OrderSystem()
+run_combat_loop(system, party, goblins[:1], max_rounds=2)
+assert system.turns[4:] == [party[0], party[2], party[3], party[4]], "Ordre du groupe après un décès"
+party[1].hit_points = party[1].max_hit_points
+print("✅ Ordre des tours inchangé après un décès")
+
+# 6. Grande bataille: les morts ne restent jamais ciblables
+army = [scenario.create_basic_fighter(f"Soldat {i}", level=10) for i in range(20)]
+horde = [scenario.monster_factory.create_monster('goblin') for _ in range(100)]
+result = run_combat_loop(EnhancedCombatSystem(verbose=False, rng=GameRNG(4)), army, horde, max_rounds=200)
+assert all(c.hit_points > 0 for c in result.alive_chars)
+assert all(m.hit_points > 0 for m in result.alive_monsters)
+print(f"✅ 20 personnages contre 100 gobelins: {'victoire' if result.victory else 'défaite'} "
+      f"en {result.rounds} rounds")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Roster de combat opérationnel")
+print("=" * 70)
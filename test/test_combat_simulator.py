@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test du simulateur de combat headless
+Vérifie qu'aucune sortie n'est produite et que les statistiques sont cohérentes
+"""
+import io
+import sys
+from contextlib import redirect_stdout
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.scenes.scene_factory import SceneFactory
+from src.systems.combat_simulator import CombatSimulator, SimulationStats
+
+print("=" * 70)
+print("🧪 TEST - Simulateur de combat headless")
+print("=" * 70)
+
+scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+party = scenario.create_party()
+simulator = CombatSimulator(party, scenario.monster_factory)
+
+scene = SceneFactory.create_scene_from_dict({
+    'id': 'ambush', 'type': 'combat', 'title': 'Embuscade',
+    'monsters': ['goblin', 'goblin', 'goblin'],
+    'on_victory': 'victory', 'on_defeat': 'game_over'
+})
+
+# 1. Aucune sortie console pendant la simulation
+buffer = io.StringIO()
+with redirect_stdout(buffer):
+    stats = simulator.simulate_scene(scene, trials=200)
+assert buffer.getvalue() == "", f"Sortie inattendue: {buffer.getvalue()[:200]}"
+print("\n✅ Aucune sortie pendant 200 combats")
+
+# 2. Statistiques cohérentes
+assert stats.trials == 200
+assert 0.0 <= stats.win_rate <= 1.0
+assert sum(stats.rounds_histogram.values()) == 200
+assert set(stats.deaths) == {c.name for c in party}
+for char in party:
+    assert 0 <= stats.mean_hp_remaining(char.name) <= char.max_hit_points
+print(f"✅ Statistiques cohérentes:\n{stats.summary()}")
+
+# 3. Le groupe de référence n'est jamais modifié
+for char in party:
+    assert char.hit_points == char.max_hit_points, f"{char.name} a été modifié"
+print("✅ Groupe de référence intact")
+
+# 4. Fusion des statistiques
+merged = SimulationStats().merge(stats).merge(stats)
+assert merged.trials == 400 and merged.wins == 2 * stats.wins
+print("✅ Fusion des statistiques")
+
+# 5. Simulation d'un fichier de scénario complet
+results = simulator.simulate_scenario_file("data/scenes/chasse_gobelins.json", trials=20)
+assert set(results) == {'forest_ambush', 'boss_fight'}
+print(f"✅ Scènes de combat simulées: {', '.join(results)}")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Simulateur opérationnel")
+print("=" * 70)
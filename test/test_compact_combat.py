@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Test des états de combat compacts (CombatantState)
+Compare les résultats avec la boucle de combat sur objets dnd_5e_core
+"""
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.core.rng import GameRNG
+from src.systems.combat_simulator import CombatSimulator
+from src.systems.combat_events import CombatEventType
+from src.systems.combat_simulator import run_combat_loop
+from src.systems.compact_combat import CombatantState, run_compact_combat
+from src.systems.conditions import ConditionEngine, ConditionList
+from src.systems.enhanced_combat import EnhancedCombatSystem
+
+print("=" * 70)
+print("🧪 TEST - États de combat compacts")
+print("=" * 70)
+
+scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+factory = scenario.monster_factory
+party = scenario.create_party()
+
+# 1. État slotté, sans dictionnaire d'instance
+goblin = factory.create_monster('goblin')
+state = CombatantState.for_monster(goblin, 0)
+assert not hasattr(state, '__dict__')
+assert state.hp == goblin.hit_points and state.ac == goblin.armor_class
+assert state.compact and state.attacks
+assert CombatantState.for_monster(factory.create_monster('goblin'), 1).attacks is state.attacks, \
+    "Attaques compilées partagées par les copies d'un prototype"
+print(f"\n✅ {state!r}")
+
+# 2. Monstres à sorts ou capacités spéciales: tours délégués à dnd_5e_core
+mage = factory.create_monster('mage')
+assert mage is not None and not CombatantState.for_monster(mage, 0).compact
+print("✅ Mage délégué à dnd_5e_core")
+
+# 3. Résultats reportés sur les objets en fin de combat
+simulator = CombatSimulator(party, factory, rng=GameRNG(3))
+fight_party = simulator.copy_party()
+enemies = [factory.create_monster('goblin') for _ in range(3)]
+result = run_compact_combat(EnhancedCombatSystem(verbose=False, rng=GameRNG(3)), fight_party, enemies)
+assert result.victory == bool(result.alive_chars)
+assert all(m.hit_points <= 0 for m in enemies if m not in result.alive_monsters)
+assert all(c.hit_points > 0 for c in result.alive_chars)
+for char in fight_party:
+    if char not in result.alive_chars:
+        assert char.hit_points == 0 and char.status == "DEAD"
+print(f"✅ Combat compact: victoire={result.victory} en {result.rounds} rounds, état reporté")
+
+# 4. Résultats cohérents avec la boucle sur objets
+def goblins(ctx):
+    return [factory.create_monster('goblin') for _ in range(4)] + [factory.create_monster('goblin_boss')]
+
+
+standard = CombatSimulator(party, factory, rng=GameRNG(11), compact=False)
+compact = CombatSimulator(party, factory, rng=GameRNG(11), compact=True)
+start = time.perf_counter()
+standard_stats = standard.simulate(goblins, 1500)
+standard_time = time.perf_counter() - start
+start = time.perf_counter()
+compact_stats = compact.simulate(goblins, 1500)
+compact_time = time.perf_counter() - start
+print(f"   Objets:   {standard_stats.win_rate:.1%} victoires, {standard_stats.mean_rounds:.2f} rounds "
+      f"({standard_time:.2f}s)")
+print(f"   Compacts: {compact_stats.win_rate:.1%} victoires, {compact_stats.mean_rounds:.2f} rounds "
+      f"({compact_time:.2f}s)")
+assert abs(standard_stats.win_rate - compact_stats.win_rate) < 0.05
+assert abs(standard_stats.mean_rounds - compact_stats.mean_rounds) < 0.5
+print("✅ Résultats cohérents avec le combat standard")
+
+# 5. Combats mixtes (monstres délégués)
+mixed = CombatSimulator(party, factory, rng=GameRNG(5)).simulate(
+    lambda ctx: [factory.create_monster('mage'), factory.create_monster('goblin')], 200)
+assert mixed.trials == 200
+print(f"✅ Combats avec monstre délégué: {mixed.win_rate:.1%} victoires")
+
+# 6. Soins des monstres délégués conservés (états des monstres relus après le tour)
+heals = 0
+for seed in range(30):
+    system = EnhancedCombatSystem(verbose=False, rng=GameRNG(seed))
+    acolytes = [factory.create_monster('acolyte') for _ in range(3)]
+    for acolyte in acolytes:
+        acolyte.hit_points = 3
+    after_turn = {}
+    monster_turn = system.monster_turn
+
+    def recording_turn(**kwargs):
+        before = {id(m): m.hit_points for m in kwargs['alive_monsters']}
+        monster_turn(**kwargs)
+        for m in kwargs['alive_monsters']:
+            if m.hit_points > before[id(m)]:
+                after_turn[id(m)] = (m, m.hit_points)
+
+    system.monster_turn = recording_turn
+    # Un seul round: aucun dégât sur les monstres après leurs tours
+    run_compact_combat(system, CombatSimulator(party, factory).copy_party(), acolytes, max_rounds=1)
+    for healed, hp in after_turn.values():
+        assert healed.hit_points == hp, f"Soin annulé: {healed.hit_points} au lieu de {hp}"
+        heals += 1
+assert heals, "Aucun soin de monstre observé"
+print(f"✅ {heals} soins de monstres conservés")
+
+# 7. Initiative, renforts et conditions sur états compacts
+def options_fight(seed: int, compact: bool):
+    system = EnhancedCombatSystem(verbose=False, rng=GameRNG(seed))
+    engine = ConditionEngine()
+    boss = factory.create_monster('goblin_boss')
+    base_ac = boss.armor_class
+    engine.apply(boss, 'shield', rounds=1, modifiers={'armor_class': 5})
+    enemies = [boss, factory.create_monster('goblin')]
+    result = run_combat_loop(system, CombatSimulator(party, factory).copy_party(), enemies,
+                             compact=compact, initiative=True, conditions=engine,
+                             reinforcements={2: [factory.create_monster('goblin')]})
+    assert boss.armor_class == base_ac, "Bouclier expiré"
+    assert not any(isinstance(m.conditions, ConditionList) for m in enemies), "Listes rendues"
+    seen = {(e.round > 1, e.armor_class) for e in system.events
+            if e.target is boss and e.type in (CombatEventType.HIT, CombatEventType.MISS)}
+    return result, base_ac, seen
+
+
+compact_results, standard_results, checked = [], [], set()
+for seed in range(300):
+    result, base_ac, seen = options_fight(seed, compact=True)
+    checked |= {later for later, _ in seen}
+    assert all(ac == (base_ac if later else base_ac + 5) for later, ac in seen), \
+        f"CA compacte non relue après expiration: {seen}"
+    compact_results.append(result)
+    standard_results.append(options_fight(seed, compact=False)[0])
+assert checked == {False, True}, "Attaques sur le boss avant et après expiration"
+compact_wins = sum(r.victory for r in compact_results) / len(compact_results)
+standard_wins = sum(r.victory for r in standard_results) / len(standard_results)
+compact_rounds = sum(r.rounds for r in compact_results) / len(compact_results)
+standard_rounds = sum(r.rounds for r in standard_results) / len(standard_results)
+print(f"   Objets:   {standard_wins:.1%} victoires, {standard_rounds:.2f} rounds")
+print(f"   Compacts: {compact_wins:.1%} victoires, {compact_rounds:.2f} rounds")
+assert abs(compact_wins - standard_wins) < 0.1
+assert abs(compact_rounds - standard_rounds) < 0.75
+print("✅ Initiative, renforts et conditions joués sur états compacts")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - États de combat compacts opérationnels")
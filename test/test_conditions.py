@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test du moteur de conditions (roue temporelle hiérarchique)
+Durées en rounds/minutes, modificateurs réversibles, sort Bouclier
+"""
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dnd_5e_core.combat import Condition, create_poisoned_condition
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.core.rng import GameRNG
+from src.core.timer_wheel import TimerWheel
+from src.rendering import ScriptedRenderer
+from src.scenes.scene_system import CombatScene, SceneResult
+from src.systems.conditions import ConditionEngine
+from src.systems.enhanced_combat import EnhancedCombatSystem
+from src.systems.spellcasting import SpellcastingSystem
+
+print("=" * 70)
+print("🧪 TEST - Moteur de conditions")
+print("=" * 70)
+
+# 1. Roue: chaque minuteur expire exactement à son échéance, y compris après cascades
+wheel = TimerWheel(slots=8, levels=3)
+rng = GameRNG(2)
+delays = [rng.randint(1, 1200) for _ in range(2000)]
+timers = [wheel.schedule(delay, i) for i, delay in enumerate(delays)]
+timers[0].cancel()
+expired_at = {}
+for tick in range(1, 1201):
+    for item in wheel.tick():
+        expired_at[item] = tick
+assert 0 not in expired_at, "Minuteur annulé"
+assert all(expired_at[i] == delays[i] for i in range(1, len(delays)))
+assert len(wheel) == 0
+print("\n✅ 2000 minuteurs expirés à l'échéance exacte (cascades et débordement)")
+
+# 2. Modificateurs appliqués puis retirés
+scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+goblin = scenario.monster_factory.create_monster('goblin')
+engine = ConditionEngine()
+base_ac = goblin.armor_class
+effect = engine.apply(goblin, 'shield', rounds=1, modifiers={'armor_class': 5})
+assert goblin.armor_class == base_ac + 5 and engine.has_effect(goblin, 'shield')
+assert engine.advance(1) == [effect]
+assert goblin.armor_class == base_ac and not engine.effects(goblin)
+print("✅ Bonus de CA retiré à l'expiration")
+
+# 3. Personnages dnd_5e_core: CA calculée (propriété) -> bonus via ac_bonus
+fighter = scenario.create_party()[0]
+base_ac = fighter.armor_class
+spellcasting = SpellcastingSystem(engine)
+shield = spellcasting.get_spell('shield')
+
+
+class Caster:
+    class_type = type('ClassType', (), {'can_cast': True})()
+    slots = 1
+
+    def can_cast_spell(self, level):
+        return self.slots > 0
+
+    def cast_spell(self, level):
+        self.slots -= 1
+
+
+assert spellcasting.cast_buff_spell(Caster(), shield, fighter)
+assert fighter.armor_class == base_ac + 5
+engine.advance(1)
+assert fighter.armor_class == base_ac, "Bouclier ne doit plus être permanent"
+print("✅ Bouclier: +5 CA pendant un round seulement")
+
+# 4. Conditions dnd_5e_core, durées en minutes et dissipation
+poisoned = create_poisoned_condition()
+poisoned.duration = 3
+goblin.conditions = [poisoned]
+engine.track(goblin, poisoned)
+engine.advance(2)
+assert poisoned in goblin.conditions
+engine.advance(1)
+assert poisoned not in goblin.conditions
+bless = engine.apply(goblin, 'bless', minutes=1)
+engine.advance(9)
+assert engine.has_effect(goblin, 'bless')
+assert engine.remove(bless) and not engine.remove(bless)
+print("✅ Conditions suivies, minutes, dissipation")
+
+# 5. Ajouts observés: seuls les combattants touchés sont examinés
+engine = ConditionEngine()
+crowd = [type('Target', (), {})() for _ in range(1000)]
+for target in crowd:
+    engine.observe(target)
+frightened = Condition(index='frightened', name='Frightened', duration=2)
+crowd[500].conditions.append(frightened)
+crowd[7].conditions.append(Condition(index='prone', name='Prone'))   # Sans durée: non suivie
+effects = engine.track_pending()
+assert [effect.target for effect in effects] == [crowd[500]] and engine.track_pending() == []
+engine.release(crowd[500])
+assert type(crowd[500].conditions) is list and frightened in crowd[500].conditions
+engine.advance(2)
+assert frightened not in crowd[500].conditions
+print("✅ Conditions ajoutées suivies en O(ajouts), listes rendues en fin de combat")
+
+# 6. Condition posée par un monstre en combat: suivie puis expirée via CombatScene
+#    (acolytes: monstres à sorts, tours délégués à monster_turn même sur états compacts)
+engine = ConditionEngine()
+combat_system = EnhancedCombatSystem(verbose=False, rng=GameRNG(4))
+monster_turn = combat_system.monster_turn
+stunned = Condition(index='stunned', name='Stunned', duration=1)
+observed = []   # (round, condition encore présente sur la cible)
+
+
+def stunning_monster_turn(monster, alive_chars, round_num, **kwargs):
+    monster_turn(monster=monster, alive_chars=alive_chars, round_num=round_num, **kwargs)
+    if not observed and alive_chars:
+        alive_chars[0].conditions.append(stunned)
+        observed.append((round_num, alive_chars[0]))
+
+
+combat_system.monster_turn = stunning_monster_turn
+party = scenario.create_party()
+scene = CombatScene('embuscade', "Embuscade", "",
+                    lambda ctx: [scenario.monster_factory.create_monster('acolyte') for _ in range(2)],
+                    on_victory_scene='fin')
+seen = {}      # round de combat -> condition encore présente après l'avancée du moteur
+
+
+def on_advance(rounds, advance=engine.advance):
+    expired = advance(rounds)
+    seen[engine.round + 1] = stunned in observed[0][1].conditions if observed else None
+    return expired
+
+
+engine.advance = on_advance
+context = {'party': party, 'game_state': {}, 'renderer': ScriptedRenderer(),
+           'combat_system': combat_system, 'conditions': engine}
+with contextlib.redirect_stdout(io.StringIO()):
+    result = scene.execute(context)
+assert result in (SceneResult.SUCCESS, SceneResult.FAILURE) and observed
+added_round, target = observed[0]
+assert added_round + 1 in seen, "Le combat doit durer au-delà de l'échéance"
+assert stunned not in target.conditions and not engine.effects(target)
+assert seen[added_round + 1] is False, "Condition expirée au round suivant"
+print(f"✅ Condition de combat suivie (round {added_round}) et expirée via CombatScene")
+
+# 7. Coût indépendant du nombre d'effets en attente
+engine = ConditionEngine()
+targets = [type('Target', (), {'armor_class': 10})() for _ in range(200)]
+
+
+def cost(pending: int) -> float:
+    for i in range(pending):
+        engine.apply(targets[i % len(targets)], 'buff', minutes=100 + i % 50, modifiers={'armor_class': 1})
+    start = time.perf_counter()
+    engine.advance(200)
+    return time.perf_counter() - start
+
+
+small, large = cost(1000), cost(100000)
+print(f"   200 rounds: {small * 1000:.2f} ms (1k effets) / {large * 1000:.2f} ms (100k effets)")
+assert large < small * 20 + 0.05
+print("✅ Expiration en O(effets expirés)")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Moteur de conditions opérationnel")
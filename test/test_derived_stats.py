@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test du cache des statistiques dérivées des personnages
+Invalidation par l'équipement et la montée de niveau
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.core.adapters import CharacterExtensions
+from src.core.derived_stats import compute_derived_stats, derived_stats, invalidate_derived_stats
+from src.systems.enhanced_combat import EnhancedCombatSystem
+from src.utils.level_manager import LevelUpManager
+
+print("=" * 70)
+print("🧪 TEST - Statistiques dérivées en cache")
+print("=" * 70)
+
+scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+party = scenario.create_party()
+
+# 1. Profil identique au calcul direct, objet mis en cache
+for char in party:
+    stats = derived_stats(char)
+    assert stats == compute_derived_stats(char)
+    assert derived_stats(char) is stats
+    assert EnhancedCombatSystem.get_attack_profile(char) == (stats.attack_bonus, stats.damage_dice,
+                                                              stats.damage_modifier)
+    print(f"\n✅ {char.name} ({char.class_type.index}): +{stats.attack_bonus}, "
+          f"{stats.damage_dice}{stats.damage_modifier:+d}")
+
+fighter = next(c for c in party if c.class_type.index == 'fighter')
+rogue = next((c for c in party if c.class_type.index == 'rogue'), None)
+if rogue is not None:
+    assert derived_stats(rogue).attack_bonus == derived_stats(rogue).dex_mod + derived_stats(rogue).proficiency_bonus
+    print("✅ Roublard: attaque à la DEX")
+
+# 2. Invalidation par l'équipement
+stats = derived_stats(fighter)
+CharacterExtensions.equip_weapon(fighter, object())
+assert derived_stats(fighter) is not stats
+stats = derived_stats(fighter)
+
+
+class Shield:
+    armor_class = 2
+
+
+CharacterExtensions.equip_armor(fighter, Shield())
+assert derived_stats(fighter) is not stats
+print("✅ Cache invalidé par equip_weapon / equip_armor")
+
+# 3. Invalidation par la montée de niveau (bonus de maîtrise)
+fighter.level = 3
+fighter.xp = LevelUpManager.XP_TABLE[5]
+invalidate_derived_stats(fighter)
+assert derived_stats(fighter).proficiency_bonus == 2
+assert LevelUpManager.level_up(fighter)
+assert fighter.level == 4 and derived_stats(fighter).proficiency_bonus == 3
+print("✅ Cache invalidé par LevelUpManager.level_up")
+
+# 4. Caractéristiques modifiées hors des points d'invalidation: invalidation explicite
+fighter.abilities.str += 2
+invalidate_derived_stats(fighter)
+assert derived_stats(fighter) == compute_derived_stats(fighter)
+print("✅ Invalidation explicite")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Statistiques dérivées opérationnelles")
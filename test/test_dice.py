@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test du moteur d'expressions de dés compilées
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.core.dice import parse_dice
+from src.core.entities import Potion
+from src.core.rng import GameRNG
+
+print("=" * 70)
+print("🧪 TEST - Expressions de dés")
+print("=" * 70)
+
+# 1. Analyse et cache
+potion = parse_dice("2d4+2")
+assert potion.terms == ((2, 4),) and potion.bonus == 2
+assert parse_dice("2d4+2") is potion, "L'expression doit être internée"
+assert parse_dice("d20").terms == ((1, 20),)
+assert parse_dice("1d8-1").bonus == -1
+assert parse_dice("2d6 + 1d4 + 3").terms == ((2, 6), (1, 4))
+assert parse_dice("7").terms == () and parse_dice("7").roll() == 7
+for invalid in ("", "2d", "abc", "1d6++2"):
+    try:
+        parse_dice(invalid)
+    except ValueError:
+        continue
+    raise AssertionError(f"Expression invalide acceptée: {invalid!r}")
+print("\n✅ Analyse, cache et erreurs")
+
+# 2. Statistiques
+assert (potion.minimum, potion.maximum, potion.mean) == (4, 10, 7.0)
+assert (parse_dice("1d8-1").minimum, parse_dice("1d8-1").maximum) == (0, 7)
+print("✅ Minimum / maximum / moyenne")
+
+# 3. Jets dans les bornes, reproductibles
+rng = GameRNG(5)
+rolls = potion.roll_many(5000, rng)
+assert min(rolls) == 4 and max(rolls) == 10
+assert abs(sum(rolls) / len(rolls) - 7.0) < 0.1
+assert potion.roll_many(50, GameRNG(9)) == potion.roll_many(50, GameRNG(9))
+print("✅ Jets dans les bornes et reproductibles")
+
+# 4. Critique: dés doublés, bonus une seule fois
+crit = parse_dice("1d8+3")
+crits = [crit.roll(rng, critical=True) for _ in range(3000)]
+assert min(crits) == 5 and max(crits) == 19
+print("✅ Coups critiques")
+
+# 5. Avantage / désavantage
+d20 = parse_dice("1d20")
+adv = [d20.roll(rng, advantage=True) for _ in range(4000)]
+dis = [d20.roll(rng, disadvantage=True) for _ in range(4000)]
+assert sum(adv) / len(adv) > 13 and sum(dis) / len(dis) < 8
+both = [d20.roll(rng, advantage=True, disadvantage=True) for _ in range(4000)]
+assert 9.5 < sum(both) / len(both) < 11.5
+print("✅ Avantage et désavantage")
+
+# 6. Potions
+healing = Potion("Potion de soins", "Soigne", 50, "healing", "2d4+2")
+assert all(4 <= healing.use(rng) <= 10 for _ in range(200))
+print("✅ Potions")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Moteur de dés opérationnel")
+print("=" * 70)
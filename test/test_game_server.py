@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test du serveur de parties hébergées (asyncio)
+Sessions simultanées sur un même processus, données partagées
+"""
+import asyncio
+import logging
+import re
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.core.rng import GameRNG
+from src.scenes import PromptType
+from src.server.game_server import PROMPT_MARK, SESSION_ERROR, GameServer, GameSession
+
+CLIENTS = 40
+
+print("=" * 70)
+print("🧪 TEST - Serveur de parties")
+print("=" * 70)
+
+template = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+server = GameServer(template, max_sessions=CLIENTS, seed=1)
+scenario_ids = server.scenario_ids()
+assert 'chasse_gobelins' in scenario_ids
+scenario_number = scenario_ids.index('chasse_gobelins') + 1
+
+# 1. Session locale: réponses invalides, données partagées, état propre
+first = server.create_session('chasse_gobelins', seed=1)
+second = server.create_session('chasse_gobelins', seed=2)
+assert first.manager is not second.manager
+assert first.game_context['party'] is not second.game_context['party']
+assert first.game_context['weapons'] is second.game_context['weapons']
+assert first.manager.graph is second.manager.graph is server.scenarios['chasse_gobelins'][1]
+text = first.start()
+assert text.endswith(PROMPT_MARK) and first.manager.prompt.type == PromptType.CONTINUE
+while first.manager.prompt.type != PromptType.CHOICE:
+    first.handle("")
+prompt = first.manager.prompt
+assert first.handle("abc").startswith("Veuillez entrer un nombre") and first.manager.prompt is prompt
+assert first.handle("99").startswith("Veuillez entrer un nombre") and first.manager.prompt is prompt
+first_shop = first.game_context['merchant_system'].get_merchant('village')
+second_shop = second.game_context['merchant_system'].get_merchant('village')
+assert first_shop is not second_shop
+first_shop.remove_quantity('potion_healing', 5)
+assert not first_shop.has_item('potion_healing') and second_shop.has_item('potion_healing', 5)
+server.close_session(first)
+server.close_session(second)
+assert not server.sessions
+print("\n✅ Sessions isolées (marchands compris), données en lecture seule partagées, saisies invalides ignorées")
+
+
+# 2. Parties simultanées sur TCP
+async def play(port: int, seed: int) -> str:
+    rng = GameRNG(seed)
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    mark = PROMPT_MARK.encode('utf-8')
+    await reader.readuntil(mark)
+    writer.write(f"{scenario_number}\n".encode())
+    transcript = ""
+    while True:
+        try:
+            message = (await reader.readuntil(mark)).decode('utf-8')
+        except asyncio.IncompleteReadError as end:
+            transcript += end.partial.decode('utf-8')
+            break
+        transcript += message
+        options = re.search(r"Votre choix \(1-(\d+)\)" + re.escape(PROMPT_MARK) + "$", message)
+        answer = str(rng.randint(1, int(options.group(1)))) if options else ""
+        writer.write(f"{answer}\n".encode())
+    writer.close()
+    return transcript
+
+
+async def main():
+    tcp_server = await server.start(port=0)
+    port = tcp_server.sockets[0].getsockname()[1]
+    async with tcp_server:
+        return await asyncio.gather(*(play(port, seed) for seed in range(CLIENTS)))
+
+start = time.perf_counter()
+transcripts = asyncio.run(main())
+elapsed = time.perf_counter() - start
+assert all(transcript.rstrip().endswith("🏁 Partie terminée") for transcript in transcripts)
+assert not server.sessions, "Sessions libérées à la fin des parties"
+victories = sum("VICTOIRE" in transcript for transcript in transcripts)
+print(f"✅ {CLIENTS} parties simultanées terminées en {elapsed:.2f}s ({victories} avec victoire en combat)")
+
+
+
+# 3. Étape longue (combat) jouée hors de la boucle d'événements
+async def welcome_delay(port: int) -> float:
+    """Délai d'accueil d'un second client pendant l'étape longue du premier"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    mark = PROMPT_MARK.encode('utf-8')
+    await reader.readuntil(mark)
+    writer.write(f"{scenario_number}\n".encode())
+    await asyncio.sleep(0.05)
+    start = time.perf_counter()
+    other_reader, other_writer = await asyncio.open_connection('127.0.0.1', port)
+    await other_reader.readuntil(mark)
+    delay = time.perf_counter() - start
+    await reader.readuntil(mark)
+    for stream_reader, stream_writer in ((reader, writer), (other_reader, other_writer)):
+        stream_writer.write(b"q\n")
+        await stream_reader.read()
+        stream_writer.close()
+    return delay
+
+
+async def serve(game_server: GameServer, client):
+    tcp_server = await game_server.start(port=0)
+    async with tcp_server:
+        return await client(tcp_server.sockets[0].getsockname()[1])
+
+start_session = GameSession.start
+GameSession.start = lambda session: time.sleep(0.5) or start_session(session)
+try:
+    delay = asyncio.run(serve(GameServer(template, max_sessions=2, seed=1), welcome_delay))
+finally:
+    GameSession.start = start_session
+assert delay < 0.25, f"Boucle d'événements bloquée pendant l'étape ({delay:.2f}s)"
+print(f"✅ Second client accueilli en {delay * 1000:.0f} ms pendant une étape de 500 ms")
+
+
+# 4. Exception d'une scène: journalisée, message d'erreur au client, session libérée
+class Records(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+async def broken_game(port: int) -> str:
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    await reader.readuntil(PROMPT_MARK.encode('utf-8'))
+    writer.write(f"{scenario_number}\n".encode())
+    reply = (await reader.read()).decode('utf-8')
+    writer.close()
+    return reply
+
+
+def broken_start(session):
+    raise KeyError('scene_data')
+
+
+records = Records()
+server_logger = logging.getLogger('src.server.game_server')
+server_logger.addHandler(records)
+server_logger.propagate = False
+GameSession.start = broken_start
+broken_server = GameServer(template, max_sessions=2, seed=1)
+try:
+    reply = asyncio.run(serve(broken_server, broken_game))
+finally:
+    GameSession.start = start_session
+    server_logger.removeHandler(records)
+    server_logger.propagate = True
+assert reply == SESSION_ERROR, reply
+assert len(records.records) == 1 and records.records[0].exc_info[0] is KeyError
+assert not broken_server.sessions
+print("✅ Exception de scène journalisée et signalée au client")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Serveur de parties opérationnel")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test du mode horde (monstres identiques regroupés)
+Compare les résultats avec des monstres dnd_5e_core individuels
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.core.rng import GameRNG
+from src.scenes.scene_factory import SceneFactory
+from src.systems.combat_simulator import CombatSimulator, run_combat_loop
+from src.systems.conditions import ConditionEngine, ConditionList
+from src.systems.enhanced_combat import EnhancedCombatSystem
+from src.systems.horde_combat import MonsterHorde
+
+print("=" * 70)
+print("🧪 TEST - Mode horde")
+print("=" * 70)
+
+scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+factory = scenario.monster_factory
+
+# 1. Une horde = un modèle + un tableau de HP
+horde = factory.create_horde('goblin', 50)
+assert isinstance(horde, MonsterHorde)
+assert horde.alive == 50 and len(horde.hit_points_array) == 50
+assert horde.hit_points == 50 * horde.max_hit_points
+assert horde.xp == 50 * horde.template.xp
+print(f"\n✅ {horde.name}: {horde.hit_points} HP cumulés")
+
+# 2. Dommages, ciblage du plus faible et morts en O(1)
+horde.take_damage(10, 3)
+assert horde.weakest() == 10
+assert horde.take_damage(10, 100) is True
+assert horde.alive == 49 and horde.weakest() == 0
+assert horde.template.hit_points == horde.max_hit_points, "Le modèle ne doit pas être modifié"
+print("✅ Dommages et morts")
+
+# 3. Regroupement automatique par la SceneFactory
+scene = SceneFactory.create_scene_from_dict({
+    'id': 'army', 'type': 'combat', 'monsters': ['goblin'] * 30 + ['goblin_boss'],
+    'on_victory': 'victory'
+}, factory)
+enemies = scene.enemies_factory({'monster_factory': factory})
+assert sorted(h.count for h in enemies) == [1, 30]
+print("✅ Scène de 31 monstres regroupée en 2 hordes")
+
+# 4. Résultats cohérents avec des monstres individuels
+party = scenario.create_party()
+simulator = CombatSimulator(party, factory, rng=GameRNG(11))
+individual = simulator.simulate(lambda ctx: [factory.create_monster('goblin') for _ in range(4)], 1500)
+grouped = simulator.simulate(lambda ctx: [factory.create_horde('goblin', 4)], 1500)
+print(f"   Individuels: {individual.win_rate:.1%} victoires, {individual.mean_rounds:.2f} rounds")
+print(f"   Horde:       {grouped.win_rate:.1%} victoires, {grouped.mean_rounds:.2f} rounds")
+assert abs(individual.win_rate - grouped.win_rate) < 0.05
+assert abs(individual.mean_rounds - grouped.mean_rounds) < 0.5
+print("✅ Résultats cohérents avec le combat standard")
+
+# 5. Initiative (un jet par horde), renforts et conditions
+def options_fight(seed: int, enemies: list, reinforcement):
+    engine = ConditionEngine()
+    fight_party = simulator.copy_party()
+    base_ac = fight_party[0].armor_class
+    engine.apply(fight_party[0], 'shield', rounds=1, modifiers={'armor_class': 5})
+    result = run_combat_loop(EnhancedCombatSystem(verbose=False, rng=GameRNG(seed)), fight_party, enemies,
+                             initiative=True, conditions=engine, reinforcements={2: [reinforcement]})
+    if result.rounds > 1:
+        assert fight_party[0].armor_class == base_ac, "Bouclier expiré pendant le combat"
+    assert not any(isinstance(c.conditions, ConditionList) for c in fight_party), "Listes rendues"
+    return result
+
+
+individual, grouped, joined = [], [], 0
+for seed in range(1000):
+    individual.append(options_fight(seed, [factory.create_monster('goblin') for _ in range(3)],
+                                    factory.create_monster('goblin')))
+    result = options_fight(seed, [factory.create_horde('goblin', 3)], factory.create_monster('goblin'))
+    joined += any(h.count == 1 for h in result.alive_monsters)
+    grouped.append(result)
+individual_wins = sum(r.victory for r in individual) / len(individual)
+grouped_wins = sum(r.victory for r in grouped) / len(grouped)
+individual_rounds = sum(r.rounds for r in individual) / len(individual)
+grouped_rounds = sum(r.rounds for r in grouped) / len(grouped)
+print(f"   Individuels: {individual_wins:.1%} victoires, {individual_rounds:.2f} rounds")
+print(f"   Horde:       {grouped_wins:.1%} victoires, {grouped_rounds:.2f} rounds")
+assert joined, "Renfort ajouté comme horde d'un monstre"
+assert abs(individual_wins - grouped_wins) < 0.1
+assert abs(individual_rounds - grouped_rounds) < 0.75
+print("✅ Initiative, renforts et conditions avec des hordes")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Mode horde opérationnel")
+print("=" * 70)
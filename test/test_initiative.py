@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test de l'ordonnanceur d'initiative (tas binaire)
+Ordre d'initiative, actions retardées et préparées, renforts
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.core.rng import GameRNG
+from src.systems.combat_simulator import CombatSimulator, run_combat_loop
+from src.systems.enhanced_combat import EnhancedCombatSystem
+from src.systems.initiative import InitiativeScheduler
+
+
+class Fighter:
+    def __init__(self, name, dex=10):
+        self.name = name
+        self.abilities = type('Abilities', (), {'dex': dex})()
+
+    def __repr__(self):
+        return self.name
+
+
+print("=" * 70)
+print("🧪 TEST - Ordonnanceur d'initiative")
+print("=" * 70)
+
+# 1. Ordre: initiative décroissante, puis DEX, puis ordre d'arrivée
+a, b, c, d = Fighter('A'), Fighter('B', dex=16), Fighter('C'), Fighter('D')
+scheduler = InitiativeScheduler(GameRNG(1))
+scheduler.add(a, 12)
+scheduler.add(b, 12)
+scheduler.add(c, 18)
+scheduler.add(d, 12)
+turns = [scheduler.next_turn() for _ in range(8)]
+assert [t.combatant for t in turns] == [c, b, a, d, c, b, a, d]
+assert [t.round_num for t in turns] == [1, 1, 1, 1, 2, 2, 2, 2]
+print("\n✅ Ordre d'initiative stable sur plusieurs rounds")
+
+# 2. Initiative tirée: d20 + DEX
+rolled = InitiativeScheduler(GameRNG(4)).add(b)
+assert 1 + 3 <= rolled <= 20 + 3
+print(f"✅ Initiative tirée: {rolled}")
+
+# 3. Action retardée: rejoue plus tard dans le même round
+scheduler = InitiativeScheduler()
+for fighter, value in ((a, 20), (b, 15), (c, 10)):
+    scheduler.add(fighter, value)
+assert scheduler.next_turn().combatant is a
+assert not scheduler.delay(b, 5), "Seul le combattant du tour en cours peut retarder"
+assert scheduler.delay(a, 12)
+assert [scheduler.next_turn().combatant for _ in range(3)] == [b, a, c]
+assert scheduler.next_turn().combatant is b, "Nouvelle initiative conservée au round suivant"
+print("✅ Action retardée")
+
+# 4. Action préparée: déclenchée par le tour d'un autre combattant
+scheduler = InitiativeScheduler()
+for fighter, value in ((a, 20), (b, 15), (c, 10)):
+    scheduler.add(fighter, value)
+assert scheduler.next_turn().combatant is a
+assert scheduler.ready(a, lambda actor: actor is c)
+assert scheduler.next_turn().combatant is b and scheduler.triggered(b) == []
+assert scheduler.next_turn().combatant is c
+triggered = scheduler.triggered(c)
+assert [t.combatant for t in triggered] == [a] and triggered[0].readied
+assert scheduler.triggered(c) == [], "Action préparée consommée"
+print("✅ Action préparée")
+
+# 5. Renforts et morts
+scheduler = InitiativeScheduler()
+for fighter, value in ((a, 20), (b, 15)):
+    scheduler.add(fighter, value)
+dead = set()
+scheduler.next_turn()
+scheduler.add(c, 18)   # Après le tour en cours (20): joue dès ce round
+scheduler.add(d, 25)   # Avant le tour en cours: round suivant
+dead.add(id(b))
+order = [scheduler.next_turn(lambda f: id(f) not in dead) for _ in range(3)]
+assert [(t.combatant, t.round_num) for t in order] == [(c, 1), (d, 2), (a, 2)]
+assert b not in scheduler
+print("✅ Renforts insérés, morts retirés")
+
+# 6. Combat complet en ordre d'initiative, avec renforts
+scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+factory = scenario.monster_factory
+party = CombatSimulator(scenario.create_party(), factory).copy_party()
+reinforcement = factory.create_monster('goblin')
+rounds_seen = []
+result = run_combat_loop(EnhancedCombatSystem(verbose=False, rng=GameRNG(8)), party,
+                         [factory.create_monster('goblin')], initiative=True,
+                         reinforcements={2: [reinforcement]}, on_round=rounds_seen.append)
+assert rounds_seen == list(range(1, result.rounds + 1))
+if result.rounds >= 2:
+    assert reinforcement.hit_points <= 0 or reinforcement in result.alive_monsters
+print(f"✅ Combat par initiative: victoire={result.victory} en {result.rounds} rounds")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Ordonnanceur d'initiative opérationnel")
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test du catalogue binaire précompilé des monstres (mmap + index)
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scenarios.base_scenario import MonsterFactoryWrapper
+from src.utils.monster_catalog import (
+    LOCAL_MONSTERS_PATH, SOURCE_LIBRARY, SOURCE_LOCAL, MonsterCatalog, build_monster_catalog, open_default_catalog
+)
+from src.systems.parallel_simulator import _attach_shared_catalogs, prepare_shared_catalogs
+
+print("=" * 70)
+print("🧪 TEST - Catalogue de monstres précompilé")
+print("=" * 70)
+
+# 1. Le wrapper lit le catalogue sans charger le JSON local
+factory = MonsterFactoryWrapper()
+assert factory.catalog is not None
+goblin = factory.create_monster('goblin')
+assert goblin.name == 'Goblin' and factory.local_source._data is None
+print(f"\n✅ Catalogue: {len(factory.catalog)} monstres, JSON local non chargé")
+
+# 2. Monstres locaux prioritaires, monstres de dnd_5e_core inclus
+assert factory.catalog.source('goblin') == SOURCE_LOCAL
+assert factory.catalog.source('ancient-red-dragon') == SOURCE_LIBRARY
+dragon = factory.create_monster('ancient_red_dragon')
+assert dragon is not None and dragon.challenge_rating == 24
+print(f"✅ Monstre dnd_5e_core: {dragon.name} (CR {dragon.challenge_rating})")
+
+# 3. Identique à une construction depuis le JSON
+full = MonsterFactoryWrapper(use_catalog=False).create_monster('orc')
+cataloged = factory.create_monster('orc')
+for attr in ('name', 'armor_class', 'hit_points', 'hit_dice', 'xp', 'speed', 'challenge_rating'):
+    assert getattr(full, attr) == getattr(cataloged, attr), attr
+print("✅ Prototype identique à la construction JSON")
+
+# 4. Construction, recherche et signature
+path = os.path.join(tempfile.mkdtemp(), "test.catalog")
+local = {'b_monster': goblin, 'a_monster': full, 'c_monster': dragon}
+assert build_monster_catalog(path, local, include_library=False, signature=b'v1') == 3
+with MonsterCatalog(path) as catalog:
+    assert list(catalog.ids()) == ['a_monster', 'b_monster', 'c_monster']
+    assert catalog.get('c_monster').name == dragon.name
+    assert catalog.get('d_monster') is None and 'zzz' not in catalog
+assert MonsterCatalog.open(path, b'v2') is None, "Catalogue périmé refusé"
+assert MonsterCatalog.open(path + ".absent") is None
+print("✅ Index trié, recherche dichotomique, catalogue périmé détecté")
+
+# 4b. Workers: catalogue préparé par le parent, ouvert sans compilation
+catalog_paths = prepare_shared_catalogs()
+absent = os.path.join(tempfile.mkdtemp(), "absent.catalog")
+assert open_default_catalog(path=absent, build=False) is None and not os.path.exists(absent)
+_attach_shared_catalogs(catalog_paths)
+assert str(open_default_catalog().path) == catalog_paths['monsters']
+print("✅ Catalogue de monstres attaché dans les workers (sans compilation)")
+
+# 5. Une recherche vs l'analyse du JSON complet
+start = time.perf_counter()
+for _ in range(50):
+    with open(LOCAL_MONSTERS_PATH, encoding='utf-8') as f:
+        json.load(f)['orc']
+parse = time.perf_counter() - start
+start = time.perf_counter()
+for _ in range(50):
+    factory.catalog.get('orc')
+lookup = time.perf_counter() - start
+print(f"✅ 50 lectures: JSON complet {parse * 1000:.1f}ms, catalogue {lookup * 1000:.1f}ms")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Catalogue de monstres opérationnel")
+print("=" * 70)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test de l'index de requêtes sur le catalogue de monstres
+"""
+import sys
+import time
+from fractions import Fraction
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.monster_catalog import MonsterColumns, encode_creature_type, encode_size
+from src.utils.monster_index import MonsterIndex, default_monster_index
+
+print("=" * 70)
+print("🧪 TEST - Index de monstres")
+print("=" * 70)
+
+# 1. Index construit depuis le catalogue (colonnes seulement)
+start = time.perf_counter()
+index = default_monster_index()
+print(f"\n✅ Index: {len(index)} monstres ({(time.perf_counter() - start) * 1000:.0f}ms, catalogue compris)")
+
+goblin = index.row('goblin')
+assert goblin.challenge_rating == 0.25 and goblin.xp == 50
+assert index.size_name(goblin.size) == 'Small' and index.creature_type_name(goblin.creature_type) == 'humanoid'
+dragon = index.row('ancient-red-dragon')
+assert 'fire' in index.damage_type_names(dragon.damage_mask)
+print(f"✅ Colonnes: goblin FP {goblin.challenge_rating}, {index.size_name(goblin.size)}, "
+      f"{index.damage_type_names(goblin.damage_mask)}")
+
+# 2. Requêtes identiques à un filtrage linéaire
+rows = index.rows
+expected = sorted(r.monster_id for r in rows
+                  if 1 <= r.challenge_rating <= 3 and r.creature_type == encode_creature_type('undead'))
+assert sorted(index.query(cr_min=1, cr_max=3, creature_type='undead')) == expected and expected
+expected = sorted(r.monster_id for r in rows if 200 <= r.xp <= 450 and r.size == encode_size('Large'))
+assert sorted(index.query(xp_min=200, xp_max=450, size='L')) == expected and expected
+expected = sorted(r.monster_id for r in rows if r.armor_class >= 18 and r.hit_points <= 60)
+assert sorted(index.query(ac_min=18, hp_max=60)) == expected
+fire = index.query(damage_types=['fire'], cr_min=10)
+assert fire and all(index.row(m).challenge_rating >= 10 for m in fire)
+assert len(index.query(limit=3)) == 3
+print(f"✅ Requêtes exactes (ex: {len(expected)} monstres CA >= 18 et HP <= 60)")
+
+# 3. FP fractionnaires (Fraction de la table de rencontres, FP absent => le plus proche)
+eighths = index.with_cr(Fraction(1, 8))
+assert eighths and all(index.row(m).challenge_rating == 0.125 for m in eighths)
+assert index.closest_cr(float(Fraction(1, 3))) == 0.25
+print(f"✅ FP 1/8: {len(eighths)} monstres, FP 1/3 absent => 1/4")
+
+# 4. Candidats d'une rencontre en moins d'une milliseconde
+candidates = index.encounter_candidates(3)
+assert candidates and {index.row(m).challenge_rating for m in candidates} <= {0.25, 0.5, 1, 2, 3, 4}
+runs = 200
+start = time.perf_counter()
+for _ in range(runs):
+    index.query(cr_min=1, cr_max=2, creature_type='humanoid')
+per_query = (time.perf_counter() - start) / runs * 1000
+print(f"✅ Requête FP + type: {per_query:.3f}ms, {len(candidates)} candidats pour le niveau 3")
+assert per_query < 1
+
+# 5. Index construit à la main
+small = MonsterIndex([MonsterColumns('a', 1.0, 200, 12, 20, 2, 9, 0),
+                      MonsterColumns('b', 0.5, 100, 14, 11, 1, 13, 1 << 6)])
+assert small.query(cr_max=0.5) == ['b'] and small.query(xp_min=150) == ['a']
+assert small.query(damage_types=['necrotic']) == ['b']
+print("✅ Index manuel")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Index de monstres opérationnel")
+print("=" * 70)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test du cache de prototypes de monstres (copies légères)
+"""
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scenarios.base_scenario import MonsterFactoryWrapper
+from src.utils.monster_factory import LocalMonsterSource, MonsterFactory, MonsterResolutionCache, monster_cache
+
+print("=" * 70)
+print("🧪 TEST - Prototypes de monstres")
+print("=" * 70)
+
+factory = MonsterFactoryWrapper()
+
+# 1. Un prototype par monster_id, des instances indépendantes
+a = factory.create_monster('goblin')
+b = factory.create_monster('goblin', 'Gobelin chef')
+assert a is not b and (factory._namespace, 'goblin') in monster_cache
+assert b.name == 'Gobelin chef' and a.name != b.name
+assert a.actions is b.actions, "Les actions (immuables) sont partagées"
+a.hit_points -= 5
+assert b.hit_points == b.max_hit_points == a.max_hit_points
+assert MonsterFactoryWrapper().create_monster('goblin').hit_points == a.max_hit_points
+print(f"\n✅ Instances indépendantes: {a.hit_points}/{a.max_hit_points} vs {b.hit_points}/{b.max_hit_points}")
+
+# 2. Même résultat qu'une construction complète
+full = LocalMonsterSource.compile('orc', factory.local_monsters['orc'])
+clone = factory.create_monster('orc')
+for attr in ('name', 'armor_class', 'hit_points', 'hit_dice', 'xp', 'speed', 'challenge_rating'):
+    assert getattr(full, attr) == getattr(clone, attr), attr
+assert [x.name for x in full.actions] == [x.name for x in clone.actions]
+print("✅ Copie identique à une construction complète")
+
+# 3. Monstre inconnu
+assert factory.create_monster('inconnu_xyz') is None
+print("✅ Monstre inconnu: None")
+
+# 4. Cache LRU partagé, échecs compris
+cache = MonsterResolutionCache(maxsize=2)
+calls = []
+
+
+def loader(result):
+    calls.append(result)
+    return result
+
+
+for key in ('a', 'b', 'a', 'c', 'b'):
+    cache.resolve(key, lambda: loader(key.upper() if key != 'c' else None))
+assert calls == ['A', 'B', None, 'B'], calls
+assert 'c' in cache and 'a' not in cache and len(cache) == 2
+assert (cache.hits, cache.misses) == (1, 4)
+
+misses = monster_cache.misses
+for _ in range(100):
+    assert factory.create_monster('inconnu_xyz') is None
+assert monster_cache.misses == misses, "Les échecs sont mémorisés"
+rat = {'giant_rat': {
+    'index': 'giant-rat', 'name': 'Giant Rat', 'armor_class': 12, 'hit_points': 7, 'hit_dice': '2d6',
+    'xp': 25, 'speed': 30, 'challenge_rating': 0.125,
+    'abilities': {'str': 7, 'dex': 15, 'con': 11, 'int': 2, 'wis': 10, 'cha': 4},
+    'actions': [{'name': 'Bite', 'type': 'melee', 'attack_bonus': 4, 'damage': '1d4+2',
+                 'damage_type': 'piercing', 'range': 5}],
+}}
+hits = monster_cache.hits
+assert MonsterFactory(rat).create_monster('giant_rat').name == 'Giant Rat'
+assert MonsterFactory(dict(rat)).create_monster('giant_rat', 'Rat 2').name == 'Rat 2'
+assert monster_cache.hits == hits + 1, "Même données => mêmes entrées"
+print(f"✅ Cache LRU: {len(monster_cache)} entrées, {monster_cache.hits} succès, {monster_cache.misses} chargements")
+
+# 5. Création en masse: un seul accès au modèle par monstre distinct
+misses = monster_cache.misses
+group = factory.create_many([('skeleton', None, 3), ('cultist', 'Chef', 1), ('skeleton', None, 2), 'inconnu_abc'])
+assert [m.name for m in group] == ['Skeleton'] * 3 + ['Chef'] + ['Skeleton'] * 2
+assert len({id(m) for m in group}) == 6
+assert monster_cache.misses == misses + 3
+print(f"✅ create_many: {len(group)} monstres, 2 modèles résolus")
+
+# 6. Schémas JSON unifiés (damage_dice + damage_bonus, range "30/120 ft")
+orc = factory.create_monster('orc')
+greataxe, javelin = orc.actions
+assert greataxe.damages[0].dd.dice == '1d12' and greataxe.damages[0].dd.bonus == 3
+assert javelin.normal_range == 30 and javelin.type.name == 'RANGED'
+print("✅ Bonus de dommages et portées lus depuis le JSON local")
+
+# 7. Coût d'une création
+n = 2000
+start = time.perf_counter()
+for _ in range(n):
+    LocalMonsterSource.compile('goblin_boss', factory.local_monsters['goblin_boss'])
+build = time.perf_counter() - start
+start = time.perf_counter()
+for _ in range(n):
+    factory.create_monster('goblin_boss')
+cloned = time.perf_counter() - start
+print(f"✅ {n} créations: construction {build * 1000:.1f}ms, copie {cloned * 1000:.1f}ms "
+      f"(x{build / cloned:.0f})")
+assert cloned < build
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Prototypes de monstres opérationnels")
+print("=" * 70)
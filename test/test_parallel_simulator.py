@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test du simulateur parallèle (ProcessPoolExecutor)
+Vérifie la fusion des lots et la reproductibilité avec une graine
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.systems.parallel_simulator import ParallelCombatSimulator
+
+
+def main():
+    print("=" * 70)
+    print("🧪 TEST - Simulateur parallèle")
+    print("=" * 70)
+
+    scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+    party = scenario.create_party()
+    scene_data = {
+        'id': 'ambush', 'type': 'combat', 'title': 'Embuscade',
+        'monsters': ['goblin', 'goblin', 'goblin'],
+        'on_victory': 'victory', 'on_defeat': 'game_over'
+    }
+
+    simulator = ParallelCombatSimulator(max_workers=2, chunk_size=50, seed=42)
+
+    # 1. Tous les lots sont fusionnés
+    stats = simulator.simulate_scene_data(party, scene_data, trials=220)
+    assert stats.trials == 220, f"Attendu 220 combats, obtenu {stats.trials}"
+    print(f"\n✅ 220 combats répartis en lots et fusionnés:\n{stats.summary()}")
+
+    # 2. Même graine => mêmes résultats
+    again = ParallelCombatSimulator(max_workers=2, chunk_size=50, seed=42).simulate_scene_data(
+        party, scene_data, trials=220)
+    assert again.wins == stats.wins and again.rounds_histogram == stats.rounds_histogram
+    assert again.hp_remaining == stats.hp_remaining
+    print("✅ Résultats reproductibles avec la même graine")
+
+    # 3. Plusieurs scènes en une seule répartition
+    boss_data = dict(scene_data, id='boss', monsters=['goblin_boss'])
+    results = simulator.simulate_many([('ambush', party, scene_data), ('boss', party, boss_data)], trials=60)
+    assert set(results) == {'ambush', 'boss'}
+    assert all(s.trials == 60 for s in results.values())
+    print("✅ Plusieurs scènes simulées en parallèle")
+
+    print("\n" + "=" * 70)
+    print("🎉 SUCCÈS - Simulateur parallèle opérationnel")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
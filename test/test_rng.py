@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test du service de nombres aléatoires (GameRNG)
+Vérifie la reproductibilité, les sous-flux et les bornes des jets
+"""
+import contextlib
+import io
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.core.rng import GameRNG, get_rng, default_rng
+from src.rendering import ScriptedRenderer
+from src.scenes.scene_system import RestScene
+from src.systems.enhanced_combat import EnhancedCombatSystem
+
+print("=" * 70)
+print("🧪 TEST - GameRNG")
+print("=" * 70)
+
+# 1. Même graine => même séquence
+a, b = GameRNG(42), GameRNG(42)
+assert [a.d20() for _ in range(2000)] == [b.d20() for _ in range(2000)]
+assert [a.roll_dice(2, 6) for _ in range(100)] == [b.roll_dice(2, 6) for _ in range(100)]
+print("\n✅ Séquences identiques avec la même graine")
+
+# 2. Bornes des jets
+rng = GameRNG(1)
+rolls = [rng.roll_die(8) for _ in range(5000)]
+assert min(rolls) == 1 and max(rolls) == 8
+assert all(3 <= rng.roll_dice(3, 6) <= 18 for _ in range(1000))
+assert all(5 <= rng.randint(5, 9) <= 9 for _ in range(1000))
+print("✅ Jets dans les bornes")
+
+# 3. Sous-flux reproductibles et indépendants
+assert [GameRNG(7).spawn('worker-1').d20() for _ in range(20)] == \
+       [GameRNG(7).spawn('worker-1').d20() for _ in range(20)]
+w1, w2 = GameRNG(7).spawn('worker-1'), GameRNG(7).spawn('worker-2')
+assert [w1.d20() for _ in range(50)] != [w2.d20() for _ in range(50)]
+print("✅ Sous-flux reproductibles et indépendants")
+
+# 4. Injection via game_context et dans le système de combat
+session = GameRNG(3)
+assert get_rng({'rng': session}) is session
+assert get_rng({}) is default_rng
+assert EnhancedCombatSystem(verbose=False, rng=session).rng is session
+print("✅ Injection par game_context et EnhancedCombatSystem")
+
+# 5. Repos court: dés de vie tirés avec le générateur de la session
+with contextlib.redirect_stdout(io.StringIO()):
+    scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+
+
+def short_rest(seed: int):
+    party = scenario.create_party()
+    for char in party:
+        char.hit_points = 1
+    context = {'party': party, 'renderer': ScriptedRenderer(), 'rng': GameRNG(seed)}
+    with contextlib.redirect_stdout(io.StringIO()):
+        RestScene('repos', "Repos", rest_type="short").execute(context)
+    return [char.hit_points for char in party]
+
+
+healed = short_rest(9)
+assert healed == short_rest(9) and all(hp > 1 for hp in healed)
+print(f"✅ Repos court reproductible par session: {healed}")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - GameRNG opérationnel")
+print("=" * 70)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test du catalogue des règles (sorts, armes, armures, équipements)
+et de son partage avec les workers du simulateur parallèle
+"""
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.rules_catalog import (
+    ARMOR, SPELL, WEAPON, RulesCatalog, build_rules_catalog, open_rules_catalog, rules_signature
+)
+
+
+def _worker_lookup(path: str):
+    """Worker: le catalogue est ouvert sans être recompilé"""
+    catalog = open_rules_catalog(path, build=False)
+    return catalog is not None, getattr(catalog.spell('cure-wounds'), 'name', None)
+
+
+def main():
+    print("=" * 70)
+    print("🧪 TEST - Catalogue des règles partagé")
+    print("=" * 70)
+
+    from dnd_5e_core.data import list_spells, load_armor, load_spell
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "rules.catalog"
+        signature = rules_signature()
+
+        # 1. Compilation
+        start = time.perf_counter()
+        count = build_rules_catalog(path, signature)
+        print(f"\n✅ {count} objets compilés en {time.perf_counter() - start:.2f}s")
+
+        # 2. Lecture identique à dnd_5e_core.data
+        catalog = RulesCatalog.open(path, signature)
+        assert catalog is not None and len(catalog) == count
+        spell = catalog.spell('cure-wounds')
+        assert spell.name == load_spell('cure-wounds').name and spell.level == 1
+        assert catalog.spell('cure-wounds') is spell, "Objet mémorisé après la première lecture"
+        assert catalog.armor('chain-mail').armor_class == load_armor('chain-mail').armor_class
+        assert catalog.get(WEAPON, 'inexistant') is None
+        assert sorted(catalog.ids(SPELL)) == sorted(list_spells())
+        assert list(catalog.ids(ARMOR)) == sorted(catalog.ids(ARMOR))
+        print("✅ Lectures identiques à dnd_5e_core.data")
+
+        # 3. Catalogue périmé
+        assert RulesCatalog.open(path, b'autre') is None
+        assert open_rules_catalog(Path(tmp) / "absent.catalog", build=False) is None
+        print("✅ Catalogue absent ou périmé ignoré")
+
+        # 4. Workers: ouverture sans compilation
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(_worker_lookup, [str(path)] * 4))
+        assert all(results[i] == (True, 'Cure Wounds') for i in range(4)), results
+        print("✅ Catalogue ouvert par les workers sans recompilation")
+
+    # 5. Catalogue par défaut utilisé par le gestionnaire de sorts
+    from src.systems.spellcasting_v2 import SpellcastingManager
+    SpellcastingManager._spell_cache.clear()
+    assert SpellcastingManager.get_spell('cure-wounds') is open_rules_catalog().spell('cure-wounds')
+    print("✅ SpellcastingManager lit le catalogue partagé")
+
+    print("\n" + "=" * 70)
+    print("🎉 SUCCÈS - Catalogue des règles opérationnel")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
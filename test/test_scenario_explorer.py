@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test de l'explorateur de scénarios
+États mémoïsés, issues atteignables, impasses et probabilité de game over
+"""
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.core.rng import GameRNG
+from src.systems.scenario_explorer import ScenarioExplorer
+
+print("=" * 70)
+print("🧪 TEST - Explorateur de scénarios")
+print("=" * 70)
+
+scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+party = scenario.create_party()
+
+# 1. Embranchements qui se rejoignent: 2^20 chemins, ~40 états
+scenes = []
+for i in range(20):
+    scenes.append({'id': f'fork_{i}', 'type': 'choice', 'choices': [
+        {'text': 'Gauche', 'next_scene': f'left_{i}'},
+        {'text': 'Droite', 'next_scene': f'right_{i}'},
+    ]})
+    for side in ('left', 'right'):
+        scenes.append({'id': f'{side}_{i}', 'type': 'narrative', 'next_scene': f'fork_{i + 1}'})
+scenes.append({'id': 'fork_20', 'type': 'narrative'})
+start = time.perf_counter()
+report = ScenarioExplorer({'name': 'Fourches', 'scenes': scenes}, party).explore()
+elapsed = time.perf_counter() - start
+assert report.states == len(scenes), report.states
+assert report.endings == {'fork_20': 1.0}
+print(f"\n✅ {2 ** 20} chemins couverts par {report.states} états en {elapsed * 1000:.1f} ms")
+
+# 2. Impasses, fins multiples, boucle de compteurs saturée
+scenes = [
+    {'id': 'hub', 'type': 'choice', 'choices': [
+        {'text': 'Parler', 'next_scene': 'talk', 'effects': {'reputation': 1}},
+        {'text': 'Partir', 'next_scene': 'road'},
+        {'text': 'Gouffre', 'next_scene': 'abyss'},       # Lien cassé
+        {'text': 'Abandonner', 'next_scene': 'game_over'},
+    ]},
+    {'id': 'talk', 'type': 'narrative', 'next_scene': 'hub'},
+    {'id': 'road', 'type': 'narrative'},
+]
+report = ScenarioExplorer({'name': 'Hub', 'scenes': scenes}, party, counter_limit=2).explore()
+assert report.states == 3 + 2 + 3, report.states   # hub et road: réputation 0..2, talk: 1..2
+assert abs(report.endings['road'] - 1 / 3) < 1e-9
+assert abs(report.dead_ends['hub'] - 1 / 3) < 1e-9
+assert abs(report.game_over - 1 / 3) < 1e-9
+assert report.trapped < 1e-9 and report.truncated == 0
+print("✅ Fins, impasses et game over:")
+print(report.summary())
+
+# 3. Scénario réel: combats échantillonnés par tranche de HP
+report = ScenarioExplorer.from_file('data/scenes/chasse_gobelins.json', party, scenario.monster_factory,
+                                    samples=10, rng=GameRNG(3)).explore()
+total = sum(report.endings.values()) + sum(report.dead_ends.values()) + report.game_over + report.trapped
+assert abs(total - 1.0) < 1e-9, total
+assert report.reachable_endings == ['victory']
+assert set(report.combat_win_rates) == {'forest_ambush', 'boss_fight'}
+print(f"✅ {report.summary()}")
+
+# 4. Défaite: scène on_defeat (game_over par défaut)
+scenes = [
+    {'id': 'ogres', 'type': 'combat', 'monsters': ['ogre'] * 4,
+     'on_victory': 'treasure', 'on_defeat': 'prison'},
+    {'id': 'treasure', 'type': 'narrative'},
+    {'id': 'prison', 'type': 'narrative'},
+]
+report = ScenarioExplorer({'name': 'Capture', 'scenes': scenes}, party, scenario.monster_factory,
+                          samples=10, rng=GameRNG(3)).explore()
+assert report.endings.get('prison', 0.0) > 0 and report.game_over == 0, report.summary()
+del scenes[0]['on_defeat']
+report = ScenarioExplorer({'name': 'Sans issue', 'scenes': scenes}, party, scenario.monster_factory,
+                          samples=10, rng=GameRNG(3)).explore()
+assert 'prison' not in report.endings and report.game_over > 0, report.summary()
+print("✅ Défaites dirigées vers on_defeat")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Explorateur de scénarios opérationnel")
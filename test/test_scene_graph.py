@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test du compilateur de graphe de scènes
+Validation au chargement des scénarios JSON (liens cassés, accessibilité)
+"""
+import json
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scenes.scene_factory import SceneFactory
+from src.scenes.scene_graph import LINK_CHOICE, LINK_DEFEAT, UNRESOLVED, SceneGraph
+
+print("=" * 70)
+print("🧪 TEST - Graphe de scènes")
+print("=" * 70)
+
+scenes = [
+    {'id': 'start', 'type': 'narrative', 'next_scene': 'crossroads'},
+    {'id': 'crossroads', 'type': 'choice', 'choices': [
+        {'text': 'Nord', 'next_scene': 'fight'},
+        {'text': 'Sud', 'next_scene': 'swamp'},       # Lien cassé
+    ]},
+    {'id': 'fight', 'type': 'combat', 'monsters': ['goblin'], 'on_victory': 'end', 'on_defeat': 'game_over'},
+    {'id': 'end', 'type': 'narrative'},
+    {'id': 'secret', 'type': 'narrative', 'next_scene': 'end'},   # Inaccessible
+]
+
+# 1. Compilation: identifiants entiers, adjacence, accessibilité
+graph = SceneGraph.compile(scenes)
+start, crossroads, fight, end, secret = (graph.number(s) for s in ('start', 'crossroads', 'fight', 'end', 'secret'))
+assert graph.start == start == 0
+assert graph.adjacency[crossroads] == (fight,)
+assert [l.kind for l in graph.links[crossroads]] == [LINK_CHOICE, LINK_CHOICE]
+assert graph.links[crossroads][1].target == UNRESOLVED
+assert graph.links[fight][1].kind == LINK_DEFEAT and graph.links[fight][1].target_id == 'game_over'
+assert graph.can_reach(start, end) and not graph.can_reach(end, start) and graph.can_reach(secret, end)
+assert graph.endings == (end,)
+assert graph.unreachable == ('secret',)
+print(f"\n✅ {len(graph)} scènes compilées, {len(graph.reachable)} accessibles")
+
+# 2. Liens cassés indexés ('game_over' est une fin conventionnelle)
+assert [tuple(d) for d in graph.dangling] == [('crossroads', LINK_CHOICE, 'swamp')]
+assert not graph.is_valid and len(graph.errors()) == 1
+assert graph.warnings() == ["secret: inaccessible depuis le départ"]
+print(f"✅ Lien cassé détecté: {graph.errors()[0]}")
+
+# 3. Graphe immuable
+try:
+    graph.start = 3
+    raise AssertionError("Le graphe doit être immuable")
+except AttributeError:
+    pass
+try:
+    graph.index['x'] = 1
+    raise AssertionError("L'index doit être en lecture seule")
+except TypeError:
+    pass
+print("✅ Graphe immuable")
+
+# 4. Chargement: graphe attaché au manager, mode strict
+manager = SceneFactory.build_scene_manager_from_json({'name': 'Test', 'scenes': scenes})
+assert manager.graph is not None and manager.graph.ids == graph.ids
+try:
+    SceneFactory.build_scene_manager_from_json({'name': 'Test', 'scenes': scenes}, strict=True)
+    raise AssertionError("Mode strict: ValueError attendue")
+except ValueError as e:
+    assert 'swamp' in str(e)
+print("✅ Graphe attaché au SceneManager, mode strict")
+
+# 5. Tous les scénarios livrés sont valides
+for path in sorted(Path(__file__).parent.parent.glob('data/scenes/*.json')):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    compiled = SceneGraph.compile(data['scenes'])
+    assert compiled.is_valid, f"{path.name}: {compiled.errors()}"
+print("✅ Scénarios de data/scenes valides")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Graphe de scènes opérationnel")
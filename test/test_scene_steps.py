@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test de l'API pas à pas du SceneManager (start/step)
+Sessions entrelacées, sauvegardes répétées sans récursion
+"""
+import contextlib
+import io
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.core.rng import GameRNG
+from src.rendering import ScriptedRenderer
+from src.scenes import ChoiceScene, NarrativeScene, PromptType, SceneManager, SceneResult
+from src.scenes.scene_factory import SceneFactory
+from src.systems.enhanced_combat import EnhancedCombatSystem
+
+
+class SaveCounter:
+    """Scénario factice: compte les sauvegardes"""
+    def __init__(self):
+        self.slots = []
+
+    def save_game(self, slot_name):
+        self.slots.append(slot_name)
+        return True
+
+
+def hub_manager():
+    manager = SceneManager()
+    manager.add_scene(ChoiceScene('hub', 'Carrefour', '', [
+        {'text': 'Continuer', 'next_scene': 'end'},
+    ]))
+    manager.add_scene(NarrativeScene('end', 'Fin', 'Fin.'))
+    manager.set_start_scene('hub')
+    return manager
+
+
+print("=" * 70)
+print("🧪 TEST - SceneManager pas à pas")
+print("=" * 70)
+
+# 1. Questions successives, réponses validées
+saves = SaveCounter()
+manager = hub_manager()
+renderer = ScriptedRenderer(allow_save=True)
+try:
+    manager.step(0)
+    raise AssertionError("step() avant start(): RuntimeError attendue")
+except RuntimeError:
+    pass
+with contextlib.redirect_stdout(io.StringIO()):
+    prompt = manager.start({'renderer': renderer, 'scenario': saves, 'game_state': {}})
+    assert prompt.type == PromptType.CHOICE and prompt.scene_id == 'hub'
+    assert prompt.options == ('Continuer', '💾 Sauvegarder la partie')
+    try:
+        manager.step(5)
+        raise AssertionError("Choix hors limites: ValueError attendue")
+    except ValueError:
+        assert manager.prompt is prompt, "La question en cours reste posée"
+    assert manager.step(1).type == PromptType.TEXT
+    assert manager.step("").type == PromptType.CONTINUE
+    assert saves.slots == ['autosave']
+    assert manager.step().type == PromptType.CHOICE
+    assert manager.step(0).type == PromptType.CONFIRM and manager.prompt.scene_id == 'end'
+    assert manager.step('n').type == PromptType.CONTINUE
+    final = manager.step()
+assert manager.finished and final.type == PromptType.END and final.result == SceneResult.CONTINUE
+assert manager.history == ['hub', 'end']
+print("\n✅ start/step: choix, saisie, confirmation, fin de partie")
+
+# 2. Sauvegardes répétées: plus de récursion (pas à pas et partie bloquante)
+saves = SaveCounter()
+manager = hub_manager()
+with contextlib.redirect_stdout(io.StringIO()):
+    manager.start({'renderer': renderer, 'scenario': saves, 'game_state': {}})
+    for _ in range(3 * sys.getrecursionlimit()):
+        manager.step(1)
+        manager.step("slot")
+        manager.step()
+    manager.step(0)
+assert len(saves.slots) == 3 * sys.getrecursionlimit() and manager.prompt.scene_id == 'end'
+
+repeats = 2 * sys.getrecursionlimit()
+saves = SaveCounter()
+manager = hub_manager()
+scripted = ScriptedRenderer([1] * repeats + [0], allow_save=True)
+with contextlib.redirect_stdout(io.StringIO()):
+    manager.run({'renderer': scripted, 'scenario': saves, 'game_state': {}})
+assert len(saves.slots) == repeats and manager.history == ['hub', 'end']
+print(f"✅ {repeats} sauvegardes successives sans récursion")
+
+# 3. Sessions entrelacées dans un même processus
+scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+sessions = []
+with contextlib.redirect_stdout(io.StringIO()):
+    for seed in range(50):
+        manager = SceneFactory.load_scenario_from_json_file('data/scenes/chasse_gobelins.json',
+                                                            monster_factory=scenario.monster_factory)
+        game_context = {
+            'party': scenario.create_party(),
+            'game_state': {'total_xp': 0},
+            'renderer': ScriptedRenderer(),
+            'combat_system': EnhancedCombatSystem(verbose=False, rng=GameRNG(seed)),
+            'monster_factory': scenario.monster_factory,
+        }
+        sessions.append((manager, GameRNG(seed), manager.start(game_context)))
+
+    steps = 0
+    active = sessions
+    while active:
+        still_active = []
+        for manager, rng, prompt in active:
+            if prompt.type == PromptType.END:
+                continue
+            answer = rng.randint(0, len(prompt.options) - 1) if prompt.type == PromptType.CHOICE else None
+            still_active.append((manager, rng, manager.step(answer)))
+            steps += 1
+        active = still_active
+assert all(manager.finished for manager, _, _ in sessions)
+endings = {manager.history[-1] for manager, _, _ in sessions}
+print(f"✅ {len(sessions)} parties entrelacées, {steps} étapes, fins: {sorted(endings)}")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - API pas à pas opérationnelle")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test du renderer scripté (parties automatiques sans entrée clavier ni pause)
+"""
+import builtins
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.core.rng import GameRNG
+from src.rendering import ScriptedRenderer, ScriptExhausted
+from src.scenes.scene_factory import SceneFactory
+from src.systems.enhanced_combat import EnhancedCombatSystem
+
+
+def forbidden(*args, **kwargs):
+    raise AssertionError("Appel bloquant pendant une partie scriptée")
+
+
+print("=" * 70)
+print("🧪 TEST - Renderer scripté")
+print("=" * 70)
+
+# 1. Politiques de choix
+options = ["Nord", "Sud", "Est"]
+scripted = ScriptedRenderer([2, "Nord"])
+assert scripted.get_choice(options) == 2 and scripted.get_choice(options) == 0
+try:
+    scripted.get_choice(options)
+    raise AssertionError("Script épuisé: ScriptExhausted attendue")
+except ScriptExhausted:
+    pass
+assert ScriptedRenderer(lambda opts: len(opts) - 1).get_choice(options) == 2
+first = [ScriptedRenderer(rng=GameRNG(5)).get_choice(options) for _ in range(3)]
+assert len(set(first)) == 1, "Politique aléatoire reproductible avec une graine"
+limited = ScriptedRenderer(max_choices=1)
+limited.get_choice(options)
+try:
+    limited.get_choice(options)
+    raise AssertionError("Limite de choix: ScriptExhausted attendue")
+except ScriptExhausted:
+    pass
+answers = ScriptedRenderer(answers=["slot1"])
+assert answers.ask_text("?") == "slot1" and answers.ask_text("?", default="autosave") == "autosave"
+assert not answers.confirm("?") and not answers.allow_save
+print("\n✅ Politiques de choix: script, libellés, fonction, aléatoire, limite")
+
+# 2. Parties complètes sans input(), sleep() ni affichage
+scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+original_input, original_sleep = builtins.input, time.sleep
+builtins.input, time.sleep = forbidden, forbidden
+try:
+    for seed in range(5):
+        manager = SceneFactory.load_scenario_from_json_file('data/scenes/chasse_gobelins.json',
+                                                            monster_factory=scenario.monster_factory)
+        renderer = ScriptedRenderer(rng=GameRNG(seed), max_choices=200)
+        game_context = {
+            'party': scenario.create_party(),
+            'game_state': {'total_xp': 0, 'gold': 0},
+            'renderer': renderer,
+            'combat_system': EnhancedCombatSystem(verbose=False, rng=GameRNG(seed)),
+            'monster_factory': scenario.monster_factory,
+            'scenario': scenario,
+        }
+        start = time.perf_counter()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            manager.run(game_context)
+        elapsed = time.perf_counter() - start
+        assert output.getvalue() == "", f"Sortie hors renderer: {output.getvalue()[:200]!r}"
+        assert manager.history[0] == manager.graph.ids[manager.graph.start]
+        assert all(scene_id in manager.graph for scene_id in manager.history)
+        print(f"✅ Graine {seed}: {len(manager.history)} scènes, {len(renderer.choices_made)} choix "
+              f"en {elapsed:.2f}s")
+finally:
+    builtins.input, time.sleep = original_input, original_sleep
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Parties automatiques opérationnelles")
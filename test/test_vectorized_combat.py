@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test du backend de combat vectorisé (NumPy)
+Compare les résultats avec le simulateur scalaire d'EnhancedCombatSystem
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from chasse_gobelins_refactored import ChasseGobelinsScenario
+from src.systems.combat_simulator import CombatSimulator
+from src.systems.vectorized_combat import VectorizedCombat
+
+print("=" * 70)
+print("🧪 TEST - Combat vectorisé NumPy")
+print("=" * 70)
+
+scenario = ChasseGobelinsScenario(pdf_path="", use_ncurses=False)
+party = scenario.create_party()
+monster_ids = ['goblin', 'goblin', 'goblin']
+monsters = [scenario.monster_factory.create_monster(m) for m in monster_ids]
+
+# 1. Un round met à jour les tableaux de HP de tous les combats
+combat = VectorizedCombat(party, monsters, n_fights=1000)
+combat.resolve_round()
+assert combat.char_hp.shape == (1000, len(party))
+assert combat.monster_hp.shape == (1000, len(monsters))
+assert (combat.monster_hp < 7).any(), "Aucun monstre touché après un round"
+assert (combat.rounds == 1).all()
+print("\n✅ Un round résolu pour 1000 combats")
+
+# 2. Reproductibilité avec une graine
+a = VectorizedCombat.simulate(party, monsters, trials=5000, seed=7)
+b = VectorizedCombat.simulate(party, monsters, trials=5000, seed=7)
+assert a.wins == b.wins and a.rounds_histogram == b.rounds_histogram
+print("✅ Résultats reproductibles avec la même graine")
+
+# 3. Les monstres et le groupe d'origine ne sont pas modifiés
+assert all(m.hit_points == m.max_hit_points for m in monsters)
+assert all(c.hit_points == c.max_hit_points for c in party)
+print("✅ Objets d'origine intacts")
+
+# 4. Cohérence avec le simulateur scalaire
+scalar = CombatSimulator(party, scenario.monster_factory).simulate(
+    lambda ctx: [scenario.monster_factory.create_monster(m) for m in monster_ids], trials=2000)
+print(f"   Vectorisé: {a.win_rate:.1%} victoires, {a.mean_rounds:.2f} rounds")
+print(f"   Scalaire:  {scalar.win_rate:.1%} victoires, {scalar.mean_rounds:.2f} rounds")
+assert abs(a.win_rate - scalar.win_rate) < 0.05
+assert abs(a.mean_rounds - scalar.mean_rounds) < 0.5
+print("✅ Résultats cohérents avec EnhancedCombatSystem")
+
+print("\n" + "=" * 70)
+print("🎉 SUCCÈS - Backend vectorisé opérationnel")
+print("=" * 70)
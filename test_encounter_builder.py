@@ -5,7 +5,7 @@ Utilise encounter_builder.py pour générer des rencontres équilibrées
 from dnd_5e_core import load_monster
 from dnd_5e_core.data.loaders import simple_character_generator
 from dnd_5e_core.data import load_weapon, load_armor
-from dnd_5e_core.data.collections import load_all_monsters
+from dnd_5e_core.data.collections import get_monsters_list
 from dnd_5e_core.combat import CombatSystem
 from dnd_5e_core.mechanics.encounter_builder import (
     select_monsters_by_encounter_table,
@@ -15,6 +15,9 @@ from dnd_5e_core.mechanics.encounter_builder import (
 from dnd_5e_core.mechanics.gold_rewards import get_encounter_gold
 from random import randint, choice
 
+from src.scenarios.base_scenario import MonsterFactoryWrapper
+from src.utils.monster_index import default_monster_index
+
 print("="*80)
 print("🎲 TEST DU SYSTÈME DE RENCONTRE D&D 5E")
 print("="*80)
@@ -126,8 +129,14 @@ print(f"\n🐉 ÉTAPE 3: Chargement de la base de monstres")
 print("-"*80)
 
 try:
-    all_monsters = load_all_monsters()
-    print(f"✅ {len(all_monsters)} monstres chargés")
+    # Index du catalogue: seuls les monstres aux FP de la table de rencontres sont chargés
+    catalog = MonsterFactoryWrapper().catalog
+    official = set(get_monsters_list())
+    party_level = sum(c.level for c in party) // len(party)
+    candidates = [monster_id for monster_id in default_monster_index().encounter_candidates(party_level)
+                  if monster_id in official]
+    all_monsters = [catalog.get(monster_id) for monster_id in candidates]
+    print(f"✅ {len(all_monsters)} monstres candidats chargés (FP de la table, niveau {party_level})")
 except Exception as e:
     print(f"⚠️  Erreur de chargement: {e}")
     print("   Utilisation de monstres de base...")